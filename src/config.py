@@ -51,6 +51,7 @@ class ScraperConfig:
     timeout_seconds: int
     user_agents: list[str]
     categories: list[str]
+    burst_capacity: int = 3
     proxy_url: str = ""
 
 
@@ -230,6 +231,7 @@ def _build_scraper_config(data: dict[str, Any]) -> ScraperConfig:
         timeout_seconds=data["timeout_seconds"],
         user_agents=data["user_agents"],
         categories=data.get("categories", []),
+        burst_capacity=data.get("burst_capacity", 3),
     )
 
 
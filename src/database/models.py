@@ -22,7 +22,7 @@ from typing import Any, Optional
 # ═══════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class JobListing:
     """A job as seen on the listing page (XHR response).
 
@@ -92,7 +92,7 @@ class JobListing:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PublisherInfo:
     """Publisher information extracted from a job detail page.
 
@@ -171,7 +171,7 @@ class PublisherInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposalInfo:
     """A visible proposal on a job detail page.
 
@@ -222,7 +222,7 @@ class ProposalInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JobDetail:
     """Full detail data from a job's detail page.
 
@@ -314,7 +314,7 @@ class JobDetail:
 # ═══════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """AI-generated analysis of a job listing.
 
@@ -62,6 +62,61 @@ async def job_exists(db: Database, mostaql_id: str) -> bool:
     return row is not None
 
 
+# SQLite's default host-parameter limit is 999; stay well under it
+_IN_CHUNK_SIZE = 500
+
+
+async def jobs_existing(db: Database, mostaql_ids: list[str]) -> set[str]:
+    """Return which of the given Mostaql IDs already exist.
+
+    Issues one IN query per chunk of ``_IN_CHUNK_SIZE`` IDs instead
+    of a job_exists call per ID.
+
+    Args:
+        db: Active database instance.
+        mostaql_ids: Mostaql project identifiers to check.
+
+    Returns:
+        Set of the IDs present in the jobs table.
+    """
+    conn = await db.get_connection()
+    existing: set[str] = set()
+    for start in range(0, len(mostaql_ids), _IN_CHUNK_SIZE):
+        chunk = mostaql_ids[start:start + _IN_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = await conn.execute(
+            f"SELECT mostaql_id FROM jobs WHERE mostaql_id IN ({placeholders})",
+            chunk,
+        )
+        existing.update(row[0] for row in await cursor.fetchall())
+    logger.debug("jobs_existing: %d of %d", len(existing), len(mostaql_ids))
+    return existing
+
+
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO jobs (
+        mostaql_id, url, title, brief_description, category,
+        proposals_count, time_posted, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _job_params(job: JobListing) -> tuple[Any, ...]:
+    """Build the _INSERT_JOB_SQL parameters for a listing.
+
+    Args:
+        job: JobListing dataclass from the scraper.
+
+    Returns:
+        Parameter tuple in column order.
+    """
+    d = job.to_db_dict()
+    return (
+        d["mostaql_id"], d["url"], d["title"], d["brief_description"],
+        d["category"], d["proposals_count"], d["time_posted"], d["status"],
+    )
+
+
 async def insert_job(db: Database, job: JobListing) -> None:
     """Insert a new job from the listing page.
 
@@ -72,23 +127,33 @@ async def insert_job(db: Database, job: JobListing) -> None:
         job: JobListing dataclass from the scraper.
     """
     conn = await db.get_connection()
-    d = job.to_db_dict()
-    await conn.execute(
-        """
-        INSERT OR IGNORE INTO jobs (
-            mostaql_id, url, title, brief_description, category,
-            proposals_count, time_posted, status
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            d["mostaql_id"], d["url"], d["title"], d["brief_description"],
-            d["category"], d["proposals_count"], d["time_posted"], d["status"],
-        ),
-    )
+    await conn.execute(_INSERT_JOB_SQL, _job_params(job))
     await conn.commit()
     logger.debug("Inserted job: %s — %s", job.mostaql_id, job.title[:40])
 
 
+async def insert_jobs(db: Database, jobs: list[JobListing]) -> None:
+    """Insert several new jobs with one executemany and one commit.
+
+    Uses INSERT OR IGNORE to safely handle duplicates on mostaql_id.
+    On failure the whole batch is rolled back and the error re-raised.
+
+    Args:
+        db: Active database instance.
+        jobs: JobListing dataclasses from the scraper.
+    """
+    if not jobs:
+        return
+    conn = await db.get_connection()
+    try:
+        await conn.executemany(_INSERT_JOB_SQL, [_job_params(job) for job in jobs])
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+    logger.debug("Inserted %d jobs", len(jobs))
+
+
 async def update_job_status(db: Database, mostaql_id: str, status: str) -> None:
     """Update the status of a job.
 
@@ -154,6 +219,53 @@ async def has_detail(db: Database, mostaql_id: str) -> bool:
     return row is not None
 
 
+_INSERT_DETAIL_SQL = """
+    INSERT OR IGNORE INTO job_details (
+        mostaql_id, full_description, duration, experience_level,
+        attachments_count, publisher_id
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_JOB_BUDGET_SQL = """
+    UPDATE jobs SET
+        budget_min = ?, budget_max = ?, budget_raw = ?, skills = ?
+    WHERE mostaql_id = ?
+"""
+
+
+def _detail_params(detail: JobDetail) -> tuple[Any, ...]:
+    """Build the _INSERT_DETAIL_SQL parameters for a detail.
+
+    Args:
+        detail: JobDetail dataclass from the detail page scraper.
+
+    Returns:
+        Parameter tuple in column order.
+    """
+    d = detail.to_db_dict()
+    return (
+        d["mostaql_id"], d["full_description"], d["duration"],
+        d["experience_level"], d["attachments_count"], d["publisher_id"],
+    )
+
+
+def _budget_params(detail: JobDetail) -> tuple[Any, ...]:
+    """Build the _UPDATE_JOB_BUDGET_SQL parameters for a detail.
+
+    Args:
+        detail: JobDetail dataclass from the detail page scraper.
+
+    Returns:
+        Parameter tuple: budget and skills, then the job's ID.
+    """
+    budget = detail.get_budget_dict()
+    return (
+        budget["budget_min"], budget["budget_max"],
+        budget["budget_raw"], budget["skills"],
+        detail.mostaql_id,
+    )
+
+
 async def insert_job_detail(db: Database, detail: JobDetail) -> None:
     """Insert job detail data and update budget/skills on the jobs table.
 
@@ -166,34 +278,10 @@ async def insert_job_detail(db: Database, detail: JobDetail) -> None:
     conn = await db.get_connection()
 
     # Insert detail record
-    d = detail.to_db_dict()
-    await conn.execute(
-        """
-        INSERT OR IGNORE INTO job_details (
-            mostaql_id, full_description, duration, experience_level,
-            attachments_count, publisher_id
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (
-            d["mostaql_id"], d["full_description"], d["duration"],
-            d["experience_level"], d["attachments_count"], d["publisher_id"],
-        ),
-    )
+    await conn.execute(_INSERT_DETAIL_SQL, _detail_params(detail))
 
     # Update budget and skills on the jobs table
-    budget = detail.get_budget_dict()
-    await conn.execute(
-        """
-        UPDATE jobs SET
-            budget_min = ?, budget_max = ?, budget_raw = ?, skills = ?
-        WHERE mostaql_id = ?
-        """,
-        (
-            budget["budget_min"], budget["budget_max"],
-            budget["budget_raw"], budget["skills"],
-            detail.mostaql_id,
-        ),
-    )
+    await conn.execute(_UPDATE_JOB_BUDGET_SQL, _budget_params(detail))
 
     # Insert publisher if present
     if detail.publisher:
@@ -207,11 +295,87 @@ async def insert_job_detail(db: Database, detail: JobDetail) -> None:
     logger.debug("Inserted detail for job %s", detail.mostaql_id)
 
 
+async def insert_job_details(db: Database, details: list[JobDetail]) -> None:
+    """Insert several job details in one transaction.
+
+    Same writes as insert_job_detail for each detail, but batched: one
+    executemany per table and a single commit. On failure the whole
+    batch is rolled back and the error re-raised.
+
+    Args:
+        db: Active database instance.
+        details: JobDetail dataclasses from the detail page scraper.
+    """
+    if not details:
+        return
+    conn = await db.get_connection()
+    publishers = [_publisher_params(d.publisher) for d in details if d.publisher]
+    proposals = [
+        _proposal_params(p, d.mostaql_id) for d in details for p in d.proposals
+    ]
+    try:
+        await conn.executemany(_INSERT_DETAIL_SQL, [_detail_params(d) for d in details])
+        await conn.executemany(_UPDATE_JOB_BUDGET_SQL, [_budget_params(d) for d in details])
+        if publishers:
+            await conn.executemany(_UPSERT_PUBLISHER_SQL, publishers)
+        if proposals:
+            await conn.executemany(_INSERT_PROPOSAL_SQL, proposals)
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+    logger.debug(
+        "Inserted %d details (%d publishers, %d proposals)",
+        len(details), len(publishers), len(proposals),
+    )
+
+
 # ═══════════════════════════════════════════════════════════
 # Publisher Operations
 # ═══════════════════════════════════════════════════════════
 
 
+_UPSERT_PUBLISHER_SQL = """
+    INSERT INTO publishers (
+        publisher_id, display_name, role, profile_url,
+        identity_verified, registration_date, total_projects_posted,
+        open_projects, total_hired, hire_rate_raw, hire_rate, avg_rating
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(publisher_id) DO UPDATE SET
+        display_name = excluded.display_name,
+        role = excluded.role,
+        profile_url = excluded.profile_url,
+        identity_verified = excluded.identity_verified,
+        registration_date = excluded.registration_date,
+        total_projects_posted = excluded.total_projects_posted,
+        open_projects = excluded.open_projects,
+        total_hired = excluded.total_hired,
+        hire_rate_raw = excluded.hire_rate_raw,
+        hire_rate = excluded.hire_rate,
+        avg_rating = excluded.avg_rating,
+        last_scraped_at = CURRENT_TIMESTAMP
+"""
+
+
+def _publisher_params(pub: PublisherInfo) -> tuple[Any, ...]:
+    """Build the _UPSERT_PUBLISHER_SQL parameters for a publisher.
+
+    Args:
+        pub: PublisherInfo dataclass.
+
+    Returns:
+        Parameter tuple in column order.
+    """
+    d = pub.to_db_dict()
+    return (
+        d["publisher_id"], d["display_name"], d["role"],
+        d["profile_url"], d["identity_verified"],
+        d["registration_date"], d["total_projects_posted"],
+        d["open_projects"], d["total_hired"],
+        d["hire_rate_raw"], d["hire_rate"], d["avg_rating"],
+    )
+
+
 async def _upsert_publisher_inner(
     conn: Any, pub: PublisherInfo
 ) -> None:
@@ -221,36 +385,7 @@ async def _upsert_publisher_inner(
         conn: Active aiosqlite connection.
         pub: PublisherInfo dataclass.
     """
-    d = pub.to_db_dict()
-    await conn.execute(
-        """
-        INSERT INTO publishers (
-            publisher_id, display_name, role, profile_url,
-            identity_verified, registration_date, total_projects_posted,
-            open_projects, total_hired, hire_rate_raw, hire_rate, avg_rating
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(publisher_id) DO UPDATE SET
-            display_name = excluded.display_name,
-            role = excluded.role,
-            profile_url = excluded.profile_url,
-            identity_verified = excluded.identity_verified,
-            registration_date = excluded.registration_date,
-            total_projects_posted = excluded.total_projects_posted,
-            open_projects = excluded.open_projects,
-            total_hired = excluded.total_hired,
-            hire_rate_raw = excluded.hire_rate_raw,
-            hire_rate = excluded.hire_rate,
-            avg_rating = excluded.avg_rating,
-            last_scraped_at = CURRENT_TIMESTAMP
-        """,
-        (
-            d["publisher_id"], d["display_name"], d["role"],
-            d["profile_url"], d["identity_verified"],
-            d["registration_date"], d["total_projects_posted"],
-            d["open_projects"], d["total_hired"],
-            d["hire_rate_raw"], d["hire_rate"], d["avg_rating"],
-        ),
-    )
+    await conn.execute(_UPSERT_PUBLISHER_SQL, _publisher_params(pub))
     logger.debug("Upserted publisher: %s", pub.publisher_id)
 
 
@@ -297,6 +432,32 @@ async def get_publisher(db: Database, publisher_id: str) -> Optional[dict[str, A
 # ═══════════════════════════════════════════════════════════
 
 
+_INSERT_PROPOSAL_SQL = """
+    INSERT INTO proposals (
+        mostaql_id, proposer_name, proposer_verified,
+        proposer_rating, proposed_at
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _proposal_params(p: ProposalInfo, mostaql_id: str) -> tuple[Any, ...]:
+    """Build the _INSERT_PROPOSAL_SQL parameters for a proposal.
+
+    Args:
+        p: ProposalInfo dataclass.
+        mostaql_id: The job's Mostaql ID.
+
+    Returns:
+        Parameter tuple in column order.
+    """
+    d = p.to_db_dict(mostaql_id)
+    return (
+        d["mostaql_id"], d["proposer_name"],
+        d["proposer_verified"], d["proposer_rating"],
+        d["proposed_at"],
+    )
+
+
 async def _insert_proposals_inner(
     conn: Any, mostaql_id: str, proposals: list[ProposalInfo]
 ) -> None:
@@ -307,21 +468,10 @@ async def _insert_proposals_inner(
         mostaql_id: The job's Mostaql ID.
         proposals: List of ProposalInfo dataclasses.
     """
-    for p in proposals:
-        d = p.to_db_dict(mostaql_id)
-        await conn.execute(
-            """
-            INSERT INTO proposals (
-                mostaql_id, proposer_name, proposer_verified,
-                proposer_rating, proposed_at
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                d["mostaql_id"], d["proposer_name"],
-                d["proposer_verified"], d["proposer_rating"],
-                d["proposed_at"],
-            ),
-        )
+    await conn.executemany(
+        _INSERT_PROPOSAL_SQL,
+        [_proposal_params(p, mostaql_id) for p in proposals],
+    )
     logger.debug("Inserted %d proposals for job %s", len(proposals), mostaql_id)
 
 
@@ -481,10 +631,56 @@ async def get_jobs_needing_analysis(db: Database) -> list[dict[str, Any]]:
     return result
 
 
+# Column list shared by the notification queries. NULLs from the
+# LEFT JOINs (no detail/publisher yet) are coalesced here so callers get
+# fully-populated rows and can index them directly. Budgets stay NULL on
+# purpose — the formatters treat "unknown" differently from 0.
+_NOTIFICATION_COLUMNS = """
+    j.mostaql_id, j.title, j.url,
+    COALESCE(j.brief_description, '') AS brief_description,
+    COALESCE(j.category, '') AS category,
+    j.budget_min, j.budget_max,
+    COALESCE(j.budget_raw, '') AS budget_raw,
+    COALESCE(j.skills, '[]') AS skills,
+    COALESCE(j.time_posted, '') AS time_posted,
+    COALESCE(j.status, '') AS status,
+    CASE
+        WHEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id) > 0
+        THEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id)
+        ELSE COALESCE(j.proposals_count, 0)
+    END AS proposals_count,
+    COALESCE(jd.full_description, '') AS full_description,
+    COALESCE(jd.duration, '') AS duration,
+    COALESCE(a.overall_score, 0) AS overall_score,
+    COALESCE(a.job_summary, '') AS job_summary,
+    COALESCE(a.recommendation, 'skip') AS recommendation,
+    COALESCE(a.recommendation_reason, '') AS recommendation_reason,
+    COALESCE(a.red_flags, '[]') AS red_flags,
+    COALESCE(a.green_flags, '[]') AS green_flags,
+    COALESCE(a.recommended_proposal_angle, '') AS recommended_proposal_angle,
+    COALESCE(a.required_skills_analysis, '') AS required_skills_analysis,
+    COALESCE(a.estimated_real_budget, '') AS estimated_real_budget,
+    COALESCE(a.hiring_probability, 0) AS hiring_probability,
+    COALESCE(a.fit_score, 0) AS fit_score,
+    COALESCE(a.budget_fairness, 0) AS budget_fairness,
+    COALESCE(a.job_clarity, 0) AS job_clarity,
+    COALESCE(a.competition_level, 0) AS competition_level,
+    COALESCE(a.urgency_score, 0) AS urgency_score,
+    COALESCE(p.display_name, '') AS publisher_name,
+    COALESCE(p.identity_verified, 0) AS identity_verified,
+    COALESCE(p.hire_rate, 0) AS hire_rate,
+    COALESCE(p.hire_rate_raw, '') AS hire_rate_raw,
+    COALESCE(p.total_projects_posted, 0) AS total_projects,
+    COALESCE(p.open_projects, 0) AS open_projects,
+    COALESCE(p.registration_date, '') AS registration_date
+"""
+
+
 async def get_unsent_instant_alerts(db: Database) -> list[dict[str, Any]]:
     """Get analyzed jobs with recommendation='instant_alert' not yet notified.
 
     Joins jobs, analyses, and publishers for full notification data.
+    Every column except the budgets is coalesced to a default.
 
     Args:
         db: Active database instance.
@@ -494,26 +690,7 @@ async def get_unsent_instant_alerts(db: Database) -> list[dict[str, Any]]:
     """
     conn = await db.get_connection()
     cursor = await conn.execute(
-        """
-        SELECT
-            j.mostaql_id, j.title, j.url, j.category,
-            j.budget_min, j.budget_max, j.budget_raw,
-            j.skills, j.time_posted,
-            CASE
-                WHEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id) > 0
-                THEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id)
-                ELSE j.proposals_count
-            END AS proposals_count,
-            jd.duration,
-            a.overall_score, a.job_summary, a.recommendation,
-            a.recommendation_reason, a.red_flags, a.green_flags,
-            a.recommended_proposal_angle, a.required_skills_analysis,
-            a.hiring_probability, a.fit_score, a.budget_fairness,
-            a.job_clarity, a.competition_level, a.urgency_score,
-            p.display_name AS publisher_name,
-            p.identity_verified, p.hire_rate,
-            p.total_projects_posted AS total_projects,
-            p.open_projects, p.registration_date
+        "SELECT" + _NOTIFICATION_COLUMNS + """
         FROM analyses a
         INNER JOIN jobs j ON a.mostaql_id = j.mostaql_id
         LEFT JOIN job_details jd ON j.mostaql_id = jd.mostaql_id
@@ -533,6 +710,8 @@ async def get_unsent_instant_alerts(db: Database) -> list[dict[str, Any]]:
 async def get_unsent_digest_jobs(db: Database) -> list[dict[str, Any]]:
     """Get analyzed jobs with recommendation='digest' not yet notified.
 
+    Returns the same normalized columns as get_unsent_instant_alerts.
+
     Args:
         db: Active database instance.
 
@@ -541,24 +720,7 @@ async def get_unsent_digest_jobs(db: Database) -> list[dict[str, Any]]:
     """
     conn = await db.get_connection()
     cursor = await conn.execute(
-        """
-        SELECT
-            j.mostaql_id, j.title, j.url, j.category,
-            j.budget_min, j.budget_max, j.budget_raw,
-            j.skills, j.time_posted,
-            CASE
-                WHEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id) > 0
-                THEN (SELECT COUNT(*) FROM proposals pr WHERE pr.mostaql_id = j.mostaql_id)
-                ELSE j.proposals_count
-            END AS proposals_count,
-            jd.duration,
-            a.overall_score, a.job_summary, a.recommendation,
-            a.recommendation_reason, a.red_flags, a.green_flags,
-            a.recommended_proposal_angle, a.required_skills_analysis,
-            a.hiring_probability, a.fit_score, a.budget_fairness,
-            a.job_clarity, a.competition_level,
-            p.display_name AS publisher_name,
-            p.identity_verified, p.hire_rate
+        "SELECT" + _NOTIFICATION_COLUMNS + """
         FROM analyses a
         INNER JOIN jobs j ON a.mostaql_id = j.mostaql_id
         LEFT JOIN job_details jd ON j.mostaql_id = jd.mostaql_id
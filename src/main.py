@@ -435,12 +435,17 @@ class MostaqlNotifier:
             except Exception as e:
                 logger.warning("Failed to send shutdown message: %s", e)
 
+        if self._telegram:
+            await self._telegram.aclose()
+
         if self.db:
             try:
                 await self.db.close()
             except Exception:
                 pass
 
+        self.health.close()
+
         logger.info("Shutdown complete")
 
     # ── Public state accessors (for commands) ────────────
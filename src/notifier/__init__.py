@@ -13,7 +13,7 @@ from src.notifier.formatters import (
     format_daily_report,
     format_system_status,
 )
-from src.notifier.telegram_bot import TelegramNotifier
+from src.notifier.telegram_bot import RateLimitedError, TelegramNotifier
 from src.notifier.dispatcher import NotificationDispatcher
 
 __all__ = [
@@ -22,5 +22,6 @@ __all__ = [
     "format_daily_report",
     "format_system_status",
     "TelegramNotifier",
+    "RateLimitedError",
     "NotificationDispatcher",
 ]
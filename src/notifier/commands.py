@@ -124,8 +124,10 @@ class CommandHandler:
             return
 
         try:
-            stats = await queries.get_today_stats(self.app.db)
-            top_jobs = await queries.get_top_jobs_today(self.app.db, limit=5)
+            stats, top_jobs = await asyncio.gather(
+                queries.get_today_stats(self.app.db),
+                queries.get_top_jobs_today(self.app.db, limit=5),
+            )
 
             from src.notifier.formatters import format_daily_report
             text = format_daily_report(stats, top_jobs)
@@ -7,9 +7,12 @@ and dispatching them through the appropriate message formatter.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import random
 import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from src.config import AppConfig
 from src.database.db import Database
@@ -21,11 +24,21 @@ from src.notifier.formatters import (
     format_system_status,
     _e,
 )
-from src.notifier.telegram_bot import TelegramNotifier
+from src.notifier.telegram_bot import RateLimitedError, TelegramNotifier
 from src.utils.logger import get_logger
+from src.utils.resilience import CircuitOpenError
 
 logger = get_logger(__name__)
 
+# ── Instant-alert pipeline sizing ────────────────────────
+_ALERT_QUEUE_SIZE = 32  # formatted alerts buffered ahead of the senders
+_ALERT_WORKERS = 3      # concurrent Telegram sends
+_RATE_LIMIT_RETRIES = 2  # back-offs on 429 before deferring a send
+
+# ── Digest failure backoff ───────────────────────────────
+_DIGEST_BACKOFF_BASE = 30.0  # seconds after the first failed digest
+_DIGEST_BACKOFF_MAX = 300.0
+
 
 class NotificationDispatcher:
     """Dispatches formatted Telegram notifications based on DB state.
@@ -39,6 +52,16 @@ class NotificationDispatcher:
         telegram: Telegram bot client.
     """
 
+    __slots__ = (
+        "config",
+        "db",
+        "telegram",
+        "_start_time",
+        "_startup_ts_str",
+        "_digest_retry_after",
+        "_digest_fail_streak",
+    )
+
     def __init__(
         self,
         config: AppConfig,
@@ -56,12 +79,19 @@ class NotificationDispatcher:
         self.db = db
         self.telegram = telegram
         self._start_time = time.monotonic()
+        self._startup_ts_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+        # Skip digest rebuilds until this monotonic time after a failure
+        self._digest_retry_after = 0.0
+        self._digest_fail_streak = 0
 
     async def process_instant_alerts(self) -> int:
         """Send unsent instant alert notifications.
 
         Queries for analyses with recommendation='instant_alert' not
-        yet in the notifications table. Formats and sends each one.
+        yet in the notifications table. Formatting and sending are
+        pipelined: a producer formats rows into a bounded queue while
+        a few workers send them, so the first alert goes out while
+        later rows are still being built.
 
         Returns:
             Number of alerts successfully sent.
@@ -71,23 +101,80 @@ class NotificationDispatcher:
             logger.debug("No unsent instant alerts")
             return 0
 
-        sent = 0
+        queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue(
+            maxsize=_ALERT_QUEUE_SIZE,
+        )
+        results: list[tuple[str, str]] = []
+
+        workers = [
+            asyncio.create_task(self._send_alert_worker(queue, results))
+            for _ in range(_ALERT_WORKERS)
+        ]
+        try:
+            await self._produce_alerts(rows, queue)
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        sent = len(results)
+        logger.info("Instant alerts: %d/%d sent", sent, len(rows))
+        return sent
+
+    async def _produce_alerts(
+        self,
+        rows: list[dict[str, Any]],
+        queue: asyncio.Queue[tuple[str, str, str]],
+    ) -> None:
+        """Format alert rows and feed them to the send workers.
+
+        Args:
+            rows: Unsent instant-alert rows from the DB.
+            queue: Bounded queue of (mostaql_id, title, text) items.
+        """
         for row in rows:
             mostaql_id = row.get("mostaql_id", "?")
             title = row.get("title", "?")[:40]
             try:
-                job_data = _build_job_dict(row)
-                analysis_data = _build_analysis_dict(row)
-                scoring_data = _build_scoring_dict(row)
+                text = format_instant_alert(
+                    _build_job_dict(row),
+                    _build_analysis_dict(row),
+                    _build_scoring_dict(row),
+                )
+            except Exception as e:
+                logger.error(
+                    "Error formatting instant alert for %s: %s",
+                    mostaql_id, e,
+                )
+                continue
+            await queue.put((mostaql_id, title, text))
 
-                text = format_instant_alert(job_data, analysis_data, scoring_data)
-                msg_id = await self.telegram.send_instant_alert(text)
+    async def _send_alert_worker(
+        self,
+        queue: asyncio.Queue[tuple[str, str, str]],
+        results: list[tuple[str, str]],
+    ) -> None:
+        """Send formatted alerts from the queue until cancelled.
 
+        Each alert is marked as notified right after it is delivered so
+        a crash mid-batch never re-sends what already went out.
+
+        Args:
+            queue: Queue of (mostaql_id, title, text) items.
+            results: Collects (mostaql_id, msg_id) for delivered alerts.
+        """
+        while True:
+            mostaql_id, title, text = await queue.get()
+            try:
+                msg_id = await self._send_throttled(
+                    self.telegram.send_instant_alert, text,
+                )
                 if msg_id:
                     await queries.mark_notified(
                         self.db, mostaql_id, "instant", msg_id,
                     )
-                    sent += 1
+                    results.append((mostaql_id, msg_id))
                     logger.info(
                         "Sent instant alert for %s: %s (msg=%s)",
                         mostaql_id, title, msg_id,
@@ -96,24 +183,68 @@ class NotificationDispatcher:
                     logger.error(
                         "Failed to send instant alert for %s", mostaql_id,
                     )
+            except (RateLimitedError, CircuitOpenError) as e:
+                # Throttled or Telegram is down — the row stays unsent
+                # and is picked up again next cycle.
+                logger.error(
+                    "Instant alert for %s deferred: %s", mostaql_id, e,
+                )
             except Exception as e:
                 logger.error(
                     "Error processing instant alert for %s: %s",
                     mostaql_id, e,
                 )
+            finally:
+                queue.task_done()
 
-        logger.info("Instant alerts: %d/%d sent", sent, len(rows))
-        return sent
+    async def _send_throttled(
+        self, send: Callable[[str], Awaitable[Optional[str]]], text: str,
+    ) -> Optional[str]:
+        """Call a Telegram send, backing off when it is rate limited.
+
+        Sleeps for Telegram's retry_after plus a little jitter (so
+        concurrent workers don't retry in lockstep) and tries again.
+
+        Args:
+            send: Bound TelegramNotifier send method.
+            text: Formatted message text.
+
+        Returns:
+            Message ID string on success, None on failure.
+
+        Raises:
+            RateLimitedError: If still throttled after all retries.
+        """
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            try:
+                return await send(text)
+            except RateLimitedError as rl:
+                if attempt == _RATE_LIMIT_RETRIES:
+                    raise
+                wait = rl.retry_after + random.uniform(0, 1.0)
+                logger.warning(
+                    "Telegram rate limited, retrying in %.1fs (%d/%d)",
+                    wait, attempt + 1, _RATE_LIMIT_RETRIES,
+                )
+                await asyncio.sleep(wait)
+        return None
 
     async def process_digest(self) -> int:
         """Send unsent digest notifications as a batch.
 
         Collects up to 15 unsent digest jobs, formats as a single
-        digest message, and sends it.
+        digest message, and sends it. After a failed send the whole
+        step is skipped for an exponentially growing backoff window,
+        so an outage doesn't re-query and re-format the same rows on
+        every tick.
 
         Returns:
             Number of jobs included in the digest.
         """
+        if time.monotonic() < self._digest_retry_after:
+            logger.debug("Digest in backoff — skipping this tick")
+            return 0
+
         rows = await queries.get_unsent_digest_jobs(self.db)
         if not rows:
             logger.debug("No unsent digest jobs")
@@ -129,18 +260,35 @@ class NotificationDispatcher:
         jobs_for_digest = [_build_job_dict(r) | _build_scoring_dict(r) for r in sorted_rows]
 
         text = format_digest(jobs_for_digest)
-        msg_id = await self.telegram.send_digest(text)
+        try:
+            msg_id = await self._send_throttled(self.telegram.send_digest, text)
+        except (RateLimitedError, CircuitOpenError) as e:
+            logger.warning("Digest deferred: %s", e)
+            self._backoff_digest()
+            return 0
 
-        if msg_id:
-            for row in sorted_rows:
-                mid = row.get("mostaql_id", "")
-                if mid:
-                    await queries.mark_notified(self.db, mid, "digest", msg_id)
-            logger.info("Digest sent with %d jobs (msg=%s)", len(sorted_rows), msg_id)
-        else:
+        if not msg_id:
             logger.error("Failed to send digest")
+            self._backoff_digest()
+            return 0
 
-        return len(sorted_rows) if msg_id else 0
+        self._digest_fail_streak = 0
+        for row in sorted_rows:
+            mid = row.get("mostaql_id", "")
+            if mid:
+                await queries.mark_notified(self.db, mid, "digest", msg_id)
+        logger.info("Digest sent with %d jobs (msg=%s)", len(sorted_rows), msg_id)
+        return len(sorted_rows)
+
+    def _backoff_digest(self) -> None:
+        """Push the next digest attempt out after a failed send."""
+        delay = min(
+            _DIGEST_BACKOFF_MAX,
+            _DIGEST_BACKOFF_BASE * 2 ** self._digest_fail_streak,
+        )
+        self._digest_retry_after = time.monotonic() + delay
+        self._digest_fail_streak += 1
+        logger.info("Next digest attempt in %.0fs", delay)
 
     async def process_daily_report(self) -> bool:
         """Generate and send the daily report.
@@ -150,11 +298,21 @@ class NotificationDispatcher:
         Returns:
             True if report was sent successfully.
         """
-        stats = await queries.get_today_stats(self.db)
-        top_jobs = await queries.get_top_jobs_today(self.db, limit=5)
+        # Independent reads — submit together so they queue back-to-back
+        # on the aiosqlite worker instead of paying two round-trips.
+        stats, top_jobs = await asyncio.gather(
+            queries.get_today_stats(self.db),
+            queries.get_top_jobs_today(self.db, limit=5),
+        )
 
         text = format_daily_report(stats, top_jobs)
-        msg_id = await self.telegram.send_daily_report(text)
+        try:
+            msg_id = await self._send_throttled(
+                self.telegram.send_daily_report, text,
+            )
+        except (RateLimitedError, CircuitOpenError) as e:
+            logger.warning("Daily report deferred: %s", e)
+            return False
 
         if msg_id:
             logger.info("Daily report sent (msg=%s)", msg_id)
@@ -163,18 +321,43 @@ class NotificationDispatcher:
             logger.error("Failed to send daily report")
             return False
 
+    async def _send_system(self, title: str, body_lines: list[str]) -> None:
+        """Send a system notification (startup, shutdown, error).
+
+        Args:
+            title: Header line (HTML, already escaped).
+            body_lines: Body lines (HTML, already escaped).
+        """
+        text = "\n".join((title, "", *body_lines))
+        try:
+            await self._send_throttled(self._send_preformatted, text)
+        except (RateLimitedError, CircuitOpenError) as e:
+            logger.warning("System message dropped: %s", e)
+
+    async def _send_preformatted(self, text: str) -> Optional[str]:
+        """Send a system message with link previews disabled.
+
+        Args:
+            text: HTML message text.
+
+        Returns:
+            Message ID string on success, None on failure.
+        """
+        return await self.telegram.send_message(text, disable_preview=True)
+
     async def send_startup_message(self) -> None:
         """Send a startup notification with config summary."""
-        lines = [
+        cfg = self.config
+        await self._send_system(
             "🚀 <b>Mostaql Notifier — تم التشغيل</b>",
-            "",
-            f"⏱ الوقت: {_e(datetime.now().strftime('%Y-%m-%d %H:%M'))}",
-            f"🤖 AI: {_e(self.config.ai.primary_provider)} (fallback: {_e(self.config.ai.fallback_provider)})",
-            f"📊 فحص كل: {self.config.scraper.scan_interval_seconds} ثانية",
-            f"⚡ تنبيه فوري: ≥ {self.config.telegram.instant_alert_threshold}",
-            f"📋 ملخص: ≥ {self.config.telegram.digest_threshold}",
-        ]
-        await self.telegram.send_message("\n".join(lines), disable_preview=True)
+            [
+                f"⏱ الوقت: {_e(self._startup_ts_str)}",
+                f"🤖 AI: {_e(cfg.ai.primary_provider)} (fallback: {_e(cfg.ai.fallback_provider)})",
+                f"📊 فحص كل: {cfg.scraper.scan_interval_seconds} ثانية",
+                f"⚡ تنبيه فوري: ≥ {cfg.telegram.instant_alert_threshold}",
+                f"📋 ملخص: ≥ {cfg.telegram.digest_threshold}",
+            ],
+        )
 
     async def send_shutdown_message(self) -> None:
         """Send a shutdown notification."""
@@ -183,12 +366,13 @@ class NotificationDispatcher:
         mins = int((uptime_s % 3600) // 60)
         uptime_str = f"{hours}h {mins}m" if hours else f"{mins}m"
 
-        lines = [
+        await self._send_system(
             "🔴 <b>Mostaql Notifier — تم الإيقاف</b>",
-            "",
-            f"⏱ مدة التشغيل: {_e(uptime_str)}",
-        ]
-        await self.telegram.send_message("\n".join(lines), disable_preview=True)
+            [
+                f"🕐 بدأ: {_e(self._startup_ts_str)}",
+                f"⏱ مدة التشغيل: {_e(uptime_str)}",
+            ],
+        )
 
     async def send_error_alert(self, error_msg: str) -> None:
         """Send a critical error notification.
@@ -196,64 +380,86 @@ class NotificationDispatcher:
         Args:
             error_msg: Error description.
         """
-        lines = [
+        await self._send_system(
             "❌ <b>Mostaql Notifier — خطأ</b>",
-            "",
-            f"⚠️ {_e(error_msg)}",
-        ]
-        await self.telegram.send_message("\n".join(lines), disable_preview=True)
+            [f"⚠️ {_e(error_msg)}"],
+        )
 
 
 # ── Helper: build formatted dicts from DB rows ──────────
 
 
+# Defaults for job fields, merged under each row in one C-level dict
+# merge. Rows from the notification queries already carry every key
+# (NULLs are coalesced in SQL); the defaults only fill sparse rows.
+_JOB_DEFAULTS: dict[str, Any] = {
+    "mostaql_id": "",
+    "title": "",
+    "url": "",
+    "brief_description": "",
+    "full_description": "",
+    "category": "",
+    "budget_min": None,
+    "budget_max": None,
+    "budget_raw": "",
+    "duration": "",
+    "proposals_count": 0,
+    "time_posted": "",
+    "status": "",
+    "publisher_name": "",
+    "hire_rate": 0,
+    "hire_rate_raw": "",
+    "identity_verified": 0,
+    "total_projects": 0,
+    "open_projects": 0,
+    "registration_date": "",
+}
+
+
 def _build_job_dict(row: dict[str, Any]) -> dict[str, Any]:
-    """Extract job-related fields from a joined DB row.
+    """Extract job-related fields from a notification row.
+
+    identity_verified is kept as SQLite's 0/1 integer; consumers only
+    test its truthiness.
 
     Args:
         row: Joined row from DB (jobs + details + publisher).
 
     Returns:
-        Dict with job data fields for formatters.
+        Dict with job data fields for formatters (other row keys pass
+        through untouched).
     """
-    import json as _json
-
     skills_raw = row.get("skills", "[]")
     if isinstance(skills_raw, str):
         try:
-            skills = _json.loads(skills_raw)
+            skills = json.loads(skills_raw)
         except (ValueError, TypeError):
             skills = [s.strip() for s in skills_raw.split(",") if s.strip()]
     else:
         skills = skills_raw or []
 
-    return {
-        "mostaql_id": row.get("mostaql_id", ""),
-        "title": row.get("title", ""),
-        "url": row.get("url", ""),
-        "brief_description": row.get("brief_description", ""),
-        "full_description": row.get("full_description", ""),
-        "category": row.get("category", ""),
-        "budget_min": row.get("budget_min"),
-        "budget_max": row.get("budget_max"),
-        "budget_raw": row.get("budget_raw", ""),
-        "duration": row.get("duration", ""),
-        "skills": skills,
-        "proposals_count": row.get("proposals_count", 0),
-        "time_posted": row.get("time_posted", ""),
-        "status": row.get("status", ""),
-        "publisher_name": row.get("publisher_name", ""),
-        "hire_rate": row.get("hire_rate", 0),
-        "hire_rate_raw": row.get("hire_rate_raw", ""),
-        "identity_verified": bool(row.get("identity_verified", False)),
-        "total_projects": row.get("total_projects", 0),
-        "open_projects": row.get("open_projects", 0),
-        "registration_date": row.get("registration_date", ""),
-    }
+    return {**_JOB_DEFAULTS, **row, "skills": skills}
+
+
+def _load_flags(raw: Any) -> list[str]:
+    """Decode a JSON flag list column, tolerating bad data.
+
+    Args:
+        raw: JSON string (or already-decoded list) from the DB.
+
+    Returns:
+        List of flag strings, empty on decode failure.
+    """
+    if not isinstance(raw, str):
+        return raw or []
+    try:
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        return []
 
 
 def _build_analysis_dict(row: dict[str, Any]) -> dict[str, Any]:
-    """Extract analysis fields from a joined DB row.
+    """Extract analysis fields from a normalized notification row.
 
     Args:
         row: Joined row with analysis columns.
@@ -261,39 +467,24 @@ def _build_analysis_dict(row: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dict with analysis data fields.
     """
-    import json as _json
-
-    red_flags = row.get("red_flags", "[]")
-    green_flags = row.get("green_flags", "[]")
-    if isinstance(red_flags, str):
-        try:
-            red_flags = _json.loads(red_flags)
-        except (ValueError, TypeError):
-            red_flags = []
-    if isinstance(green_flags, str):
-        try:
-            green_flags = _json.loads(green_flags)
-        except (ValueError, TypeError):
-            green_flags = []
-
     return {
-        "hiring_probability": row.get("hiring_probability", 0),
-        "fit_score": row.get("fit_score", 0),
-        "budget_fairness": row.get("budget_fairness", 0),
-        "job_clarity": row.get("job_clarity", 0),
-        "competition_level": row.get("competition_level", 0),
-        "urgency_score": row.get("urgency_score", 0),
-        "job_summary": row.get("job_summary", ""),
-        "required_skills_analysis": row.get("required_skills_analysis", ""),
-        "red_flags": red_flags,
-        "green_flags": green_flags,
-        "recommended_proposal_angle": row.get("recommended_proposal_angle", ""),
-        "estimated_real_budget": row.get("estimated_real_budget", ""),
+        "hiring_probability": row["hiring_probability"],
+        "fit_score": row["fit_score"],
+        "budget_fairness": row["budget_fairness"],
+        "job_clarity": row["job_clarity"],
+        "competition_level": row["competition_level"],
+        "urgency_score": row["urgency_score"],
+        "job_summary": row["job_summary"],
+        "required_skills_analysis": row["required_skills_analysis"],
+        "red_flags": _load_flags(row["red_flags"]),
+        "green_flags": _load_flags(row["green_flags"]),
+        "recommended_proposal_angle": row["recommended_proposal_angle"],
+        "estimated_real_budget": row["estimated_real_budget"],
     }
 
 
 def _build_scoring_dict(row: dict[str, Any]) -> dict[str, Any]:
-    """Extract scoring fields from a DB row.
+    """Extract scoring fields from a normalized notification row.
 
     Args:
         row: Row with scoring/analysis columns.
@@ -301,11 +492,12 @@ def _build_scoring_dict(row: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dict with scoring data for formatters.
     """
+    score = row["overall_score"]
     return {
-        "overall_score": row.get("overall_score", 0),
-        "base_score": row.get("overall_score", 0),  # DB stores final score
-        "recommendation": row.get("recommendation", "skip"),
-        "recommendation_reason": row.get("recommendation_reason", ""),
+        "overall_score": score,
+        "base_score": score,  # DB stores final score
+        "recommendation": row["recommendation"],
+        "recommendation_reason": row["recommendation_reason"],
         "bonuses_applied": [],
         "penalties_applied": [],
     }
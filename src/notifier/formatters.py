@@ -13,6 +13,7 @@ Design principles:
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional
 
 from src.utils.logger import get_logger
@@ -22,6 +23,30 @@ logger = get_logger(__name__)
 # ── Separator line for between sections ──────────────────
 _SEP = "━━━━━━━━━━━━━━━━━━"
 
+# ── Message size limits ──────────────────────────────────
+# Telegram caps messages at 4096 UTF-16 code units; stay under the
+# bot's 4000-char split point so a single alert is never split
+_MAX_MSG_UNITS = 4000
+_TAIL_BUDGET = 3500  # the alert summary is shortened to end within this size
+_DIGEST_BUDGET = 3800  # digest rows stop being added past this size
+_TRUNCATION_MARK = "\n..."
+_ELLIPSIS = "…"
+
+# ── Instant alert headers by minimum score (highest first) ─
+_ALERT_HEADERS: tuple[tuple[int, str], ...] = (
+    (90, "🔥🔥🔥 فرصة استثنائية!"),
+    (80, "🔥🔥 فرصة مميزة — تقدم الآن!"),
+    (70, "🔥 فرصة جيدة"),
+)
+_ALERT_HEADER_DEFAULT = "📋 فرصة جديدة"
+
+# ── Daily report market-health labels ────────────────────
+_MARKET_HEALTH_LABELS = {
+    "active": "🟢 نشط",
+    "moderate": "🟡 معتدل",
+    "slow": "🔴 بطيء",
+}
+
 
 def _e(text: str) -> str:
     """Escape HTML special characters.
@@ -82,10 +107,134 @@ def _progress_bar(value: int, length: int = 10) -> str:
     return "▰" * filled + "▱" * (length - filled)
 
 
+def _tg_len(text: str) -> int:
+    """Length of text as Telegram counts it (UTF-16 code units).
+
+    Emoji outside the BMP take two units, so a code-point ``len`` can
+    under-count the real size of a message.
+
+    Args:
+        text: Message text.
+
+    Returns:
+        Number of UTF-16 code units.
+    """
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _fit_telegram_limit(msg: str) -> str:
+    """Truncate msg so it fits within Telegram's message limit.
+
+    Args:
+        msg: Fully formatted message.
+
+    Returns:
+        The message, cut and marked with "..." if it was too long.
+    """
+    if _tg_len(msg) <= _MAX_MSG_UNITS:
+        return msg
+
+    limit = _MAX_MSG_UNITS - len(_TRUNCATION_MARK)
+    cut = limit
+    # A code point is one or two units, so dropping half the excess
+    # (rounded up) never overshoots the limit
+    while (excess := _tg_len(msg[:cut]) - limit) > 0:
+        cut -= (excess + 1) // 2
+    logger.warning("Message truncated to fit Telegram limit")
+    return msg[:cut] + _TRUNCATION_MARK
+
+
+def _block_units(block: list[str]) -> int:
+    """Size a block of lines adds to a message, in UTF-16 units.
+
+    Each line is counted with its trailing newline.
+
+    Args:
+        block: Message lines.
+
+    Returns:
+        Number of UTF-16 code units.
+    """
+    return sum(map(_tg_len, block)) + len(block)
+
+
+def _append_if_fits(
+    lines: list[str], block: list[str], size: int, limit: int,
+) -> int:
+    """Append an optional block only if the message stays within limit.
+
+    Args:
+        lines: Message lines built so far (extended in place).
+        block: Lines of the optional block.
+        size: Current message size from _block_units.
+        limit: Maximum message size in UTF-16 units.
+
+    Returns:
+        The updated message size (unchanged if the block was skipped).
+    """
+    if not block:
+        return size
+    units = _block_units(block)
+    if size + units > limit:
+        return size
+    lines.extend(block)
+    return size + units
+
+
+def _shorten_escaped(text: str, units: int) -> str:
+    """Escape text, cutting it with an ellipsis to fit in units.
+
+    The raw text is cut before escaping, so an entity is never split.
+
+    Args:
+        text: Raw text.
+        units: Maximum size of the result in UTF-16 units.
+
+    Returns:
+        Escaped text, or an empty string if nothing useful fits.
+    """
+    escaped = _e(text)
+    if _tg_len(escaped) <= units:
+        return escaped
+    room = units - len(_ELLIPSIS)
+    # Longest prefix whose escaped form fits
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _tg_len(_e(text[:mid].rstrip())) <= room:
+            lo = mid
+        else:
+            hi = mid - 1
+    head = text[:lo].rstrip()
+    return _e(head) + _ELLIPSIS if head else ""
+
+
 def _format_budget(
+    min_b: Optional[float], max_b: Optional[float], raw: str = "",
+) -> str:
+    """Format a budget range nicely (escape before embedding in HTML).
+
+    When no positive numeric bound is known but the scraped raw text is
+    available (e.g. "قابل للتفاوض"), the raw text is returned as-is.
+
+    Args:
+        min_b: Minimum budget in USD.
+        max_b: Maximum budget in USD.
+        raw: Raw budget text from the detail page.
+
+    Returns:
+        Formatted budget string.
+    """
+    if raw and not (min_b and min_b > 0) and not (max_b and max_b > 0):
+        return raw
+    return _format_budget_range(min_b, max_b)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_budget_range(
     min_b: Optional[float], max_b: Optional[float]
 ) -> str:
-    """Format a budget range nicely (HTML-escaped).
+    """Format numeric budget bounds (memoized — budgets repeat a lot).
 
     Args:
         min_b: Minimum budget in USD.
@@ -128,14 +277,10 @@ def format_instant_alert(
     overall = scoring.get("overall_score", 0)
 
     # ── Header ───────────────────────────────────────────
-    if overall >= 90:
-        header = "🔥🔥🔥 فرصة استثنائية!"
-    elif overall >= 80:
-        header = "🔥🔥 فرصة مميزة — تقدم الآن!"
-    elif overall >= 70:
-        header = "🔥 فرصة جيدة"
-    else:
-        header = "📋 فرصة جديدة"
+    header = next(
+        (h for threshold, h in _ALERT_HEADERS if overall >= threshold),
+        _ALERT_HEADER_DEFAULT,
+    )
 
     lines = [f"<b>{_e(header)}</b>", ""]
 
@@ -146,7 +291,9 @@ def format_instant_alert(
         lines.append(f"📌 {_bold(title)}")
 
     # ── Job details (one per line) ───────────────────────
-    budget = _format_budget(job.get("budget_min"), job.get("budget_max"))
+    budget = _format_budget(
+        job.get("budget_min"), job.get("budget_max"), job.get("budget_raw", ""),
+    )
     proposals = job.get("proposals_count", 0) or 0
     duration = job.get("duration", "")
     # Clean duration (may have newlines/extra spaces from HTML scraping)
@@ -224,67 +371,68 @@ def format_instant_alert(
     green_flags = analysis.get("green_flags", [])
     red_flags = analysis.get("red_flags", [])
 
-    if summary or skills_analysis:
-        lines.append("")
-        lines.append(_SEP)
-        lines.append("")
-
-    if summary:
-        lines.append(f"📝 <b>الملخص:</b>")
-        lines.append(_e(summary))
-        lines.append("")
-
-    if skills_analysis:
-        lines.append(f"🎯 <b>المهارات:</b>")
-        lines.append(_e(skills_analysis))
-        lines.append("")
-
-    # ── Flags ────────────────────────────────────────────
-    if green_flags or red_flags:
-        lines.append(_SEP)
-        lines.append("")
-
-    if green_flags:
-        lines.append("✅ <b>إيجابيات:</b>")
-        for flag in green_flags[:4]:
-            lines.append(f"  • {_e(flag)}")
-        lines.append("")
-
-    if red_flags:
-        lines.append("⚠️ <b>تحذيرات:</b>")
-        for flag in red_flags[:4]:
-            lines.append(f"  • {_e(flag)}")
-        lines.append("")
-
-    # ── Proposal angle ───────────────────────────────────
-    if proposal_angle:
-        lines.append(_SEP)
-        lines.append("")
-        lines.append(f"💡 <b>استراتيجية العرض:</b>")
-        lines.append(_e(proposal_angle))
-        lines.append("")
-
-    # ── Score breakdown ──────────────────────────────────
+    # ── Score breakdown (always last, so its room is reserved) ─
     base = scoring.get("base_score", 0)
     bonuses = scoring.get("bonuses_applied", [])
     penalties = scoring.get("penalties_applied", [])
     total_bonus = sum(b[1] for b in bonuses) if bonuses else 0
     total_penalty = sum(p[1] for p in penalties) if penalties else 0
 
+    breakdown: list[str] = []
     if total_bonus or total_penalty:
-        lines.append(
+        breakdown.append(
             f"📊 القاعدة: {base:.0f}"
             f" + مكافآت: {total_bonus}"
             f" - خصومات: {total_penalty}"
         )
 
-    msg = "\n".join(lines)
+    # Optional blocks are measured before they are appended and skipped
+    # when they don't fit; only the summary is ever shortened.
+    limit = _MAX_MSG_UNITS - _block_units(breakdown)
+    size = _block_units(lines)
+
+    ai_head = ["", _SEP, ""]
+    if summary:
+        label = "📝 <b>الملخص:</b>"
+        # Room for the summary line itself (its newline is the "- 1")
+        fixed = _block_units([*ai_head, label, ""]) + 1
+        room = min(_TAIL_BUDGET, limit) - size - fixed
+        text = _shorten_escaped(summary, room) if room > 0 else ""
+        if text:
+            new_size = _append_if_fits(
+                lines, [*ai_head, label, text, ""], size, limit,
+            )
+            if new_size != size:
+                ai_head, size = [], new_size
+    if skills_analysis:
+        size = _append_if_fits(lines, [
+            *ai_head, "🎯 <b>المهارات:</b>", _e(skills_analysis), "",
+        ], size, limit)
+
+    # ── Flags ────────────────────────────────────────────
+    flag_section: list[str] = []
+    if green_flags or red_flags:
+        flag_section += (_SEP, "")
+    if green_flags:
+        flag_section.append("✅ <b>إيجابيات:</b>")
+        flag_section += (f"  • {_e(flag)}" for flag in green_flags[:4])
+        flag_section.append("")
+    if red_flags:
+        flag_section.append("⚠️ <b>تحذيرات:</b>")
+        flag_section += (f"  • {_e(flag)}" for flag in red_flags[:4])
+        flag_section.append("")
+    size = _append_if_fits(lines, flag_section, size, limit)
+
+    # ── Proposal angle ───────────────────────────────────
+    if proposal_angle:
+        size = _append_if_fits(lines, [
+            _SEP, "", "💡 <b>استراتيجية العرض:</b>", _e(proposal_angle), "",
+        ], size, limit)
 
-    if len(msg) > 4000:
-        msg = msg[:3950] + "\n..."
-        logger.warning("Instant alert truncated to fit Telegram limit")
+    lines += breakdown
 
-    return msg
+    # Only reached if the fixed header lines alone overflow
+    return _fit_telegram_limit("\n".join(lines))
 
 
 def format_digest(jobs: list[dict[str, Any]]) -> str:
@@ -307,35 +455,34 @@ def format_digest(jobs: list[dict[str, Any]]) -> str:
     sorted_jobs = sorted_jobs[:15]
     total = len(jobs)
 
-    lines = [
-        f"<b>📋 ملخص الفرص — {total} مشروع جديد</b>",
-        "",
-    ]
+    header = f"<b>📋 ملخص الفرص — {total} مشروع جديد</b>"
 
-    for i, job in enumerate(sorted_jobs, 1):
+    blocks: list[str] = []
+    size = _tg_len(header)
+    for job in sorted_jobs:
         score = job.get("overall_score", 0)
         title = job.get("title", "بدون عنوان")[:45]
         url = job.get("url", "")
         budget = _format_budget(
             job.get("budget_min"), job.get("budget_max"),
+            job.get("budget_raw", ""),
         )
         proposals = job.get("proposals_count", 0) or 0
         indicator = "🟢" if score >= 70 else "🟡"
+        title_html = _link(title, url) if url else _e(title)
 
-        if i > 1:
-            lines.append("")
-
-        if url:
-            lines.append(f"{indicator} {_link(title, url)}")
-        else:
-            lines.append(f"{indicator} {_e(title)}")
-        lines.append(f"   💰 {_e(budget)}  ·  📊 {proposals} عروض")
-        lines.append(f"   🎯 الدرجة: <b>{score}%</b>")
+        block = (
+            f"{indicator} {title_html}\n"
+            f"   💰 {_e(budget)}  ·  📊 {proposals} عروض\n"
+            f"   🎯 الدرجة: <b>{score}%</b>"
+        )
+        size += _tg_len(block) + 2
+        if size > _DIGEST_BUDGET:
+            blocks.append("...")
+            break
+        blocks.append(block)
 
-    msg = "\n".join(lines)
-    if len(msg) > 4000:
-        msg = msg[:3950] + "\n..."
-    return msg
+    return _fit_telegram_limit(header + "\n\n" + "\n\n".join(blocks))
 
 
 def format_daily_report(
@@ -363,7 +510,7 @@ def format_daily_report(
     avg_fit = stats.get("avg_fit_score", 0)
     avg_hiring = stats.get("avg_hiring_probability", 0)
 
-    lines = [
+    header_block = "\n".join((
         f"<b>📊 التقرير اليومي — {_e(str(date_str))}</b>",
         "",
         f"📌 المشاريع المكتشفة: <b>{total}</b>",
@@ -375,65 +522,56 @@ def format_daily_report(
         "",
         f"🎯 متوسط التوافق: <b>{avg_fit}%</b>",
         f"📈 متوسط التوظيف: <b>{avg_hiring}%</b>",
-    ]
+    ))
 
-    # Top jobs
+    # ── Top jobs ─────────────────────────────────────────
+    top_jobs_block = ""
     if top_jobs:
-        lines.extend(["", _SEP, ""])
-        lines.append("<b>🏆 أفضل الفرص:</b>")
+        rows = []
         for i, job in enumerate(top_jobs[:5], 1):
             title = job.get("title", "?")[:35]
             url = job.get("url", "")
-            score = job.get("overall_score", 0)
-            if url:
-                lines.append(f"  {i}. {_link(title, url)} — <b>{score}%</b>")
-            else:
-                lines.append(f"  {i}. {_e(title)} — <b>{score}%</b>")
+            title_html = _link(title, url) if url else _e(title)
+            rows.append(f"  {i}. {title_html} — <b>{job.get('overall_score', 0)}%</b>")
+        top_jobs_block = "\n".join(("", _SEP, "", "<b>🏆 أفضل الفرص:</b>", *rows))
 
-    # Trends
+    # ── Trends ───────────────────────────────────────────
+    trends_block = ""
     if trends:
         trending = trends.get("trending_skills", [])
         health = trends.get("market_health", "")
         observations = trends.get("market_observations", [])
 
-        lines.extend(["", _SEP, ""])
-
+        parts = ["", _SEP, ""]
         if trending:
-            lines.append(f"<b>📈 المهارات الرائجة:</b>")
-            lines.append(_e(" · ".join(trending[:5])))
-            lines.append("")
-
-        if health:
-            health_map = {
-                "active": "🟢 نشط",
-                "moderate": "🟡 معتدل",
-                "slow": "🔴 بطيء",
-            }
-            lines.append(
-                f"📈 حالة السوق: <b>{_e(health_map.get(health, health))}</b>"
+            parts += (
+                "<b>📈 المهارات الرائجة:</b>",
+                _e(" · ".join(trending[:5])),
+                "",
             )
-            lines.append("")
-
+        if health:
+            label = _MARKET_HEALTH_LABELS.get(health, health)
+            parts += (f"📈 حالة السوق: <b>{_e(label)}</b>", "")
         if observations:
-            lines.append("<b>📝 ملاحظات:</b>")
-            for obs in observations[:3]:
-                lines.append(f"  • {_e(obs)}")
+            parts.append("<b>📝 ملاحظات:</b>")
+            parts += (f"  • {_e(obs)}" for obs in observations[:3])
+        trends_block = "\n".join(parts)
 
-    # System health
+    # ── System health ────────────────────────────────────
     errors = stats.get("errors", 0)
-    requests_made = stats.get("requests_made", 0)
-    tokens = stats.get("tokens_used", 0)
-
-    lines.extend(["", _SEP, ""])
-    lines.append("<b>🔧 صحة النظام:</b>")
-    lines.append(f"  🔄 طلبات HTTP: {requests_made}")
-    lines.append(f"  🤖 رموز AI: {tokens}")
-    if errors > 0:
-        lines.append(f"  ❌ أخطاء: {errors}")
-    else:
-        lines.append("  ✅ بدون أخطاء")
-
-    return "\n".join(lines)
+    sys_block = "\n".join((
+        "",
+        _SEP,
+        "",
+        "<b>🔧 صحة النظام:</b>",
+        f"  🔄 طلبات HTTP: {stats.get('requests_made', 0)}",
+        f"  🤖 رموز AI: {stats.get('tokens_used', 0)}",
+        f"  ❌ أخطاء: {errors}" if errors > 0 else "  ✅ بدون أخطاء",
+    ))
+
+    return "\n".join(filter(None, (
+        header_block, top_jobs_block, trends_block, sys_block,
+    )))
 
 
 def format_system_status(status: dict[str, Any]) -> str:
@@ -8,7 +8,11 @@ and HTML fallback to plain text.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import random
 import re
+import time
+from collections import defaultdict
 from typing import Optional
 
 from telegram import Bot
@@ -19,9 +23,11 @@ from telegram.error import (
     TimedOut,
     NetworkError,
 )
+from telegram.request import HTTPXRequest
 
 from src.config import TelegramConfig
 from src.utils.logger import get_logger
+from src.utils.rate_limiter import AsyncTokenBucket
 from src.utils.resilience import CircuitBreaker, CircuitOpenError
 
 logger = get_logger(__name__)
@@ -29,6 +35,62 @@ logger = get_logger(__name__)
 _MAX_MESSAGE_LEN = 4096
 _SAFE_LEN = 4000  # leave headroom
 
+# Shared HTTP transport; HTTP/2 multiplexing needs the optional h2 package
+_POOL_SIZE = 32
+_HTTP_VERSION = "2" if importlib.util.find_spec("h2") else "1.1"
+
+# Telegram Bot API limits: 30 msg/s per bot, 1 msg/s per chat
+_GLOBAL_MSGS_PER_SEC = 28  # headroom below the hard 30
+_CHAT_MIN_INTERVAL = 1.0   # seconds between sends to one chat
+_MAX_BACKOFF = 30.0        # cap on the jittered network-error backoff
+_SEND_ATTEMPTS = 3         # tries per message on timeouts / network errors
+
+# ── Plain-text fallback patterns ─────────────────────────
+# One alternation for every HTML construct: links, other tags, and entities.
+_RE_HTML_TOKEN = re.compile(r'<a href="([^"]+)">([^<]+)</a>|<[^>]+>|&(amp|lt|gt);')
+_RE_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_RE_HTML_ENTITY = re.compile(r"&(amp|lt|gt);")
+_HTML_ENTITIES = {"amp": "&", "lt": "<", "gt": ">"}
+_MD_MARKER_TABLE = str.maketrans("", "", "*_~\\")
+
+# Lowercased BadRequest substrings that mean "bad markup, resend as text"
+_PARSE_ERR_MARKERS = ("parse",)
+
+
+def _unescape_entities(text: str) -> str:
+    """Unescape the &amp;/&lt;/&gt; entities produced by the formatters."""
+    if "&" not in text:
+        return text
+    return _RE_HTML_ENTITY.sub(lambda m: _HTML_ENTITIES[m.group(1)], text)
+
+
+def _replace_html_token(match: re.Match) -> str:
+    """Replacement callback for ``_RE_HTML_TOKEN`` matches.
+
+    Args:
+        match: A link, tag, or entity match.
+
+    Returns:
+        ``text (url)`` for links, the literal character for entities,
+        and an empty string for any other tag.
+    """
+    url, label, entity = match.groups()
+    if entity is not None:
+        return _HTML_ENTITIES[entity]
+    if url is not None:
+        return f"{_unescape_entities(label)} ({_unescape_entities(url)})"
+    return ""
+
+
+class RateLimitedError(Exception):
+    """Raised when Telegram throttles a send with 429 / RetryAfter."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            f"Telegram rate limited — retry in {retry_after:.0f}s"
+        )
+
 
 class TelegramNotifier:
     """Async Telegram bot for sending notifications.
@@ -47,26 +109,43 @@ class TelegramNotifier:
             config: TelegramConfig from the app configuration.
         """
         self.config = config
-        self._bot = Bot(token=config.bot_token)
+        # One pooled (HTTP/2 when available) client for every send
+        request = HTTPXRequest(
+            connection_pool_size=_POOL_SIZE,
+            read_timeout=20,
+            write_timeout=20,
+            pool_timeout=5,
+            http_version=_HTTP_VERSION,
+        )
+        self._bot = Bot(token=config.bot_token, request=request)
 
-        # Circuit breaker for Telegram API
+        # Proactive shaping so the common path never sees a 429
+        self._global_bucket = AsyncTokenBucket(rate=_GLOBAL_MSGS_PER_SEC)
+        self._chat_last: dict[str, float] = {}
+        self._chat_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Circuit breaker for Telegram API, one failure per message that
+        # exhausts its retries. Bad requests and 429s are our problem or a
+        # signaled throttle, not an outage.
         self.circuit_breaker = CircuitBreaker(
             name="telegram",
             failure_threshold=5,
             cooldown_seconds=300,  # 5 minutes
+            excluded_exceptions=(BadRequest, RetryAfter, RateLimitedError),
         )
 
     async def initialize(self) -> bool:
-        """Test the bot connection.
+        """Open the HTTP pool and test the bot connection.
 
-        Calls getMe to verify the token is valid.
+        Bot.initialize() sets up the request objects and calls getMe to
+        verify the token is valid.
 
         Returns:
             True if connected successfully, False otherwise.
         """
         try:
-            me = await self._bot.get_me()
-            logger.info("Telegram bot connected: @%s", me.username)
+            await self._bot.initialize()
+            logger.info("Telegram bot connected: @%s", self._bot.username)
             return True
         except Exception as e:
             logger.error("Telegram bot connection failed: %s", e)
@@ -77,64 +156,130 @@ class TelegramNotifier:
         text: str,
         parse_mode: str = ParseMode.HTML,
         disable_preview: bool = False,
+        chat_id: Optional[str] = None,
     ) -> Optional[str]:
-        """Send a message to the configured chat_id.
+        """Send a message to a chat (the configured chat_id by default).
 
         Handles:
           - Long messages (>4096): splits at line boundaries
           - Parse errors: retries as plain text
-          - Rate limiting (429): waits retry_after seconds
+          - Rate limiting: sends are paced to Telegram's limits; a 429
+            that still slips through is raised as RateLimitedError
           - Network errors: retries up to 3 times
+          - Outages: once the circuit breaker opens, fails fast
 
         Args:
             text: Message content.
             parse_mode: Telegram parse mode.
             disable_preview: Whether to disable link previews.
+            chat_id: Destination chat; defaults to config.chat_id.
 
         Returns:
             Message ID string on success, None on failure.
+
+        Raises:
+            RateLimitedError: If Telegram responded with RetryAfter.
+            CircuitOpenError: If the Telegram circuit breaker is open.
         """
         if not text:
             return None
 
-        chunks = self._split_message(text, _SAFE_LEN)
+        chat_id = chat_id or self.config.chat_id
+
+        # Most messages fit in one part — skip the splitter entirely
+        if len(text) <= _SAFE_LEN:
+            chunks: tuple[str, ...] | list[str] = (text,)
+        else:
+            chunks = self._split_message(text, _SAFE_LEN)
         last_msg_id: Optional[str] = None
 
-        for i, chunk in enumerate(chunks):
+        # Parts are paced by the per-chat limit in _throttle()
+        for chunk in chunks:
             msg_id = await self._send_single(
-                chunk, parse_mode, disable_preview,
+                chat_id, chunk, parse_mode, disable_preview,
             )
             if msg_id is not None:
                 last_msg_id = msg_id
 
-            # Delay between multi-part messages
-            if i < len(chunks) - 1:
-                await asyncio.sleep(0.5)
-
         return last_msg_id
 
     async def _send_single(
         self,
+        chat_id: str,
         text: str,
         parse_mode: str,
         disable_preview: bool,
     ) -> Optional[str]:
         """Send a single message chunk with retry logic.
 
+        The whole retry loop runs as one circuit breaker call, so a
+        message that exhausts its retries counts as a single failure.
+
         Args:
+            chat_id: Destination chat.
             text: Message text.
             parse_mode: Telegram parse mode.
             disable_preview: Whether to disable link previews.
 
         Returns:
             Message ID string on success, None on failure.
+
+        Raises:
+            RateLimitedError: If Telegram responded with RetryAfter.
+            CircuitOpenError: If the Telegram circuit breaker is open.
         """
-        max_retries = 3
+        try:
+            return await self.circuit_breaker.call(
+                self._send_with_retries,
+                chat_id, text, parse_mode, disable_preview,
+            )
+
+        except (CircuitOpenError, RateLimitedError):
+            raise
+
+        except BadRequest as e:
+            logger.error("Telegram BadRequest: %s", e)
+            return None
+
+        except (TimedOut, NetworkError):
+            # Already logged where it failed: the retry loop or the
+            # plain text fallback
+            return None
+
+        except Exception as e:
+            logger.error("Telegram unexpected error: %s", e)
+            return None
+
+    async def _send_with_retries(
+        self,
+        chat_id: str,
+        text: str,
+        parse_mode: str,
+        disable_preview: bool,
+    ) -> str:
+        """Send a chunk, retrying timeouts and network errors.
+
+        Args:
+            chat_id: Destination chat.
+            text: Message text.
+            parse_mode: Telegram parse mode.
+            disable_preview: Whether to disable link previews.
+
+        Returns:
+            Message ID string.
 
-        for attempt in range(max_retries):
+        Raises:
+            RateLimitedError: If Telegram responded with RetryAfter.
+            BadRequest: If Telegram rejected the message (or its plain
+                text fallback).
+            NetworkError: If the last attempt timed out or failed.
+        """
+        last_error: Optional[NetworkError] = None
+        for attempt in range(_SEND_ATTEMPTS):
             try:
+                await self._throttle(chat_id)
                 msg = await self._bot.send_message(
-                    chat_id=self.config.chat_id,
+                    chat_id=chat_id,
                     text=text,
                     parse_mode=parse_mode,
                     disable_web_page_preview=disable_preview,
@@ -143,54 +288,94 @@ class TelegramNotifier:
 
             except BadRequest as e:
                 error_msg = str(e)
-                if "can't parse" in error_msg.lower() or "parse" in error_msg.lower():
-                    # Parse error — fallback to plain text
-                    logger.warning(
-                        "Parse error, retrying as plain text: %s",
-                        error_msg[:200],
-                    )
-                    plain = self._strip_formatting(text)
-                    try:
-                        msg = await self._bot.send_message(
-                            chat_id=self.config.chat_id,
-                            text=plain,
-                            disable_web_page_preview=disable_preview,
-                        )
-                        return str(msg.message_id)
-                    except Exception as e2:
-                        logger.error("Plain text fallback also failed: %s", e2)
-                        return None
-                else:
-                    logger.error("Telegram BadRequest: %s", error_msg)
-                    return None
-
-            except RetryAfter as e:
-                wait = e.retry_after
+                err_low = error_msg.lower()
+                if not any(m in err_low for m in _PARSE_ERR_MARKERS):
+                    raise
+                # Parse error — fallback to plain text
                 logger.warning(
-                    "Telegram rate limited. Waiting %d seconds...", wait,
+                    "Parse error, retrying as plain text: %s",
+                    error_msg[:200],
                 )
-                await asyncio.sleep(wait)
-                # Continue to next attempt
+                return await self._send_plain(chat_id, text, disable_preview)
 
-            except TimedOut:
+            except RetryAfter as e:
+                # Let the caller decide whether to wait or re-queue
                 logger.warning(
-                    "Telegram timeout (attempt %d/%d)", attempt + 1, max_retries,
+                    "Telegram rate limited (retry after %ss)", e.retry_after,
                 )
-                await asyncio.sleep(2 ** attempt)
+                raise RateLimitedError(e.retry_after) from e
 
-            except NetworkError as e:
+            except (TimedOut, NetworkError) as e:
                 logger.warning(
-                    "Telegram network error (attempt %d/%d): %s",
-                    attempt + 1, max_retries, e,
+                    "Telegram %s (attempt %d/%d): %s",
+                    "timeout" if isinstance(e, TimedOut) else "network error",
+                    attempt + 1, _SEND_ATTEMPTS, e,
                 )
-                await asyncio.sleep(2 ** attempt)
+                last_error = e
+                if attempt < _SEND_ATTEMPTS - 1:
+                    # Full jitter so concurrent senders don't retry in sync
+                    await asyncio.sleep(
+                        min(_MAX_BACKOFF, random.uniform(0, 2 ** attempt)),
+                    )
 
-            except Exception as e:
-                logger.error("Telegram unexpected error: %s", e)
-                return None
+        logger.error(
+            "Failed to send message after %d attempts: %s",
+            _SEND_ATTEMPTS, last_error,
+        )
+        raise last_error  # type: ignore[misc]
+
+    async def _send_plain(
+        self, chat_id: str, text: str, disable_preview: bool,
+    ) -> str:
+        """Resend a chunk as plain text after a markup parse error.
 
-        logger.error("Failed to send message after %d attempts", max_retries)
-        return None
+        Args:
+            chat_id: Destination chat.
+            text: Formatted message text.
+            disable_preview: Whether to disable link previews.
+
+        Returns:
+            Message ID string.
+
+        Raises:
+            RateLimitedError: If Telegram responded with RetryAfter.
+            Exception: Any other error from the send, after logging it.
+        """
+        plain = self._strip_formatting(text)
+        try:
+            await self._throttle(chat_id)
+            msg = await self._bot.send_message(
+                chat_id=chat_id,
+                text=plain,
+                disable_web_page_preview=disable_preview,
+            )
+        except RetryAfter as e:
+            logger.warning(
+                "Telegram rate limited (retry after %ss)", e.retry_after,
+            )
+            raise RateLimitedError(e.retry_after) from e
+        except Exception as e:
+            logger.error("Plain text fallback also failed: %s", e)
+            raise
+        return str(msg.message_id)
+
+    async def _throttle(self, chat_id: str) -> None:
+        """Wait until a send to chat_id fits Telegram's rate limits.
+
+        Spaces sends to one chat at least _CHAT_MIN_INTERVAL apart
+        (each chat has its own lock, so chats don't wait on each other),
+        then takes a token from the bot-wide bucket.
+
+        Args:
+            chat_id: Destination chat.
+        """
+        async with self._chat_locks[chat_id]:
+            last = self._chat_last.get(chat_id, 0.0)
+            wait = last + _CHAT_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._chat_last[chat_id] = time.monotonic()
+        await self._global_bucket.acquire()
 
     async def send_instant_alert(self, formatted_text: str) -> Optional[str]:
         """Send an instant alert with link preview enabled.
@@ -231,6 +416,16 @@ class TelegramNotifier:
             formatted_text, disable_preview=True,
         )
 
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool."""
+        try:
+            await self._bot.shutdown()
+            # shutdown() returns early if initialize() never ran or failed
+            # before opening the requests, so close the send pool directly
+            await self._bot.request.shutdown()
+        except Exception as e:
+            logger.warning("Error closing Telegram HTTP client: %s", e)
+
     def _split_message(
         self, text: str, max_len: int = _SAFE_LEN
     ) -> list[str]:
@@ -250,25 +445,31 @@ class TelegramNotifier:
             return [text]
 
         chunks: list[str] = []
-        remaining = text
+        n = len(text)
+        pos = 0
 
-        while len(remaining) > max_len:
+        # Walk a cursor forward instead of re-slicing the remainder
+        while n - pos > max_len:
+            end = pos + max_len
             # Try to split at double newline
-            cut_point = remaining.rfind("\n\n", 0, max_len)
+            cut_point = text.rfind("\n\n", pos, end)
 
-            if cut_point <= 0:
+            if cut_point <= pos:
                 # Try single newline
-                cut_point = remaining.rfind("\n", 0, max_len)
+                cut_point = text.rfind("\n", pos, end)
 
-            if cut_point <= 0:
+            if cut_point <= pos:
                 # Force split at max_len
-                cut_point = max_len
+                cut_point = end
 
-            chunks.append(remaining[:cut_point].rstrip())
-            remaining = remaining[cut_point:].lstrip("\n")
+            chunks.append(text[pos:cut_point].rstrip())
+            pos = cut_point
+            while pos < n and text[pos] == "\n":
+                pos += 1
 
-        if remaining.strip():
-            chunks.append(remaining.strip())
+        tail = text[pos:].strip()
+        if tail:
+            chunks.append(tail)
 
         return chunks
 
@@ -284,16 +485,9 @@ class TelegramNotifier:
         Returns:
             Plain text version.
         """
-        # Convert HTML links <a href="url">text</a> → text (url)
-        text = re.sub(r'<a href="([^"]+)">([^<]+)</a>', r'\2 (\1)', text)
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        # Links → text (url), drop other tags, unescape entities — one scan
+        text = _RE_HTML_TOKEN.sub(_replace_html_token, text)
         # Convert MarkdownV2 links [text](url) → text (url)
-        text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1 (\2)", text)
-        # Remove markdown markers
-        text = text.replace("*", "").replace("_", "").replace("~", "")
-        # Unescape HTML entities
-        text = text.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
-        # Remove escape backslashes
-        text = text.replace("\\", "")
-        return text
+        text = _RE_MD_LINK.sub(r"\1 (\2)", text)
+        # Remove markdown markers and escape backslashes
+        return text.translate(_MD_MARKER_TABLE)
@@ -4,9 +4,10 @@ Scoring logic for ranking job opportunities based on AI analysis
 combined with configurable weights, bonuses, and penalties.
 """
 
-from src.scorer.scoring import ScoringEngine, ScoredJob
+from src.scorer.scoring import ScoringEngine, ScoredJob, ScoringRule
 
 __all__ = [
     "ScoringEngine",
     "ScoredJob",
+    "ScoringRule",
 ]
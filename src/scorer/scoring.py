@@ -6,8 +6,10 @@ to produce a final score and recommendation decision.
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass, field
-from typing import Any
+from enum import StrEnum
+from typing import Any, NamedTuple
 
 from src.config import ScoringConfig
 from src.database.models import AnalysisResult
@@ -19,8 +21,82 @@ logger = get_logger(__name__)
 _DEFAULT_INSTANT_THRESHOLD = 80
 _DEFAULT_DIGEST_THRESHOLD = 55
 
+# ── AI dimensions and their default weights ──────────────
+_DEFAULT_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("hiring_probability", 0.3),
+    ("fit_score", 0.3),
+    ("budget_fairness", 0.15),
+    ("competition_level", 0.1),
+    ("job_clarity", 0.1),
+    ("urgency_score", 0.05),
+)
+_get_dimensions = operator.attrgetter(*(name for name, _ in _DEFAULT_WEIGHTS))
+
+# Mostaql's hire-rate text for publishers who haven't hired yet
+_HIRE_RATE_NOT_COMPUTED = "لم يحسب بعد"
+
+
+class ScoringRule(StrEnum):
+    """Bonus/penalty rule IDs (values double as the config keys)."""
+
+    PUBLISHER_VERIFIED = "publisher_verified"
+    HIRE_RATE_ABOVE_70 = "hire_rate_above_70"
+    LESS_THAN_5_PROPOSALS = "less_than_5_proposals"
+    BUDGET_ABOVE_200 = "budget_above_200"
+    NO_DESCRIPTION = "no_description"
+    TOO_MANY_PROPOSALS = "too_many_proposals"
+    PUBLISHER_NEVER_HIRED = "publisher_never_hired"
+    BUDGET_BELOW_100 = "budget_below_100"
+
+
+# ── Rule table: (default config value, Arabic explanation template) ─
+_RULES: dict[ScoringRule, tuple[int, str]] = {
+    ScoringRule.PUBLISHER_VERIFIED: (5, "الناشر موثق (+{val})"),
+    ScoringRule.HIRE_RATE_ABOVE_70: (
+        10, "معدل توظيف عالي {hire_rate}% (+{val})",
+    ),
+    ScoringRule.LESS_THAN_5_PROPOSALS: (
+        8, "منافسة منخفضة — {proposals} عروض فقط (+{val})",
+    ),
+    ScoringRule.BUDGET_ABOVE_200: (3, "ميزانية جيدة ${budget} (+{val})"),
+    ScoringRule.NO_DESCRIPTION: (-20, "بدون وصف (-{val})"),
+    ScoringRule.TOO_MANY_PROPOSALS: (
+        -10, "منافسة عالية جداً — {proposals} عرض (-{val})",
+    ),
+    ScoringRule.PUBLISHER_NEVER_HIRED: (-15, "الناشر لم يوظف أحداً بعد (-{val})"),
+    ScoringRule.BUDGET_BELOW_100: (-10, "ميزانية منخفضة ${budget} (-{val})"),
+}
+
+
+# ── Arabic labels for the recommendation decision ────────
+_REC_AR = {
+    "instant_alert": "⚡ تنبيه فوري",
+    "digest": "📋 ملخص",
+    "skip": "⏭️ تخطي",
+}
+
+
+class _Normalized(NamedTuple):
+    """Job fields read by the rules, looked up once per scored job.
 
-@dataclass
+    Attributes:
+        desc: Full description, falling back to the brief one.
+        hire_rate: Publisher hire rate as scraped (0 when missing).
+        hire_rate_raw: Publisher hire-rate text as shown on Mostaql.
+        proposals: Number of proposals so far.
+        budget: Effective budget (see ScoringEngine._effective_budget).
+        identity_verified: Whether the publisher's identity is verified.
+    """
+
+    desc: str
+    hire_rate: Any
+    hire_rate_raw: str
+    proposals: int
+    budget: float
+    identity_verified: bool
+
+
+@dataclass(slots=True)
 class ScoredJob:
     """Final scored job with recommendation and reasoning.
 
@@ -73,6 +149,28 @@ class ScoringEngine:
         self.config = config
         self.instant_threshold = instant_threshold
         self.digest_threshold = digest_threshold
+        # Weights are fixed for the engine's lifetime — resolve them once
+        self._weights = tuple(
+            config.weights.get(name, default)
+            for name, default in _DEFAULT_WEIGHTS
+        )
+        # Rule values are fixed too. Penalties are configured negative
+        # but applied as positive amounts (they are subtracted later).
+        self._rule_values: dict[ScoringRule, int] = {
+            rule: (
+                abs(config.penalties.get(rule, default)) if default < 0
+                else config.bonuses.get(rule, default)
+            )
+            for rule, (default, _) in _RULES.items()
+        }
+        # Largest total bonus any job can earn, and the unrounded score
+        # below which no job can reach a threshold (round() adds <= 0.5)
+        self._max_bonus = sum(
+            max(0, self._rule_values[rule])
+            for rule, (default, _) in _RULES.items()
+            if default > 0
+        )
+        self._skip_below = min(instant_threshold, digest_threshold) - 0.5
 
     def score(
         self, analysis: AnalysisResult, job_data: dict[str, Any]
@@ -84,8 +182,10 @@ class ScoringEngine:
           2. Add bonuses for positive signals.
           3. Subtract penalties for red flags.
           4. Clamp to 0-100.
-          5. Determine recommendation with override logic.
-          6. Build Arabic reasoning string.
+          5. Determine recommendation with override logic
+             (short-circuited to 'skip' when no rule can lift the job).
+          6. Build Arabic reasoning string (left empty for 'skip' —
+             nothing reads it for jobs that are never sent).
 
         Args:
             analysis: AI AnalysisResult for this job.
@@ -97,38 +197,46 @@ class ScoringEngine:
         mostaql_id = analysis.mostaql_id
 
         # ── Step 1: Weighted base score ──────────────────
-        weights = self.config.weights
-        base = (
-            analysis.hiring_probability * weights.get("hiring_probability", 0.3)
-            + analysis.fit_score * weights.get("fit_score", 0.3)
-            + analysis.budget_fairness * weights.get("budget_fairness", 0.15)
-            + analysis.competition_level * weights.get("competition_level", 0.1)
-            + analysis.job_clarity * weights.get("job_clarity", 0.1)
-            + analysis.urgency_score * weights.get("urgency_score", 0.05)
-        )
+        base = sum(map(operator.mul, _get_dimensions(analysis), self._weights))
+
+        # Job fields shared by the rule checks below
+        nrm = self._normalize(job_data)
 
         # ── Step 2: Bonuses ──────────────────────────────
-        bonuses = self._check_bonuses(job_data)
+        bonuses = self._check_bonuses(nrm)
         total_bonus = sum(b[1] for b in bonuses)
 
         # ── Step 3: Penalties ────────────────────────────
-        penalties = self._check_penalties(job_data, analysis)
+        penalties = self._check_penalties(nrm)
         total_penalty = sum(p[1] for p in penalties)
 
         # ── Step 4: Final score ──────────────────────────
-        final = base + total_bonus - total_penalty
-        final_clamped = max(0, min(100, int(round(final))))
+        final = round(base + total_bonus - total_penalty)
+        final_clamped = 0 if final < 0 else 100 if final > 100 else final
 
         # ── Step 5: Recommendation ───────────────────────
-        recommendation = self._decide_recommendation(
-            final_clamped, analysis, job_data,
-        )
+        # Even with every bonus this job can't reach a threshold, and
+        # neither instant override applies — it can only be skipped.
+        # Bonuses/penalties above still run: the final score is stored.
+        if (
+            base + self._max_bonus < self._skip_below
+            and analysis.fit_score < 85
+            and not (nrm.budget >= 250 and (nrm.hire_rate or 0) > 0)
+        ):
+            recommendation = "skip"
+            reasoning = ""
+        else:
+            recommendation = self._decide_recommendation(
+                final_clamped, analysis, nrm,
+            )
 
-        # ── Step 6: Build reasoning ──────────────────────
-        reasoning = self._build_reasoning(
-            final_clamped, base, total_bonus, total_penalty,
-            bonuses, penalties, recommendation,
-        )
+            # ── Step 6: Build reasoning ──────────────────
+            reasoning = ""
+            if recommendation != "skip":
+                reasoning = self._build_reasoning(
+                    final_clamped, base, total_bonus, total_penalty,
+                    bonuses, penalties, recommendation,
+                )
 
         scored = ScoredJob(
             mostaql_id=mostaql_id,
@@ -149,121 +257,132 @@ class ScoringEngine:
 
         return scored
 
-    def _check_bonuses(
-        self, job_data: dict[str, Any]
-    ) -> list[tuple[str, int, str]]:
-        """Check each bonus rule against job data.
+    @staticmethod
+    def _effective_budget(job_data: dict[str, Any]) -> float:
+        """Budget used by the rules: the maximum if known, else the minimum.
+
+        Args:
+            job_data: Raw job data dict.
+
+        Returns:
+            Budget in USD, 0 when unknown.
+        """
+        return job_data.get("budget_max") or job_data.get("budget_min") or 0
+
+    @classmethod
+    def _normalize(cls, job_data: dict[str, Any]) -> _Normalized:
+        """Read the fields the rules need from the raw job data.
 
         Args:
             job_data: Raw job data dict.
 
+        Returns:
+            A _Normalized tuple with defaults filled in.
+        """
+        get = job_data.get
+        return _Normalized(
+            desc=get("full_description") or get("brief_description") or "",
+            hire_rate=get("hire_rate", 0),
+            hire_rate_raw=get("hire_rate_raw") or "",
+            proposals=get("proposals_count") or 0,
+            budget=cls._effective_budget(job_data),
+            identity_verified=bool(get("identity_verified")),
+        )
+
+    def _check_bonuses(self, nrm: _Normalized) -> list[tuple[str, int, str]]:
+        """Check each bonus rule against job data.
+
+        Args:
+            nrm: Normalized job fields (see _normalize).
+
         Returns:
             List of (rule_name, bonus_value, arabic_explanation) tuples.
         """
         bonuses: list[tuple[str, int, str]] = []
-        cfg = self.config.bonuses
 
         # Publisher verified
-        if job_data.get("identity_verified", False):
-            val = cfg.get("publisher_verified", 5)
-            bonuses.append(("publisher_verified", val, f"الناشر موثق (+{val})"))
+        if nrm.identity_verified:
+            bonuses.append(self._apply_rule(ScoringRule.PUBLISHER_VERIFIED))
 
         # High hire rate
-        hire_rate = job_data.get("hire_rate", 0)
+        hire_rate = nrm.hire_rate
         if isinstance(hire_rate, (int, float)) and hire_rate > 70:
-            val = cfg.get("hire_rate_above_70", 10)
-            bonuses.append((
-                "hire_rate_above_70", val,
-                f"معدل توظيف عالي {hire_rate:.0f}% (+{val})",
+            bonuses.append(self._apply_rule(
+                ScoringRule.HIRE_RATE_ABOVE_70, hire_rate=_whole(hire_rate),
             ))
 
         # Few proposals
-        proposals = job_data.get("proposals_count", 0) or 0
-        if proposals < 5:
-            val = cfg.get("less_than_5_proposals", 8)
-            bonuses.append((
-                "less_than_5_proposals", val,
-                f"منافسة منخفضة — {proposals} عروض فقط (+{val})",
+        if nrm.proposals < 5:
+            bonuses.append(self._apply_rule(
+                ScoringRule.LESS_THAN_5_PROPOSALS, proposals=nrm.proposals,
             ))
 
         # Budget above $200
-        budget_max = job_data.get("budget_max", 0) or 0
-        budget_min = job_data.get("budget_min", 0) or 0
-        budget = budget_max if budget_max else budget_min
-        if budget > 200:
-            val = cfg.get("budget_above_200", 3)
-            bonuses.append((
-                "budget_above_200", val,
-                f"ميزانية جيدة ${budget:.0f} (+{val})",
+        if nrm.budget > 200:
+            bonuses.append(self._apply_rule(
+                ScoringRule.BUDGET_ABOVE_200, budget=_whole(nrm.budget),
             ))
 
         return bonuses
 
-    def _check_penalties(
-        self,
-        job_data: dict[str, Any],
-        analysis: AnalysisResult,
-    ) -> list[tuple[str, int, str]]:
+    def _check_penalties(self, nrm: _Normalized) -> list[tuple[str, int, str]]:
         """Check each penalty rule against job data.
 
         Args:
-            job_data: Raw job data dict.
-            analysis: AI analysis result.
+            nrm: Normalized job fields (see _normalize).
 
         Returns:
             List of (rule_name, penalty_value, arabic_explanation) tuples.
             Penalty values are positive (they will be subtracted).
         """
         penalties: list[tuple[str, int, str]] = []
-        cfg = self.config.penalties
 
         # No description
-        desc = job_data.get("full_description", "") or job_data.get("brief_description", "")
+        desc = nrm.desc
         if not desc or len(desc.strip()) < 20:
-            val = abs(cfg.get("no_description", -20))
-            penalties.append(("no_description", val, f"بدون وصف (-{val})"))
+            penalties.append(self._apply_rule(ScoringRule.NO_DESCRIPTION))
 
         # Too many proposals (>20)
-        proposals = job_data.get("proposals_count", 0) or 0
-        if proposals > 20:
-            val = abs(cfg.get("too_many_proposals", -10))
-            penalties.append((
-                "too_many_proposals", val,
-                f"منافسة عالية جداً — {proposals} عرض (-{val})",
+        if nrm.proposals > 20:
+            penalties.append(self._apply_rule(
+                ScoringRule.TOO_MANY_PROPOSALS, proposals=nrm.proposals,
             ))
 
         # Publisher never hired
         # hire_rate_raw: "لم يحسب بعد" = new, "0%" = posted but never hired
-        hire_rate = job_data.get("hire_rate", 0)
-        hire_rate_raw = str(job_data.get("hire_rate_raw", ""))
+        hire_rate = nrm.hire_rate
         never_hired = (
-            hire_rate_raw == "لم يحسب بعد"
+            nrm.hire_rate_raw == _HIRE_RATE_NOT_COMPUTED
             or (isinstance(hire_rate, (int, float)) and hire_rate == 0)
         )
         if never_hired:
-            val = abs(cfg.get("publisher_never_hired", -15))
-            penalties.append((
-                "publisher_never_hired", val,
-                f"الناشر لم يوظف أحداً بعد (-{val})",
-            ))
+            penalties.append(self._apply_rule(ScoringRule.PUBLISHER_NEVER_HIRED))
 
         # Budget below $100 (user's minimum preference)
-        budget_max = job_data.get("budget_max", 0) or 0
-        budget_min = job_data.get("budget_min", 0) or 0
-        budget = budget_max if budget_max else budget_min
-        if 0 < budget < 100:
-            val = abs(cfg.get("budget_below_100", -10))
-            penalties.append((
-                "budget_below_100", val,
-                f"ميزانية منخفضة ${budget:.0f} (-{val})",
+        if 0 < nrm.budget < 100:
+            penalties.append(self._apply_rule(
+                ScoringRule.BUDGET_BELOW_100, budget=_whole(nrm.budget),
             ))
 
         return penalties
 
+    def _apply_rule(
+        self, rule: ScoringRule, **fields: Any,
+    ) -> tuple[str, int, str]:
+        """Build the (rule, value, explanation) entry for a triggered rule.
+
+        Args:
+            rule: The rule that fired.
+            **fields: Extra values referenced by the rule's template.
+
+        Returns:
+            Tuple of (rule ID, value, Arabic explanation).
+        """
+        val = self._rule_values[rule]
+        return rule, val, _RULES[rule][1].format(val=val, **fields)
+
     def _should_override_instant(
-        self,
-        job_data: dict[str, Any],
-        analysis: AnalysisResult,
+        self, analysis: AnalysisResult, nrm: _Normalized,
     ) -> bool:
         """Check if instant_alert should be blocked despite high score.
 
@@ -273,20 +392,16 @@ class ScoringEngine:
           - Hiring probability < 30 (unlikely to hire)
 
         Args:
-            job_data: Raw job data dict.
             analysis: AI analysis result.
+            nrm: Normalized job fields (see _normalize).
 
         Returns:
             True if instant_alert should be blocked.
         """
-        budget_max = job_data.get("budget_max", 0) or 0
-        budget_min = job_data.get("budget_min", 0) or 0
-        budget = budget_max if budget_max else budget_min
-        if 0 < budget < 15:
+        if 0 < nrm.budget < 15:
             return True
 
-        proposals = job_data.get("proposals_count", 0) or 0
-        if proposals > 30:
+        if nrm.proposals > 30:
             return True
 
         if analysis.hiring_probability < 30:
@@ -298,7 +413,7 @@ class ScoringEngine:
         self,
         final_score: int,
         analysis: AnalysisResult,
-        job_data: dict[str, Any],
+        nrm: _Normalized,
     ) -> str:
         """Determine the recommendation category.
 
@@ -313,7 +428,7 @@ class ScoringEngine:
         Args:
             final_score: Clamped final score.
             analysis: AI analysis result.
-            job_data: Raw job data.
+            nrm: Normalized job fields (see _normalize).
 
         Returns:
             One of 'instant_alert', 'digest', 'skip'.
@@ -329,10 +444,8 @@ class ScoringEngine:
             is_instant = True
 
         # Rule c: Budget >= $250 AND publisher has hired before
-        budget_max = job_data.get("budget_max", 0) or 0
-        budget_min = job_data.get("budget_min", 0) or 0
-        budget = budget_max if budget_max else budget_min
-        hire_rate = job_data.get("hire_rate", 0) or 0
+        budget = nrm.budget
+        hire_rate = nrm.hire_rate or 0
         if budget >= 250 and hire_rate > 0:
             is_instant = True
             logger.info(
@@ -341,7 +454,7 @@ class ScoringEngine:
             )
 
         # Override check
-        if is_instant and self._should_override_instant(job_data, analysis):
+        if is_instant and self._should_override_instant(analysis, nrm):
             logger.info(
                 "Blocking instant_alert for %s (override triggered)",
                 analysis.mostaql_id,
@@ -382,11 +495,7 @@ class ScoringEngine:
         Returns:
             Multi-line Arabic string explaining the score.
         """
-        rec_ar = {
-            "instant_alert": "⚡ تنبيه فوري",
-            "digest": "📋 ملخص",
-            "skip": "⏭️ تخطي",
-        }.get(recommendation, recommendation)
+        rec_ar = _REC_AR.get(recommendation, recommendation)
 
         header = (
             f"الدرجة الكلية: {final}/100 | "
@@ -403,3 +512,15 @@ class ScoringEngine:
             lines.append(f"⚠️ {explanation}")
 
         return "\n".join(lines)
+
+
+def _whole(amount: float) -> str:
+    """Format an amount with no decimals, skipping float formatting for ints.
+
+    Args:
+        amount: Budget or percentage (int or float).
+
+    Returns:
+        The amount rounded to a whole number, as text.
+    """
+    return str(amount) if type(amount) is int else f"{amount:.0f}"
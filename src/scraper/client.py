@@ -4,7 +4,7 @@ Provides a robust, rate-limited, retrying async HTTP client for
 scraping mostaql.com. Built on httpx.AsyncClient with:
   - User-agent rotation from config
   - Exponential backoff retry (429, 5xx, timeout, connection errors)
-  - Rate limiting via AsyncRateLimiter
+  - Rate limiting via an AsyncTokenBucket (bursts up to burst_capacity)
   - Separate methods for XHR (listing) and HTML (detail) requests
   - Request counting for session telemetry
 """
@@ -12,35 +12,73 @@ scraping mostaql.com. Built on httpx.AsyncClient with:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import itertools
 import random
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 from src.config import ScraperConfig
 from src.utils.logger import get_logger
-from src.utils.rate_limiter import AsyncRateLimiter
+from src.utils.rate_limiter import AsyncTokenBucket
 from src.utils.resilience import CircuitBreaker, CircuitOpenError
 
 logger = get_logger(__name__)
 
 # ── Browser-like headers common to all requests ──────────
+# Accept-Encoding is left to httpx, which only advertises the
+# compressions it can actually decode (br needs the brotli package).
+# Connection is left to httpx too: it sends keep-alive on HTTP/1.1 and
+# the header is not allowed on HTTP/2.
 _COMMON_HEADERS = {
     "Accept-Language": "ar,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
-    "Connection": "keep-alive",
     "Sec-Fetch-Dest": "document",
     "Sec-Fetch-Mode": "navigate",
     "Sec-Fetch-Site": "same-origin",
     "Referer": "https://mostaql.com/projects",
 }
 
+# ── Connection pool ──────────────────────────────────────
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+# Every request goes to mostaql.com, so keep sockets alive well past the
+# inter-request delay instead of httpx's 5s default expiry. With HTTP/2
+# concurrent requests share one multiplexed connection, so a few suffice.
+_MAX_CONNECTIONS = 5 if _HTTP2 else 20
+_POOL_LIMITS = httpx.Limits(
+    max_connections=_MAX_CONNECTIONS,
+    max_keepalive_connections=_MAX_CONNECTIONS,
+    keepalive_expiry=75.0,
+)
+
+# ── Retry backoff (base seconds, doubled per attempt, plus jitter) ─
+_BACKOFF_TIMEOUT = 1.0
+_BACKOFF_SERVER_ERROR = 2.0
+_BACKOFF_CONNECT = 5.0
+_MAX_BACKOFF = 60.0
+
+
+def _backoff(attempt: int, base: float) -> float:
+    """Exponential backoff with random jitter, capped at _MAX_BACKOFF.
+
+    Args:
+        attempt: 1-based attempt number that just failed.
+        base: Base delay in seconds for this kind of failure.
+
+    Returns:
+        Seconds to wait before the next attempt.
+    """
+    exp = 2 ** attempt
+    return min(_MAX_BACKOFF, exp * base + random.uniform(0, 0.5 * exp))
+
 
 class MostaqlClient:
     """Async HTTP client for mostaql.com with retry and rate limiting.
 
     Integrates with ScraperConfig for all tunable parameters and
-    AsyncRateLimiter for request throttling.
+    AsyncTokenBucket for request throttling.
 
     Attributes:
         config: Scraper configuration from the YAML config.
@@ -55,11 +93,23 @@ class MostaqlClient:
         """
         self.config = config
         self.total_requests: int = 0
-        self._rate_limiter = AsyncRateLimiter(
-            max_calls=1,
-            period_seconds=float(config.request_delay_seconds),
+        # One request per request_delay_seconds on average, but concurrent
+        # fetches may overlap up to burst_capacity before being spaced out.
+        # A delay of 0 is clamped to 100 requests/s, not unthrottled.
+        self._rate_limiter = AsyncTokenBucket(
+            rate=1.0 / max(config.request_delay_seconds, 0.01),
+            capacity=config.burst_capacity,
         )
         self._client: Optional[httpx.AsyncClient] = None
+        # Detail pages wait detail_delay_seconds; the limiter already covers
+        # request_delay_seconds of that
+        self._detail_extra_delay = max(
+            0.0, config.detail_delay_seconds - config.request_delay_seconds,
+        )
+        # Rotate through the configured user agents in a shuffled order
+        self._ua_cycle = itertools.cycle(
+            random.sample(config.user_agents, len(config.user_agents))
+        )
 
         # Circuit breaker for Mostaql HTTP requests
         self.circuit_breaker = CircuitBreaker(
@@ -78,7 +128,7 @@ class MostaqlClient:
             The active async HTTP client.
         """
         if self._client is None:
-            ua = random.choice(self.config.user_agents)
+            ua = next(self._ua_cycle)
             proxy = self.config.proxy_url or None
             if proxy:
                 logger.info("Using proxy: %s", proxy.split("@")[-1] if "@" in proxy else proxy[:30])
@@ -90,6 +140,8 @@ class MostaqlClient:
                 },
                 follow_redirects=True,
                 timeout=httpx.Timeout(self.config.timeout_seconds),
+                limits=_POOL_LIMITS,
+                http2=_HTTP2,
                 proxy=proxy,
             )
             # Warmup: load the HTML page first to get cookies
@@ -106,12 +158,6 @@ class MostaqlClient:
         except Exception as e:
             logger.warning("Warmup request failed: %s", e)
 
-    def _rotate_ua(self) -> None:
-        """Rotate the User-Agent header to a random one from config."""
-        if self._client is not None:
-            ua = random.choice(self.config.user_agents)
-            self._client.headers["User-Agent"] = ua
-
     async def get_listing_page(
         self, page: int = 1, **filters: Any
     ) -> Optional[dict[str, Any]]:
@@ -159,7 +205,8 @@ class MostaqlClient:
             return None
 
         try:
-            data = response.json()
+            # orjson parses the raw bytes directly (no str decode step)
+            data = orjson.loads(response.content)
             collection = data.get("collection", [])
             if len(collection) == 0:
                 self._consecutive_empty_pages += 1
@@ -179,29 +226,29 @@ class MostaqlClient:
             logger.error("Failed to parse listing JSON for page %d: %s", page, e)
             return None
 
-    async def get_detail_page(self, url: str) -> Optional[str]:
-        """Fetch a detail page and return raw HTML.
+    async def get_detail_page(self, url: str) -> Optional[bytes]:
+        """Fetch a detail page and return its raw HTML bytes.
 
-        Uses browser-like headers for a normal HTML page request.
+        Uses browser-like headers for a normal HTML page request. The
+        body is returned undecoded; selectolax decodes it in C.
 
         Args:
             url: Full URL to the project detail page.
 
         Returns:
-            Raw HTML string, or None if the request failed after all retries.
+            Raw HTML bytes, or None if the request failed after all retries.
         """
         logger.info("Fetching detail: %s", url)
 
         # Use the detail delay instead of the normal request delay
-        await asyncio.sleep(
-            max(0, self.config.detail_delay_seconds - self.config.request_delay_seconds)
-        )
+        if self._detail_extra_delay:
+            await asyncio.sleep(self._detail_extra_delay)
 
         response = await self._request(url)
         if response is None:
             return None
 
-        return response.text
+        return response.content
 
     async def _request(
         self,
@@ -213,9 +260,9 @@ class MostaqlClient:
 
         Retry strategy:
           - 429 Too Many Requests: wait 30s then retry
-          - 5xx Server Error: wait 5s × attempt then retry
-          - Timeout: wait 3s × attempt then retry
-          - Connection Error: wait 10s then retry
+          - 5xx Server Error: wait 2s × 2^attempt (+ jitter) then retry
+          - Timeout / other HTTP errors: wait 1s × 2^attempt (+ jitter)
+          - Connection Error: wait 5s × 2^attempt (+ jitter) then retry
 
         Args:
             url: Request URL.
@@ -227,14 +274,15 @@ class MostaqlClient:
         """
         client = await self._get_client()
         max_retries = self.config.max_retries
+        base_headers = extra_headers or {}  # only read, never mutated
 
         for attempt in range(1, max_retries + 1):
             # Rate limit
             await self._rate_limiter.acquire()
-            self._rotate_ua()
 
             try:
-                headers = dict(extra_headers) if extra_headers else {}
+                # Per-request UA: client.headers is shared by concurrent tasks
+                headers = {"User-Agent": next(self._ua_cycle), **base_headers}
                 resp = await client.get(url, params=params, headers=headers)
 
                 if resp.status_code == 429:
@@ -247,9 +295,9 @@ class MostaqlClient:
                     continue
 
                 if resp.status_code >= 500:
-                    wait = 5 * attempt
+                    wait = _backoff(attempt, _BACKOFF_SERVER_ERROR)
                     logger.warning(
-                        "Server error %d on attempt %d/%d. Waiting %ds...",
+                        "Server error %d on attempt %d/%d. Waiting %.1fs...",
                         resp.status_code, attempt, max_retries, wait,
                     )
                     await asyncio.sleep(wait)
@@ -260,18 +308,18 @@ class MostaqlClient:
                 return resp
 
             except httpx.TimeoutException:
-                wait = 3 * attempt
+                wait = _backoff(attempt, _BACKOFF_TIMEOUT)
                 logger.warning(
-                    "Timeout on attempt %d/%d. Waiting %ds...",
+                    "Timeout on attempt %d/%d. Waiting %.1fs...",
                     attempt, max_retries, wait,
                 )
                 if attempt < max_retries:
                     await asyncio.sleep(wait)
 
             except httpx.ConnectError:
-                wait = 10
+                wait = _backoff(attempt, _BACKOFF_CONNECT)
                 logger.warning(
-                    "Connection error on attempt %d/%d. Waiting %ds...",
+                    "Connection error on attempt %d/%d. Waiting %.1fs...",
                     attempt, max_retries, wait,
                 )
                 if attempt < max_retries:
@@ -287,7 +335,7 @@ class MostaqlClient:
                     attempt, max_retries, e,
                 )
                 if attempt < max_retries:
-                    await asyncio.sleep(3 * attempt)
+                    await asyncio.sleep(_backoff(attempt, _BACKOFF_TIMEOUT))
 
         logger.error("All %d attempts failed for %s", max_retries, url)
         return None
@@ -300,11 +348,16 @@ class MostaqlClient:
             logger.debug("HTTP client closed (total requests: %d)", self.total_requests)
 
     async def __aenter__(self) -> "MostaqlClient":
-        """Async context manager entry.
+        """Async context manager entry — opens and warms up the client.
+
+        Creating the client here means the warmup request (TCP/TLS
+        handshake plus session cookies) happens on entry instead of
+        inside the first listing fetch.
 
         Returns:
             The MostaqlClient instance.
         """
+        await self._get_client()
         return self
 
     async def __aexit__(self, *args: object) -> None:
@@ -10,7 +10,9 @@ use selectolax (HTMLParser) instead of BeautifulSoup.
 
 from __future__ import annotations
 
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from selectolax.parser import HTMLParser, Node
@@ -21,6 +23,27 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Detail pages are parsed off the event loop so in-flight fetches keep
+# progressing. Threads are started on first use and shared by every
+# DetailScraper (the pipeline builds a new one each cycle).
+_PARSER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="detail-parse")
+
+# ── Precompiled patterns ─────────────────────────────────
+_RE_BUDGET_NUM = re.compile(r"[\d,]+\.?\d*")
+_RE_FLOAT = re.compile(r"([\d.]+)")
+_RE_INT = re.compile(r"(\d+)")
+_RE_USLUG = re.compile(r"/u/([^/\?]+)")
+_RE_SLUGIFY = re.compile(r"[^\w]")
+
+# ── Publisher table-meta labels → stats keys ─────────────
+_PUBLISHER_STATS = {
+    "تاريخ التسجيل": "registered",
+    "معدل التوظيف": "hire_rate",
+    "المشاريع المفتوحة": "open_projects",
+    "مشاريع قيد التنفيذ": "in_progress",
+    "التواصلات الجارية": "communications",
+}
+
 
 # ═══════════════════════════════════════════════════════════
 # Helper Functions
@@ -53,29 +76,76 @@ def _attr(node: Optional[Node], name: str) -> str:
     """
     if node is None:
         return ""
-    val = node.attributes.get(name)
+    # attrs reads one attribute lazily; .attributes builds the whole dict
+    val = node.attrs.get(name)
     return val if val else ""
 
 
-def _extract_meta_value(sidebar: Node, label: str) -> str:
-    """Extract a meta-value from the sidebar by its Arabic label text.
+def _normalize_label(text: str) -> str:
+    """Normalize label text for exact lookups ("الميزانية:" → "الميزانية").
+
+    Args:
+        text: Stripped label text from the page.
+
+    Returns:
+        The label without a trailing colon.
+    """
+    return text.rstrip(":").rstrip()
+
+
+def _match_label(labels: dict[str, str], label: str) -> Optional[str]:
+    """Find the value for an Arabic label in a label → value map.
+
+    Tries an exact (O(1)) match on the normalized label first and only
+    falls back to a substring scan when the page words it differently.
+
+    Args:
+        labels: Normalized label → value map.
+        label: Arabic label text to match.
+
+    Returns:
+        The matching value, or None if no label matches.
+    """
+    value = labels.get(label)
+    if value is None:
+        value = next((v for key, v in labels.items() if label in key), None)
+    return value
+
 
-    Searches through .meta-row elements for a matching label.
+def _build_meta_map(sidebar: Node) -> dict[str, str]:
+    """Collect the sidebar's .meta-row label/value pairs in one walk.
 
     Args:
         sidebar: The sidebar HTMLParser node (#project-meta-panel).
-        label: Arabic label text to match (e.g., "الميزانية").
 
     Returns:
-        The corresponding value text, or empty string.
+        Dict of normalized label → value text, in page order. Rows
+        missing a label or value are skipped; the first row wins on
+        duplicates.
     """
+    meta: dict[str, str] = {}
     for row in sidebar.css(".meta-row"):
         label_el = row.css_first(".meta-label")
-        if label_el and label in _text(label_el):
-            value_el = row.css_first(".meta-value")
-            if value_el:
-                return _text(value_el)
-    return ""
+        if label_el is None:
+            continue
+        value_el = row.css_first(".meta-value")
+        if value_el is not None:
+            meta.setdefault(_normalize_label(_text(label_el)), _text(value_el))
+    return meta
+
+
+def _extract_meta_value(meta: dict[str, str], label: str) -> str:
+    """Look up a sidebar meta-value by its Arabic label text.
+
+    Args:
+        meta: Label → value map from _build_meta_map.
+        label: Arabic label text to match (e.g., "الميزانية").
+
+    Returns:
+        The corresponding value text, or empty string.
+    """
+    value = _match_label(meta, label)
+    return value if value is not None else ""
 
 
 def _parse_budget(raw: str) -> tuple[Optional[float], Optional[float], str]:
@@ -98,7 +168,7 @@ def _parse_budget(raw: str) -> tuple[Optional[float], Optional[float], str]:
         return None, None, raw
 
     # Extract all numbers (including decimals)
-    numbers = re.findall(r"[\d,]+\.?\d*", raw.replace(",", ""))
+    numbers = _RE_BUDGET_NUM.findall(raw.replace(",", ""))
     floats = []
     for n in numbers:
         try:
@@ -131,7 +201,7 @@ def _parse_hire_rate(raw: str) -> float:
     """
     if not raw:
         return 0.0
-    match = re.search(r"([\d.]+)", raw.replace("%", ""))
+    match = _RE_FLOAT.search(raw.replace("%", ""))
     if match:
         try:
             return float(match.group(1))
@@ -163,13 +233,13 @@ def _extract_publisher(widget: Node) -> PublisherInfo:
 
     # Derive a publisher_id from the name or profile link
     profile_link = widget.css_first("a[href*='/u/']")
-    profile_url = _attr(profile_link, "href") if profile_link else ""
+    profile_url = _attr(profile_link, "href")
     if profile_url:
         # Extract username slug from URL
-        match = re.search(r"/u/([^/\?]+)", profile_url)
+        match = _RE_USLUG.search(profile_url)
         publisher_id = match.group(1) if match else display_name.lower().replace(" ", "-")
     else:
-        publisher_id = re.sub(r"[^\w]", "-", display_name.lower()).strip("-") or "unknown"
+        publisher_id = _RE_SLUGIFY.sub("-", display_name.lower()).strip("-") or "unknown"
 
     # Role
     role_el = (
@@ -186,26 +256,20 @@ def _extract_publisher(widget: Node) -> PublisherInfo:
     stats: dict[str, str] = {}
     table = widget.css_first("table.table-meta")
     if table:
-        stats_map = {
-            "تاريخ التسجيل": "registered",
-            "معدل التوظيف": "hire_rate",
-            "المشاريع المفتوحة": "open_projects",
-            "مشاريع قيد التنفيذ": "in_progress",
-            "التواصلات الجارية": "communications",
-        }
+        # One walk over the rows, then look up each known label
+        rows: dict[str, str] = {}
         for row in table.css("tr"):
             cells = row.css("td")
             if len(cells) >= 2:
-                label = _text(cells[0])
-                value = _text(cells[1])
-                for arabic_label, key in stats_map.items():
-                    if arabic_label in label:
-                        stats[key] = value
-                        break
+                rows[_normalize_label(_text(cells[0]))] = _text(cells[1])
+        for arabic_label, key in _PUBLISHER_STATS.items():
+            value = _match_label(rows, arabic_label)
+            if value is not None:
+                stats[key] = value
 
     hire_rate_raw = stats.get("hire_rate", "")
     open_projects_text = stats.get("open_projects", "0")
-    open_projects_match = re.search(r"(\d+)", open_projects_text)
+    open_projects_match = _RE_INT.search(open_projects_text)
 
     return PublisherInfo(
         publisher_id=publisher_id,
@@ -239,15 +303,18 @@ def _extract_proposals(section: Node) -> list[ProposalInfo]:
     for bid_el in section.css(".bid[data-bid-item]"):
         try:
             # Name
-            name_el = bid_el.css_first(".profile__name bdi")
-            name = _text(name_el) if name_el else _text(bid_el.css_first(".profile__name"))
+            name_el = (
+                bid_el.css_first(".profile__name bdi")
+                or bid_el.css_first(".profile__name")
+            )
+            name = _text(name_el)
 
             # Rating
             rating = 0.0
             rating_el = bid_el.css_first("li.rating-stars")
             if rating_el:
                 rating_text = _text(rating_el)
-                match = re.search(r"([\d.]+)", rating_text)
+                match = _RE_FLOAT.search(rating_text)
                 if match:
                     try:
                         rating = float(match.group(1))
@@ -256,7 +323,7 @@ def _extract_proposals(section: Node) -> list[ProposalInfo]:
 
             # Time
             time_el = bid_el.css_first("time[datetime]")
-            proposed_at = _attr(time_el, "datetime") if time_el else ""
+            proposed_at = _attr(time_el, "datetime")
 
             # Verification badge
             badge = bid_el.css_first(".profile-verification-badge, .verified-badge")
@@ -288,12 +355,13 @@ class DetailScraper:
     """
 
     def parse_detail_page(
-        self, html: str, mostaql_id: str
+        self, html: str | bytes, mostaql_id: str
     ) -> Optional[JobDetail]:
         """Parse a raw HTML detail page into a JobDetail dataclass.
 
         Args:
-            html: Complete HTML content of the detail page.
+            html: Complete HTML content of the detail page, as text or
+                as the undecoded response body.
             mostaql_id: The job's Mostaql ID for linking.
 
         Returns:
@@ -306,23 +374,19 @@ class DetailScraper:
             logger.error("Failed to parse HTML for %s: %s", mostaql_id, e)
             return None
 
+        # Everything read below lives in <body>; resolve it once so no
+        # query walks the script/style-heavy <head>
+        root = tree.body or tree.root
+
         # ── Title ────────────────────────────────────────
         title_el = (
-            tree.css_first("span[data-type='page-header-title']")
-            or tree.css_first("h1")
+            root.css_first("span[data-type='page-header-title']")
+            or root.css_first("h1")
         )
         title = _text(title_el)
 
-        # ── Category from breadcrumbs ────────────────────
-        breadcrumbs = tree.css("ol.breadcrumb li.breadcrumb-item")
-        category = ""
-        if len(breadcrumbs) >= 3:
-            category = _text(breadcrumbs[2])
-        elif len(breadcrumbs) >= 2:
-            category = _text(breadcrumbs[1])
-
         # ── Sidebar meta panel ───────────────────────────
-        sidebar = tree.css_first("#project-meta-panel")
+        sidebar = root.css_first("#project-meta-panel")
 
         budget_min: Optional[float] = None
         budget_max: Optional[float] = None
@@ -333,6 +397,8 @@ class DetailScraper:
         status = ""
 
         if sidebar:
+            meta = _build_meta_map(sidebar)
+
             # Status
             status_el = sidebar.css_first(
                 ".label-prj-open, .label-prj-closed, .label-prj-inprogress"
@@ -340,49 +406,49 @@ class DetailScraper:
             if status_el:
                 status = _text(status_el)
             else:
-                status = _extract_meta_value(sidebar, "حالة المشروع")
+                status = _extract_meta_value(meta, "حالة المشروع")
 
             # Budget
-            budget_el = sidebar.css_first(
-                "[data-type='project-budget_range'], [data-type=project-budget_range]"
-            )
+            budget_el = sidebar.css_first("[data-type='project-budget_range']")
             if budget_el:
                 budget_raw = _text(budget_el)
             else:
-                budget_raw = _extract_meta_value(sidebar, "الميزانية")
+                budget_raw = _extract_meta_value(meta, "الميزانية")
 
             budget_min, budget_max, budget_raw = _parse_budget(budget_raw)
 
             # Duration
-            duration = _extract_meta_value(sidebar, "مدة التنفيذ")
+            duration = _extract_meta_value(meta, "مدة التنفيذ")
 
             # Experience level
-            experience_level = _extract_meta_value(sidebar, "مستوى الخبرة")
+            experience_level = _extract_meta_value(meta, "مستوى الخبرة")
 
             # Skills
-            skill_items = sidebar.css("li.skills__item bdi")
-            skills = [_text(s) for s in skill_items if _text(s)]
+            skills = [
+                t for el in sidebar.css("li.skills__item bdi") if (t := _text(el))
+            ]
             # Fallback: try without bdi
             if not skills:
-                skill_items = sidebar.css("li.skills__item")
-                skills = [_text(s) for s in skill_items if _text(s)]
+                skills = [
+                    t for el in sidebar.css("li.skills__item") if (t := _text(el))
+                ]
         else:
             logger.warning("No sidebar found for %s", mostaql_id)
 
         # ── Full description ─────────────────────────────
         desc_el = (
-            tree.css_first("#projectDetailsTab .carda__content")
-            or tree.css_first(".carda__content")
-            or tree.css_first(".project-description")
+            root.css_first("#projectDetailsTab .carda__content")
+            or root.css_first(".carda__content")
+            or root.css_first(".project-description")
         )
         full_description = _text(desc_el)
 
         # ── Publisher info ───────────────────────────────
         publisher: Optional[PublisherInfo] = None
-        pub_widget = tree.css_first(
-            "#project-meta-panel [data-type='employer_widget'], "
-            "[data-type=employer_widget]"
-        )
+        # Prefer the widget inside the sidebar, else any on the page
+        pub_widget = (
+            sidebar and sidebar.css_first("[data-type='employer_widget']")
+        ) or root.css_first("[data-type='employer_widget']")
         if pub_widget:
             try:
                 publisher = _extract_publisher(pub_widget)
@@ -391,7 +457,7 @@ class DetailScraper:
 
         # ── Proposals ────────────────────────────────────
         proposals: list[ProposalInfo] = []
-        bids_section = tree.css_first("#project-bids")
+        bids_section = root.css_first("#project-bids")
         if bids_section:
             try:
                 proposals = _extract_proposals(bids_section)
@@ -399,7 +465,7 @@ class DetailScraper:
                 logger.warning("Failed to extract proposals for %s: %s", mostaql_id, e)
 
         # ── Attachments count ────────────────────────────
-        attachments = tree.css(
+        attachments = root.css(
             ".project-attachments .attachment, .attachments .attachment"
         )
 
@@ -450,4 +516,38 @@ class DetailScraper:
             logger.warning("Failed to fetch detail page for %s", mostaql_id)
             return None
 
-        return self.parse_detail_page(html, mostaql_id)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _PARSER_POOL, self.parse_detail_page, html, mostaql_id,
+        )
+
+    async def scrape_many(
+        self,
+        client: MostaqlClient,
+        items: list[tuple[str, str]],
+        concurrency: int = 5,
+    ) -> list[Optional[JobDetail]]:
+        """Fetch and parse several detail pages concurrently.
+
+        At most ``concurrency`` pages are in flight at once; the client's
+        rate limiter still spaces out the actual requests.
+
+        Args:
+            client: Active MostaqlClient instance.
+            items: (url, mostaql_id) pairs to scrape.
+            concurrency: Maximum number of simultaneous detail fetches.
+
+        Returns:
+            One JobDetail (or None on failure) per item, in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(url: str, mostaql_id: str) -> Optional[JobDetail]:
+            async with sem:
+                try:
+                    return await self.scrape_detail(client, url, mostaql_id)
+                except Exception as e:
+                    logger.error("Error scraping detail for %s: %s", mostaql_id, e)
+                    return None
+
+        return await asyncio.gather(*(one(url, mid) for url, mid in items))
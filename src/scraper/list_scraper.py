@@ -4,16 +4,18 @@ Parses project listings from the XHR JSON response. Each item in the
 'collection' array contains an integer 'id' and a 'rendered' HTML string.
 
 CSS selectors are adapted from the working investigation scraper and
-use selectolax (HTMLParser) instead of BeautifulSoup.
+use selectolax (lexbor backend) instead of BeautifulSoup.
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-from selectolax.parser import HTMLParser, Node
+from selectolax.lexbor import LexborHTMLParser as HTMLParser, LexborNode as Node
 
 from src.config import ScraperConfig
 from src.database.models import JobListing
@@ -25,6 +27,26 @@ logger = get_logger(__name__)
 # Debug dump directory for unparseable rows
 DEBUG_DIR = Path(__file__).resolve().parent.parent.parent / "logs" / "debug"
 
+# ── Card selectors, most specific first ──────────────────
+_TITLE_SELECTORS = ("h2.mrg--bt-reset > a", "h2 > a", "a[href*='/projects/']")
+_PUBLISHER_SELECTORS = ("ul.project__meta bdi", ".project__meta bdi", "bdi")
+_DESC_SELECTORS = ("p.project__brief a", "p.project__brief", ".project__brief")
+_META_LI_SELECTOR = "ul.project__meta > li.text-muted"
+
+_DIGIT_RE = re.compile(r"(\d+)")
+
+# Parsed cards kept across scrape cycles; the first listing pages mostly
+# repeat between polls, so identical rows skip the HTML parse entirely
+_CARD_CACHE_SIZE = 2048
+
+# Proposal-count phrases without a digit, checked in order
+_PROP_MARKERS = (
+    ("أضف", 0),     # "أضف أول عرض" — no proposals yet
+    ("واحد", 1),    # "عرض واحد"
+    ("عرضان", 2),
+    ("عرضين", 2),
+)
+
 
 def _parse_proposals_count(text: str) -> int:
     """Extract a numeric proposal count from Arabic proposal text.
@@ -43,13 +65,10 @@ def _parse_proposals_count(text: str) -> int:
     """
     if not text:
         return 0
-    if "أضف" in text:
-        return 0
-    if "واحد" in text:
-        return 1
-    if "عرضان" in text or "عرضين" in text:
-        return 2
-    match = re.search(r"(\d+)", text)
+    for marker, count in _PROP_MARKERS:
+        if marker in text:
+            return count
+    match = _DIGIT_RE.search(text)
     if match:
         return int(match.group(1))
     return 0
@@ -69,6 +88,23 @@ def _text(node: Optional[Node]) -> str:
     return node.text(strip=True)
 
 
+def _first(node: Node, selectors: tuple[str, ...]) -> Optional[Node]:
+    """Return the first match of the first selector that matches anything.
+
+    Args:
+        node: Node (or parser) to search within.
+        selectors: CSS selectors in order of preference.
+
+    Returns:
+        The matched node, or None if no selector matches.
+    """
+    for selector in selectors:
+        found = node.css_first(selector)
+        if found is not None:
+            return found
+    return None
+
+
 def _attr(node: Optional[Node], name: str) -> str:
     """Safely extract an attribute from a selectolax node.
 
@@ -85,6 +121,72 @@ def _attr(node: Optional[Node], name: str) -> str:
     return val if val else ""
 
 
+@lru_cache(maxsize=_CARD_CACHE_SIZE)
+def _extract_fields(
+    rendered: str,
+) -> Optional[tuple[str, str, str, str, str, int]]:
+    """Parse the fields of one listing card from its rendered HTML.
+
+    Pure function of the HTML, so results are cached by content.
+
+    Args:
+        rendered: The card's 'rendered' HTML string.
+
+    Returns:
+        Tuple of (title, href, publisher_name, time_posted,
+        brief_description, proposals_count), or None if the card
+        has no title link.
+    """
+    tree = HTMLParser(rendered)
+
+    # ── Title + URL ──────────────────────────────────
+    title_el = _first(tree, _TITLE_SELECTORS)
+    if title_el is None:
+        return None
+
+    title = _text(title_el)
+    href = _attr(title_el, "href")
+
+    # ── Publisher name ───────────────────────────────
+    pub_el = _first(tree, _PUBLISHER_SELECTORS)
+    publisher_name = _text(pub_el)
+
+    # ── Posted timestamp ─────────────────────────────
+    time_el = tree.css_first("time[datetime]")
+    time_posted = _attr(time_el, "datetime") if time_el else ""
+    if not time_posted:
+        time_el2 = tree.css_first("time")
+        time_posted = _text(time_el2)
+
+    # ── Proposals count ──────────────────────────────
+    proposals_count = 0
+    found = False
+    for li in tree.css(_META_LI_SELECTOR):
+        text = _text(li)
+        if "عرض" in text or "أضف" in text:
+            proposals_count = _parse_proposals_count(text)
+            found = True
+            break
+    # Fallback (slow — walks every <li>): only when the meta list had
+    # no proposals entry and the card mentions proposals somewhere
+    if not found and ("عرض" in rendered or "أضف" in rendered):
+        logger.debug("Proposals not in card meta list, scanning all <li>")
+        for li in tree.css("li"):
+            text = _text(li)
+            if "عرض" in text or "أضف" in text:
+                proposals_count = _parse_proposals_count(text)
+                break
+
+    # ── Brief description ────────────────────────────
+    desc_el = _first(tree, _DESC_SELECTORS)
+    brief_description = _text(desc_el)
+
+    return (
+        title, href, publisher_name, time_posted,
+        brief_description, proposals_count,
+    )
+
+
 class ListScraper:
     """Parses project listings from the XHR JSON endpoint.
 
@@ -96,6 +198,9 @@ class ListScraper:
         config: Scraper configuration with base_url.
     """
 
+    # Set once DEBUG_DIR has been created, shared by all instances
+    _debug_dir_ready = False
+
     def __init__(self, config: ScraperConfig) -> None:
         """Initialize the list scraper.
 
@@ -146,61 +251,16 @@ class ListScraper:
         if not mostaql_id or not rendered:
             return None
 
-        tree = HTMLParser(rendered)
-
-        # ── Title + URL ──────────────────────────────────
-        title_el = (
-            tree.css_first("h2.mrg--bt-reset > a")
-            or tree.css_first("h2 > a")
-            or tree.css_first("a[href*='/projects/']")
-        )
-        if title_el is None:
+        fields = _extract_fields(rendered)
+        if fields is None:
             logger.warning("No title found for listing %s", mostaql_id)
             self._debug_dump_row(rendered, -1)
             return None
 
-        title = _text(title_el)
-        href = _attr(title_el, "href")
+        (title, href, publisher_name, time_posted,
+         brief_description, proposals_count) = fields
         url = href if href.startswith("http") else self.config.base_url + href
 
-        # ── Publisher name ───────────────────────────────
-        pub_el = (
-            tree.css_first("ul.project__meta bdi")
-            or tree.css_first(".project__meta bdi")
-            or tree.css_first("bdi")
-        )
-        publisher_name = _text(pub_el)
-
-        # ── Posted timestamp ─────────────────────────────
-        time_el = tree.css_first("time[datetime]")
-        time_posted = _attr(time_el, "datetime") if time_el else ""
-        if not time_posted:
-            time_el2 = tree.css_first("time")
-            time_posted = _text(time_el2)
-
-        # ── Proposals count ──────────────────────────────
-        proposals_count = 0
-        for li in tree.css("ul.project__meta > li.text-muted"):
-            text = _text(li)
-            if "عرض" in text or "أضف" in text:
-                proposals_count = _parse_proposals_count(text)
-                break
-        # Fallback: look for any element with proposals text
-        if proposals_count == 0:
-            for li in tree.css("li"):
-                text = _text(li)
-                if "عرض" in text or "أضف" in text:
-                    proposals_count = _parse_proposals_count(text)
-                    break
-
-        # ── Brief description ────────────────────────────
-        desc_el = (
-            tree.css_first("p.project__brief a")
-            or tree.css_first("p.project__brief")
-            or tree.css_first(".project__brief")
-        )
-        brief_description = _text(desc_el)
-
         return JobListing(
             mostaql_id=mostaql_id,
             title=title,
@@ -215,14 +275,16 @@ class ListScraper:
         """Save an unparseable HTML row to disk for manual inspection.
 
         Writes to logs/debug/row_{index}.html. Creates the debug
-        directory if it doesn't exist.
+        directory on the first dump.
 
         Args:
             html: Raw HTML string of the failing row.
             index: The index of the row in the collection.
         """
         try:
-            DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+            if not ListScraper._debug_dir_ready:
+                DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+                ListScraper._debug_dir_ready = True
             path = DEBUG_DIR / f"row_{index}.html"
             path.write_text(html, encoding="utf-8")
             logger.debug("Saved debug dump to %s", path)
@@ -233,46 +295,63 @@ class ListScraper:
         self,
         client: MostaqlClient,
         pages: int = 3,
+        concurrency: int = 3,
         **filters: Any,
     ) -> list[JobListing]:
         """Scrape multiple listing pages and return deduplicated jobs.
 
-        Stops early if a page returns 0 projects (end of results).
+        Page 1 is fetched on its own; the remaining pages are fetched in
+        windows of ``concurrency`` pages and processed in page order.
+        Stops at the first page that failed or returned 0 projects (end
+        of results), and no later window is requested after it.
 
         Args:
             client: Active MostaqlClient instance.
             pages: Number of pages to scrape.
+            concurrency: Maximum number of simultaneous page fetches.
             **filters: Optional query filters (category, keyword, etc.).
 
         Returns:
             List of JobListing instances, deduplicated by mostaql_id.
         """
-        seen_ids: set[str] = set()
-        all_jobs: list[JobListing] = []
+        # mostaql_id → first listing seen; dicts keep insertion order
+        seen: dict[str, JobListing] = {}
+
+        first = 1
+        # Page 1 alone, so an outage or empty result costs one request
+        window = 1
+        stopped = False
+        while first <= pages and not stopped:
+            batch = range(first, min(first + window, pages + 1))
+            responses = await asyncio.gather(*(
+                client.get_listing_page(page=page, **filters) for page in batch
+            ))
+            first += len(batch)
+            window = max(1, concurrency)
+
+            for page, json_data in zip(batch, responses):
+                if json_data is None:
+                    logger.warning(
+                        "Failed to fetch listing page %d, stopping", page,
+                    )
+                    stopped = True
+                    break
 
-        for page in range(1, pages + 1):
-            json_data = await client.get_listing_page(page=page, **filters)
-            if json_data is None:
-                logger.warning("Failed to fetch listing page %d, stopping", page)
-                break
+                jobs = self.parse_listing_response(json_data)
+                if not jobs:
+                    logger.info("No projects on page %d, stopping", page)
+                    stopped = True
+                    break
 
-            jobs = self.parse_listing_response(json_data)
-            if not jobs:
-                logger.info("No projects on page %d, stopping", page)
-                break
+                # Deduplicate
+                prev_len = len(seen)
+                for job in jobs:
+                    seen.setdefault(job.mostaql_id, job)
+
+                logger.info(
+                    "Page %d: %d parsed, %d new (total: %d)",
+                    page, len(jobs), len(seen) - prev_len, len(seen),
+                )
 
-            # Deduplicate
-            new_count = 0
-            for job in jobs:
-                if job.mostaql_id not in seen_ids:
-                    seen_ids.add(job.mostaql_id)
-                    all_jobs.append(job)
-                    new_count += 1
-
-            logger.info(
-                "Page %d: %d parsed, %d new (total: %d)",
-                page, len(jobs), new_count, len(all_jobs),
-            )
-
-        logger.info("Listing scrape complete: %d unique jobs", len(all_jobs))
-        return all_jobs
+        logger.info("Listing scrape complete: %d unique jobs", len(seen))
+        return list(seen.values())
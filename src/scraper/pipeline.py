@@ -13,7 +13,7 @@ from typing import Any
 from src.config import AppConfig
 from src.database.db import Database
 from src.database import queries
-from src.database.models import JobListing
+from src.database.models import JobDetail, JobListing
 from src.scraper.client import MostaqlClient
 from src.scraper.list_scraper import ListScraper
 from src.scraper.detail_scraper import DetailScraper
@@ -56,10 +56,10 @@ class ScraperPipeline:
 
         Steps:
           1. Scrape listing pages (configurable number).
-          2. For each job: check DB for duplicates, insert new jobs.
+          2. Check the DB for duplicates in one query, batch-insert new jobs.
           3. Apply quick filter to jobs needing details.
           4. Scrape detail pages for relevant jobs only.
-          5. Insert detail + publisher + proposals into DB.
+          5. Insert details + publishers + proposals into DB in one batch.
           6. Return stats dict.
 
         Args:
@@ -102,7 +102,9 @@ class ScraperPipeline:
                 logger.info("Budget filter: min $%d", min_budget)
 
             listings = await self._list_scraper.scrape_listings(
-                client, pages=pages, **filters,
+                client, pages=pages,
+                concurrency=self.config.scraper.burst_capacity,
+                **filters,
             )
             stats["total_listed"] = len(listings)
             logger.info("Found %d total listings", len(listings))
@@ -110,17 +112,28 @@ class ScraperPipeline:
             # ── Step 2: Deduplicate and insert ───────────
             logger.info("Step 2: Deduplicating against database...")
             new_count = 0
-            for job in listings:
-                try:
-                    exists = await queries.job_exists(self.db, job.mostaql_id)
-                    if not exists:
-                        await queries.insert_job(self.db, job)
-                        new_count += 1
-                except Exception as e:
-                    logger.warning(
-                        "Error inserting job %s: %s", job.mostaql_id, e,
-                    )
-                    stats["errors"] += 1
+            try:
+                existing = await queries.jobs_existing(
+                    self.db, [job.mostaql_id for job in listings],
+                )
+                new_jobs = [j for j in listings if j.mostaql_id not in existing]
+                await queries.insert_jobs(self.db, new_jobs)
+                new_count = len(new_jobs)
+            except Exception as e:
+                # Batch was rolled back; save one by one to isolate the bad row
+                logger.warning(
+                    "Bulk job insert failed (%s), retrying one by one", e,
+                )
+                for job in listings:
+                    try:
+                        if not await queries.job_exists(self.db, job.mostaql_id):
+                            await queries.insert_job(self.db, job)
+                            new_count += 1
+                    except Exception as exc:
+                        logger.warning(
+                            "Error inserting job %s: %s", job.mostaql_id, exc,
+                        )
+                        stats["errors"] += 1
 
             stats["new_jobs"] = new_count
             logger.info(
@@ -141,55 +154,60 @@ class ScraperPipeline:
             stats["passed_filter"] = len(relevant)
             stats["filtered_out"] = len(filtered_out)
 
-            # Build lookup of relevant mostaql_ids → DB rows
-            relevant_ids = {j.mostaql_id for j in relevant}
-            needing_details = [r for r in needing_details if r["mostaql_id"] in relevant_ids]
-
             # Apply detail limit if specified
             if max_details is not None:
-                needing_details = needing_details[:max_details]
+                relevant = relevant[:max_details]
                 logger.info("Limiting to %d detail pages", max_details)
 
             # ── Step 4: Scrape details (filtered) ────────
-            logger.info("Step 4: Scraping detail pages (%d relevant)...", len(needing_details))
+            logger.info("Step 4: Scraping detail pages (%d relevant)...", len(relevant))
             details_scraped = 0
 
-            for i, job_row in enumerate(needing_details, 1):
-                mostaql_id = job_row["mostaql_id"]
-                url = job_row["url"]
+            # The filtered JobListings already carry url and id; no need
+            # to go back to the DB rows
+            items = [(job.url, job.mostaql_id) for job in relevant]
+            details = await self._detail_scraper.scrape_many(
+                client, items, concurrency=self.config.scraper.burst_capacity,
+            )
 
+            collected: list[JobDetail] = []
+            for i, ((_, mostaql_id), detail) in enumerate(zip(items, details), 1):
+                if detail is None:
+                    logger.warning(
+                        "  [%d/%d] Failed to parse detail for %s",
+                        i, len(items), mostaql_id,
+                    )
+                    stats["errors"] += 1
+                    continue
+
+                collected.append(detail)
                 logger.info(
-                    "  [%d/%d] Scraping detail for %s...",
-                    i, len(needing_details), mostaql_id,
+                    "  [%d/%d] ✅ %s — budget: %s, skills: %d, publisher: %s",
+                    i, len(items),
+                    mostaql_id,
+                    detail.budget_raw or "N/A",
+                    len(detail.skills),
+                    detail.publisher.display_name if detail.publisher else "N/A",
                 )
 
-                try:
-                    detail = await self._detail_scraper.scrape_detail(
-                        client, url, mostaql_id,
-                    )
-
-                    if detail is None:
-                        logger.warning("Failed to parse detail for %s", mostaql_id)
+            # ── Step 5: Insert into DB ───────────────────
+            try:
+                await queries.insert_job_details(self.db, collected)
+                details_scraped = len(collected)
+            except Exception as e:
+                # Batch was rolled back; save one by one to isolate the bad row
+                logger.error(
+                    "Bulk detail insert failed (%s), retrying one by one", e,
+                )
+                for detail in collected:
+                    try:
+                        await queries.insert_job_detail(self.db, detail)
+                        details_scraped += 1
+                    except Exception as exc:
+                        logger.error(
+                            "Error saving detail for %s: %s", detail.mostaql_id, exc,
+                        )
                         stats["errors"] += 1
-                        continue
-
-                    # ── Step 5: Insert into DB ───────────
-                    await queries.insert_job_detail(self.db, detail)
-                    details_scraped += 1
-
-                    logger.info(
-                        "  ✅ %s — budget: %s, skills: %d, publisher: %s",
-                        mostaql_id,
-                        detail.budget_raw or "N/A",
-                        len(detail.skills),
-                        detail.publisher.display_name if detail.publisher else "N/A",
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        "Error scraping detail for %s: %s", mostaql_id, e,
-                    )
-                    stats["errors"] += 1
 
             stats["details_scraped"] = details_scraped
 
@@ -8,6 +8,8 @@ profile to skip obviously irrelevant jobs early.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any
 
 from src.config import FreelancerProfile
@@ -16,6 +18,12 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
+# Joins per-job texts in filter_batch; _normalize folds every whitespace
+# run to a space, so no needle can contain it and match across two jobs
+_BATCH_SEP = "\n"
+
 # ── Hardcoded irrelevant signals ─────────────────────────
 # (Arabic term, English label, skill_exception — if user has this skill, skip the filter)
 _IRRELEVANT_SIGNALS: list[tuple[str, str, str | None]] = [
@@ -77,21 +85,30 @@ _SKILL_ALIASES: dict[str, list[str]] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def _normalize(text: str) -> str:
     """Normalize text for matching: lowercase, strip extra whitespace.
 
     Also strips the Arabic definite article 'ال' prefix from words
     for better matching (e.g., "البرمجة" → "برمجة").
 
+    Cached: jobs the filter rejects stay in the needing-details queue,
+    so the same titles and descriptions come back every cycle.
+
     Args:
         text: Raw text to normalize.
 
     Returns:
         Lowercase, whitespace-collapsed text.
     """
-    text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
+    return _WS_RE.sub(" ", text.lower().strip())
+
+
+# _IRRELEVANT_SIGNALS with the signal and exception skill pre-normalized
+_IRRELEVANT_SIGNALS_NORM: list[tuple[str, str, str | None]] = [
+    (_normalize(signal), label, exception_skill and _normalize(exception_skill))
+    for signal, label, exception_skill in _IRRELEVANT_SIGNALS
+]
 
 
 def _strip_arabic_article(word: str) -> str:
@@ -123,31 +140,73 @@ def _expand_skill(skill: str) -> list[str]:
     return [key]
 
 
-def _text_contains(haystack: str, needle: str) -> bool:
-    """Check if normalized haystack contains the needle.
+def _with_stripped(needles: list[str]) -> list[tuple[str, str]]:
+    """Pair each needle with its article-stripped search form.
+
+    ``"البرمجة"`` matches wherever ``"برمجة"`` does, and a needle is
+    found wherever its stripped form is, so only the stripped form is
+    ever searched for. Stripping happens once here, not per job.
+
+    Args:
+        needles: Normalized terms, in priority order.
+
+    Returns:
+        List of (needle, search_form) pairs in the same order.
+    """
+    return [(n, _strip_arabic_article(n)) for n in needles]
+
+
+def _compile_rules(
+    rules: dict[str, list[tuple[str, str]]],
+) -> re.Pattern[str] | None:
+    """Compile several rules into one alternation with a group per rule.
+
+    Each rule becomes a named group of its search forms, tried in dict
+    order, so ``match.lastgroup`` names the rule that matched and
+    ``match.group()`` the form that was found.
+
+    Args:
+        rules: Rule name → (needle, search_form) pairs from _with_stripped.
+
+    Returns:
+        Compiled pattern, or None if no rule has any terms.
+    """
+    groups: list[str] = []
+    for name, terms in rules.items():
+        if terms:
+            alternatives = dict.fromkeys(re.escape(form) for _, form in terms)
+            groups.append(f"(?P<{name}>{'|'.join(alternatives)})")
+    if not groups:
+        return None
+    return re.compile("|".join(groups))
+
 
-    Handles Arabic article stripping by checking both the
-    original and article-stripped versions.
+def _first_hits(
+    pattern: re.Pattern[str] | None, texts: list[str]
+) -> dict[int, re.Match[str]]:
+    """Find each text's leftmost match with a single scan.
+
+    The texts are joined by ``_BATCH_SEP`` and scanned once; each hit
+    is mapped back to its text by start offset.
 
     Args:
-        haystack: Normalized text to search in.
-        needle: Normalized term to search for.
+        pattern: Compiled rule pattern, or None if there are no terms.
+        texts: Normalized per-job texts.
 
     Returns:
-        True if needle is found in haystack.
+        Index into texts → its leftmost match, for texts with any match.
     """
-    if needle in haystack:
-        return True
-    # Try stripping Arabic article from both sides
-    stripped_needle = _strip_arabic_article(needle)
-    if stripped_needle != needle and stripped_needle in haystack:
-        return True
-    # Try matching against article-stripped words in haystack
-    for word in haystack.split():
-        stripped_word = _strip_arabic_article(word)
-        if stripped_word == stripped_needle or stripped_word == needle:
-            return True
-    return False
+    hits: dict[int, re.Match[str]] = {}
+    if pattern is None or not texts:
+        return hits
+    offsets: list[int] = []
+    pos = 0
+    for text in texts:
+        offsets.append(pos)
+        pos += len(text) + len(_BATCH_SEP)
+    for m in pattern.finditer(_BATCH_SEP.join(texts)):
+        hits.setdefault(bisect_right(offsets, m.start()) - 1, m)
+    return hits
 
 
 class QuickFilter:
@@ -189,7 +248,8 @@ class QuickFilter:
             raw = profile.skills.get(level, [])
             for skill in raw:
                 all_skills.extend(_expand_skill(skill))
-        self._all_skills = list(set(all_skills))
+        # Deduplicate in profile order so match reasons are the same every run
+        self._all_skills = list(dict.fromkeys(all_skills))
 
         # Pre-compute set of user skills for exception checking
         self._user_skill_set: set[str] = set()
@@ -197,6 +257,39 @@ class QuickFilter:
             for skill in profile.skills.get(level, []):
                 self._user_skill_set.add(_normalize(skill))
 
+        # Irrelevant signals the user's skills don't exempt; the skill set
+        # is fixed per profile, so exceptions are resolved once here
+        self._irrelevant_signals: list[str] = []
+        self._irrelevant_labels: dict[str, str] = {}
+        for signal_norm, label, exception_skill in _IRRELEVANT_SIGNALS_NORM:
+            if exception_skill and exception_skill in self._user_skill_set:
+                continue
+            self._irrelevant_signals.append(signal_norm)
+            self._irrelevant_labels.setdefault(signal_norm, label)
+
+        # Two merged alternations: rules 1–2 reject, rules 3–4 accept.
+        # Most jobs match neither, so they cost two scans in total.
+        reject_rules = {
+            "negative": _with_stripped(self._negative_keywords),
+            "irrelevant": _with_stripped(self._irrelevant_signals),
+        }
+        accept_rules = {
+            "skill": _with_stripped(self._all_skills),
+            "positive": _with_stripped(self._positive_keywords),
+        }
+        self._reject_re = _compile_rules(reject_rules)
+        self._accept_re = _compile_rules(accept_rules)
+        # Every signal exempted and no profile terms: nothing to match, so
+        # every job passes without being normalized or scanned
+        self._any_rules = self._reject_re is not None or self._accept_re is not None
+
+        # (rule, matched search form) → the needle to report
+        self._needles: dict[tuple[str, str], str] = {}
+        for rules in (reject_rules, accept_rules):
+            for name, terms in rules.items():
+                for needle, form in terms:
+                    self._needles.setdefault((name, form), needle)
+
         logger.debug(
             "QuickFilter initialized: %d neg keywords, %d pos keywords, %d skills",
             len(self._negative_keywords),
@@ -220,34 +313,57 @@ class QuickFilter:
         Returns:
             Tuple of (is_relevant, reason_string).
         """
-        # Combine searchable text
-        title_norm = _normalize(job.title)
-        desc_norm = _normalize(job.brief_description)
-        combined = f"{title_norm} {desc_norm}"
-
-        # ── Rule 1: Negative keyword check ───────────────
-        for kw in self._negative_keywords:
-            if _text_contains(combined, kw):
-                return False, f"Negative keyword: {kw}"
-
-        # ── Rule 2: Irrelevant category check ────────────
-        for signal, label, exception_skill in _IRRELEVANT_SIGNALS:
-            signal_norm = _normalize(signal)
-            if _text_contains(combined, signal_norm):
-                # Check if user has the exception skill
-                if exception_skill and _normalize(exception_skill) in self._user_skill_set:
-                    continue
-                return False, f"Irrelevant category: {label}"
-
-        # ── Rule 3: Positive skill match ─────────────────
-        for skill in self._all_skills:
-            if _text_contains(combined, skill):
-                return True, f"Skill match: {skill}"
-
-        # ── Rule 4: Positive keyword match ───────────────
-        for kw in self._positive_keywords:
-            if _text_contains(combined, kw):
-                return True, f"Keyword match: {kw}"
+        if not self._any_rules:
+            return True, "Passed filters"
+        combined = self._combined_text(job)
+        rejected = self._reject_re.search(combined) if self._reject_re else None
+        accepted = None
+        # A reject hit decides the job; skip the accept scan
+        if rejected is None and self._accept_re:
+            accepted = self._accept_re.search(combined)
+        return self._decide(rejected, accepted)
+
+    @staticmethod
+    def _combined_text(job: JobListing) -> str:
+        """Build the normalized text the rules are matched against.
+
+        Args:
+            job: A JobListing from the listing scraper.
+
+        Returns:
+            Normalized title and brief description joined by a space.
+        """
+        return f"{_normalize(job.title)} {_normalize(job.brief_description)}"
+
+    def _decide(
+        self,
+        rejected: re.Match[str] | None,
+        accepted: re.Match[str] | None,
+    ) -> tuple[bool, str]:
+        """Apply rule precedence to the reject and accept pattern hits.
+
+        Args:
+            rejected: Leftmost match of the reject pattern, if any.
+            accepted: Leftmost match of the accept pattern, if any.
+
+        Returns:
+            Tuple of (is_relevant, reason_string).
+        """
+        if rejected is not None:
+            term = self._needles[rejected.lastgroup, rejected.group()]
+            # ── Rule 1: Negative keyword check ───────────
+            if rejected.lastgroup == "negative":
+                return False, f"Negative keyword: {term}"
+            # ── Rule 2: Irrelevant category check ────────
+            return False, f"Irrelevant category: {self._irrelevant_labels[term]}"
+
+        if accepted is not None:
+            term = self._needles[accepted.lastgroup, accepted.group()]
+            # ── Rule 3: Positive skill match ─────────────
+            if accepted.lastgroup == "skill":
+                return True, f"Skill match: {term}"
+            # ── Rule 4: Positive keyword match ───────────
+            return True, f"Keyword match: {term}"
 
         # ── Rule 5: Default pass ─────────────────────────
         # Mostaql API already filters by category + budget,
@@ -270,8 +386,20 @@ class QuickFilter:
         relevant: list[JobListing] = []
         filtered_out: list[JobListing] = []
 
-        for job in jobs:
-            is_rel, reason = self.is_relevant(job)
+        # One scan per pattern over the whole batch; rejected jobs are
+        # already decided, so only the rest are scanned for accepts
+        texts = [self._combined_text(job) for job in jobs] if self._any_rules else []
+        rejected = _first_hits(self._reject_re, texts)
+        pending = [i for i in range(len(texts)) if i not in rejected]
+        accepted = {
+            pending[k]: m
+            for k, m in _first_hits(
+                self._accept_re, [texts[i] for i in pending]
+            ).items()
+        }
+
+        for idx, job in enumerate(jobs):
+            is_rel, reason = self._decide(rejected.get(idx), accepted.get(idx))
             if is_rel:
                 relevant.append(job)
                 logger.debug(
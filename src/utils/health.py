@@ -9,14 +9,15 @@ Usage:
     monitor.record_cycle({"duration": 5.0, "new_jobs": 10, "errors": 0})
     status = monitor.get_status()
     alert = monitor.should_alert(circuit_breakers=[cb1, cb2])
+    monitor.close()
 """
 
 from __future__ import annotations
 
+import logging
 import os
 import time
 from collections import deque
-from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
@@ -24,24 +25,30 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Window for the recent error/cycle counts
+_RECENT_WINDOW_SECONDS = 3600
 
-@dataclass
-class _CycleRecord:
-    """Record of a single scan cycle."""
-    timestamp: float
-    duration: float
-    new_jobs: int
-    analyzed: int
-    alerts_sent: int
-    errors: int
+# Cycles averaged for avg_cycle_duration
+_AVG_DURATION_CYCLES = 20
 
+# RSS barely moves between the status, alert and log calls of one cycle
+_MEMORY_CACHE_TTL = 2.0
 
-@dataclass
-class _ErrorRecord:
-    """Record of a single error event."""
-    timestamp: float
-    component: str
-    error: str
+# ── Alert message templates ──────────────────────────────
+_ALERT_HEADER = "⚠️ تنبيه النظام:\n"
+_ALERT_ERROR_RATE = "معدل الأخطاء مرتفع: {errors}/{cycles} ({pct:.0f}%)"
+_ALERT_STALLED = "لم يتم فحص ناجح منذ {mins} دقيقة"
+_ALERT_MEMORY = "استخدام ذاكرة مرتفع: {mb:.0f}MB"
+_ALERT_SERVICE_DOWN = "خدمة {name} غير متاحة"
+
+# Bytes read from /proc/self/statm — seven page counts fit comfortably
+_STATM_READ_SIZE = 128
+
+# Page size in MB for /proc/self/statm; None where sysconf is unavailable
+try:
+    _PAGE_SIZE_MB: Optional[float] = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE_MB = None
 
 
 class HealthMonitor:
@@ -61,11 +68,17 @@ class HealthMonitor:
             max_history: Maximum number of cycle/error records to keep.
         """
         self.start_time = time.monotonic()
-        self._start_datetime = datetime.now()
-
-        # Bounded history
-        self._cycles: deque[_CycleRecord] = deque(maxlen=max_history)
-        self._errors: deque[_ErrorRecord] = deque(maxlen=max_history)
+        # Formatted once; get_status returns it as is
+        self._started_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        # Bounded history, one column per field that is read back.
+        # Timestamps expire from the left once they leave the last hour,
+        # so len() is the recent count.
+        self._cycles_1h: deque[float] = deque(maxlen=max_history)
+        self._errors_1h: deque[float] = deque(maxlen=max_history)
+        self._durations: deque[float] = deque(
+            maxlen=min(max_history, _AVG_DURATION_CYCLES),
+        )
 
         # Aggregate counters (never reset)
         self.total_cycles = 0
@@ -79,6 +92,30 @@ class HealthMonitor:
         self.last_cycle_time: Optional[float] = None
         self.last_cycle_duration: float = 0.0
 
+        # Last RSS reading and when it was taken
+        self._mem_cache_ts = float("-inf")
+        self._mem_cache_mb = 0.0
+        # /proc/self/statm stays open and is re-read with pread
+        self._statm_fd = self._open_statm()
+
+    def close(self) -> None:
+        """Close the /proc/self/statm descriptor if one is open.
+
+        Memory readings fall back to getrusage afterwards. Safe to call
+        more than once.
+        """
+        fd = getattr(self, "_statm_fd", None)
+        self._statm_fd = None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __del__(self) -> None:
+        """Backstop for monitors that were never closed."""
+        self.close()
+
     def record_cycle(self, stats: dict[str, Any]) -> None:
         """Record stats from a completed scan cycle.
 
@@ -87,26 +124,20 @@ class HealthMonitor:
                    alerts_sent, errors, tokens_used.
         """
         now = time.monotonic()
-        record = _CycleRecord(
-            timestamp=now,
-            duration=stats.get("duration", 0.0),
-            new_jobs=stats.get("new_jobs", 0),
-            analyzed=stats.get("analyzed", 0),
-            alerts_sent=stats.get("alerts_sent", 0),
-            errors=stats.get("errors", 0),
-        )
-        self._cycles.append(record)
+        duration = stats.get("duration", 0.0)
+        self._cycles_1h.append(now)
+        self._durations.append(duration)
 
         # Update aggregates
         self.total_cycles += 1
-        self.total_jobs += record.new_jobs
-        self.total_analyzed += record.analyzed
-        self.total_alerts += record.alerts_sent
-        self.total_errors += record.errors
+        self.total_jobs += stats.get("new_jobs", 0)
+        self.total_analyzed += stats.get("analyzed", 0)
+        self.total_alerts += stats.get("alerts_sent", 0)
+        self.total_errors += stats.get("errors", 0)
         self.total_tokens += stats.get("tokens_used", 0)
 
         self.last_cycle_time = now
-        self.last_cycle_duration = record.duration
+        self.last_cycle_duration = duration
 
         if self.total_cycles % 10 == 0:
             self._log_memory()
@@ -116,14 +147,13 @@ class HealthMonitor:
 
         Args:
             component: Component name (scraper, gemini, groq, telegram).
-            error: Error description.
+            error: Error description, included in the debug log.
         """
-        self._errors.append(_ErrorRecord(
-            timestamp=time.monotonic(),
-            component=component,
-            error=error[:200],
-        ))
-        logger.debug("Health: error recorded for %s", component)
+        self._errors_1h.append(time.monotonic())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Health: error recorded for %s: %s", component, error[:200],
+            )
 
     def get_status(self) -> dict[str, Any]:
         """Get current system health status.
@@ -135,25 +165,16 @@ class HealthMonitor:
         uptime_s = now - self.start_time
 
         # Error rate in last hour
-        one_hour_ago = now - 3600
-        recent_errors = sum(
-            1 for e in self._errors if e.timestamp > one_hour_ago
-        )
-        recent_cycles = sum(
-            1 for c in self._cycles if c.timestamp > one_hour_ago
-        )
+        recent_errors, recent_cycles = self._recent_counts(now)
         error_rate = (
             recent_errors / max(recent_cycles, 1) * 100
             if recent_cycles > 0 else 0.0
         )
 
         # Average cycle duration (last 20)
-        recent_durations = [
-            c.duration for c in list(self._cycles)[-20:]
-        ]
         avg_duration = (
-            sum(recent_durations) / len(recent_durations)
-            if recent_durations else 0.0
+            sum(self._durations) / len(self._durations)
+            if self._durations else 0.0
         )
 
         # Time since last cycle
@@ -167,7 +188,7 @@ class HealthMonitor:
         return {
             "uptime": self._format_uptime(uptime_s),
             "uptime_seconds": uptime_s,
-            "started_at": self._start_datetime.strftime("%Y-%m-%d %H:%M"),
+            "started_at": self._started_at,
             "total_cycles": self.total_cycles,
             "total_jobs": self.total_jobs,
             "total_analyzed": self.total_analyzed,
@@ -198,53 +219,92 @@ class HealthMonitor:
         alerts: list[str] = []
 
         # Error rate > 50% in last hour
-        one_hour_ago = now - 3600
-        recent_errors = sum(
-            1 for e in self._errors if e.timestamp > one_hour_ago
-        )
-        recent_cycles = sum(
-            1 for c in self._cycles if c.timestamp > one_hour_ago
-        )
-        if recent_cycles >= 3 and recent_errors / max(recent_cycles, 1) > 0.5:
-            alerts.append(
-                f"معدل الأخطاء مرتفع: {recent_errors}/{recent_cycles} "
-                f"({recent_errors/recent_cycles*100:.0f}%)"
-            )
+        recent_errors, recent_cycles = self._recent_counts(now)
+        if recent_cycles >= 3 and recent_errors / recent_cycles > 0.5:
+            alerts.append(_ALERT_ERROR_RATE.format(
+                errors=recent_errors, cycles=recent_cycles,
+                pct=recent_errors / recent_cycles * 100,
+            ))
 
         # No successful cycle in 30 minutes
         if self.last_cycle_time:
             since_last = now - self.last_cycle_time
             if since_last > 1800 and self.total_cycles > 0:
                 mins = int(since_last / 60)
-                alerts.append(f"لم يتم فحص ناجح منذ {mins} دقيقة")
+                alerts.append(_ALERT_STALLED.format(mins=mins))
 
         # Memory > 800MB
         memory_mb = self._get_memory_mb()
         if memory_mb > 800:
-            alerts.append(f"استخدام ذاكرة مرتفع: {memory_mb:.0f}MB")
+            alerts.append(_ALERT_MEMORY.format(mb=memory_mb))
 
         # Circuit breakers
         if circuit_breakers:
             for cb in circuit_breakers:
                 if cb.state == "OPEN" and not cb.has_alerted:
-                    alerts.append(f"خدمة {cb.name} غير متاحة")
+                    alerts.append(_ALERT_SERVICE_DOWN.format(name=cb.name))
                     cb.mark_alerted()
 
         if not alerts:
             return None
 
-        return "⚠️ تنبيه النظام:\n" + "\n".join(f"• {a}" for a in alerts)
+        return _ALERT_HEADER + "\n".join(f"• {a}" for a in alerts)
+
+    def _recent_counts(self, now: float) -> tuple[int, int]:
+        """Count errors and cycles recorded in the last hour.
+
+        Args:
+            now: Current time.monotonic() reading.
+
+        Returns:
+            Tuple of (recent_errors, recent_cycles).
+        """
+        self._expire_hour(now)
+        return len(self._errors_1h), len(self._cycles_1h)
+
+    def _expire_hour(self, now: float) -> None:
+        """Drop recent-window timestamps older than one hour.
+
+        Args:
+            now: Current time.monotonic() reading.
+        """
+        cutoff = now - _RECENT_WINDOW_SECONDS
+        for timestamps in (self._cycles_1h, self._errors_1h):
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
 
     def _get_memory_mb(self) -> float:
-        """Get current process RSS memory in MB."""
+        """Get current process RSS memory in MB, cached for a few seconds."""
+        now = time.monotonic()
+        if now - self._mem_cache_ts < _MEMORY_CACHE_TTL:
+            return self._mem_cache_mb
+        self._mem_cache_mb = self._read_memory_mb()
+        self._mem_cache_ts = now
+        return self._mem_cache_mb
+
+    @staticmethod
+    def _open_statm() -> Optional[int]:
+        """Open /proc/self/statm for repeated reads.
+
+        Returns:
+            File descriptor, or None where statm or pread is unavailable.
+        """
+        if _PAGE_SIZE_MB is None or not hasattr(os, "pread"):
+            return None
         try:
-            # /proc/self/status is most reliable on Linux
-            with open("/proc/self/status") as f:
-                for line in f:
-                    if line.startswith("VmRSS:"):
-                        return int(line.split()[1]) / 1024  # kB → MB
-        except (FileNotFoundError, ValueError, IndexError):
-            pass
+            return os.open("/proc/self/statm", os.O_RDONLY)
+        except OSError:
+            return None
+
+    def _read_memory_mb(self) -> float:
+        """Read current process RSS memory in MB."""
+        if self._statm_fd is not None:
+            try:
+                # /proc/self/statm: one line of page counts, RSS second
+                data = os.pread(self._statm_fd, _STATM_READ_SIZE, 0)
+                return int(data.split()[1]) * _PAGE_SIZE_MB
+            except (OSError, ValueError, IndexError):
+                pass
 
         try:
             import resource
@@ -258,12 +318,12 @@ class HealthMonitor:
     def _log_memory(self) -> None:
         """Log current memory usage."""
         mb = self._get_memory_mb()
+        recent_errors, _ = self._recent_counts(time.monotonic())
         logger.info(
             "Health check [cycle %d]: RSS=%.1fMB, errors_1h=%d, "
             "total_jobs=%d, total_analyzed=%d",
             self.total_cycles, mb,
-            sum(1 for e in self._errors
-                if e.timestamp > time.monotonic() - 3600),
+            recent_errors,
             self.total_jobs, self.total_analyzed,
         )
 
@@ -1,7 +1,7 @@
 """Mostaql Notifier — Logging Setup.
 
 Provides a centralized logging configuration with colored console output
-and rotating file handler. All modules should use get_logger() to obtain
+and a batched rotating file handler. All modules should use get_logger() to obtain
 a named logger instance.
 """
 
@@ -9,14 +9,18 @@ from __future__ import annotations
 
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Optional
 
 # ── Constants ─────────────────────────────────────────────
 LOG_DIR = Path(__file__).resolve().parent.parent.parent / "logs"
 LOG_FILE = LOG_DIR / "mostaql_notifier.log"
 MAX_BYTES = 10 * 1024 * 1024  # 10 MB
 BACKUP_COUNT = 5
+LOG_BUFFER_CAPACITY = 256  # records held before a file write
+LOG_FLUSH_INTERVAL = 5.0  # seconds between background flushes of the buffer
 
 # ── ANSI Color Codes ─────────────────────────────────────
 COLORS = {
@@ -32,7 +36,49 @@ RESET = "\033[0m"
 _initialized = False
 
 
-class ColoredFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within one second.
+
+    With a second-resolution ``datefmt`` the timestamp string only
+    changes once per second, so the localtime + strftime pair is skipped
+    for every other record in that second. Without a ``datefmt`` the
+    default format includes milliseconds and is never cached.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter with an empty timestamp cache.
+
+        Args:
+            *args: Positional arguments for logging.Formatter.
+            **kwargs: Keyword arguments for logging.Formatter.
+        """
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, text) — one tuple so threads never see a torn update
+        self._time_cache: tuple[int, Optional[str], str] = (-1, None, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Format the record's creation time, cached per second.
+
+        Args:
+            record: The log record being formatted.
+            datefmt: strftime format, or None for the default.
+
+        Returns:
+            Formatted timestamp string.
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_fmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_fmt:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, datefmt, text)
+        return text
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter that adds ANSI colors to console log output.
 
     Colors are applied to the log level name and timestamp for better
@@ -54,12 +100,106 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class BatchedFileHandler(MemoryHandler):
+    """Buffers records and writes each batch to a rotating file at once.
+
+    A stock MemoryHandler replays its buffer through ``target.handle()``,
+    and RotatingFileHandler seeks and flushes after every record, so it
+    saves no writes. This handler formats the whole batch itself and
+    writes it to the target's stream in one call, checking for rollover
+    once per batch.
+
+    A batch is written when the buffer is full, on a record at or above
+    ``flush_level``, and every ``flush_interval`` seconds from a daemon
+    thread, so records logged before an idle stretch still reach the file.
+    Buffered records are written on close, which logging.shutdown() does
+    at exit.
+    """
+
+    def __init__(
+        self,
+        target: RotatingFileHandler,
+        capacity: int = LOG_BUFFER_CAPACITY,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            target: Rotating file handler that owns the stream and formatter.
+            capacity: Number of records buffered before a write.
+            flush_level: Records at or above this level write immediately.
+            flush_interval: Seconds between background flushes.
+        """
+        super().__init__(capacity, flushLevel=flush_level, target=target)
+        self.flush_interval = flush_interval
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the background flusher, then write what is still buffered."""
+        self._stop_flusher.set()
+        super().close()
+
+    def flush(self) -> None:
+        """Format the buffered records and write them in a single call."""
+        with self.lock:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            lines = []
+            for record in self.buffer:
+                if record.levelno < target.level or not target.filter(record):
+                    continue
+                try:
+                    lines.append(target.format(record) + target.terminator)
+                except Exception:
+                    target.handleError(record)
+            last = self.buffer[-1]
+            self.buffer.clear()
+            if lines:
+                self._write(target, "".join(lines), last)
+
+    @staticmethod
+    def _write(
+        target: RotatingFileHandler, text: str, record: logging.LogRecord
+    ) -> None:
+        """Write one batch to the target file, rolling it over first if needed.
+
+        Args:
+            target: The rotating file handler to write through.
+            text: Formatted batch, one record per line.
+            record: Record reported to handleError if the write fails.
+        """
+        with target.lock:
+            try:
+                if target.stream is None:
+                    target.stream = target._open()
+                if target.maxBytes > 0:
+                    target.stream.seek(0, 2)
+                    if target.stream.tell() + len(text) >= target.maxBytes:
+                        target.doRollover()
+                target.stream.write(text)
+                target.stream.flush()
+            except Exception:
+                target.handleError(record)
+
+
 def _setup_logging() -> None:
     """Initialize the global logging configuration.
 
     Sets up two handlers on the root logger:
     - Console handler: INFO level with colored timestamps.
-    - Rotating file handler: DEBUG level, 10MB max, 5 backups.
+    - Rotating file handler: DEBUG level, 10MB max, 5 backups, written
+      in batches through BatchedFileHandler.
 
     This function is idempotent — calling it multiple times has no effect
     after the first initialization.
@@ -93,12 +233,14 @@ def _setup_logging() -> None:
         encoding="utf-8",
     )
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
+    file_formatter = CachedTimeFormatter(
         fmt="%(asctime)s │ %(levelname)-8s │ %(name)s │ %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    batched_handler = BatchedFileHandler(file_handler)
+    batched_handler.setLevel(logging.DEBUG)
+    root_logger.addHandler(batched_handler)
 
     _initialized = True
 
@@ -1,14 +1,16 @@
 """Mostaql Notifier — Async Rate Limiter.
 
-Implements a token-bucket rate limiter for controlling the frequency
-of async operations (API calls, web requests, etc.). Thread-safe
-via asyncio.Lock.
+Implements a sliding-window limiter and a continuous-refill token
+bucket for controlling the frequency of async operations (API calls,
+web requests, etc.). Both are coroutine-safe via asyncio.Lock.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
+from array import array
 
 from src.utils.logger import get_logger
 
@@ -19,7 +21,9 @@ class AsyncRateLimiter:
     """Async rate limiter using the sliding-window token bucket algorithm.
 
     Controls the rate of async operations by tracking timestamps of
-    recent calls and sleeping until a slot becomes available.
+    recent calls and sleeping until a slot becomes available. The
+    timestamps live in a fixed ring of ``max_calls`` floats, so no
+    call allocates.
 
     Attributes:
         max_calls: Maximum number of calls allowed within the time window.
@@ -35,7 +39,11 @@ class AsyncRateLimiter:
         """
         self.max_calls = max_calls
         self.period = period_seconds
-        self._timestamps: list[float] = []
+        # Ring of call timestamps: _count live entries starting at _head,
+        # oldest first
+        self._ring = array("d", [0.0]) * max_calls
+        self._head = 0
+        self._count = 0
         self._lock = asyncio.Lock()
 
         logger.debug(
@@ -44,14 +52,19 @@ class AsyncRateLimiter:
             period_seconds,
         )
 
-    def _cleanup_expired(self) -> None:
-        """Remove timestamps that have fallen outside the current window.
+    def _cleanup_expired(self, now: float) -> None:
+        """Drop timestamps that have fallen outside the current window.
 
-        Called internally before checking available capacity.
+        Called internally before checking available capacity. Timestamps
+        are written in order, so expired ones are always at the head.
+
+        Args:
+            now: Current time.monotonic() reading.
         """
-        now = time.monotonic()
         cutoff = now - self.period
-        self._timestamps = [ts for ts in self._timestamps if ts > cutoff]
+        while self._count and self._ring[self._head] <= cutoff:
+            self._head = (self._head + 1) % self.max_calls
+            self._count -= 1
 
     @property
     def available_slots(self) -> int:
@@ -63,49 +76,52 @@ class AsyncRateLimiter:
         Returns:
             Number of remaining slots in the current window.
         """
-        self._cleanup_expired()
-        return max(0, self.max_calls - len(self._timestamps))
+        self._cleanup_expired(time.monotonic())
+        return max(0, self.max_calls - self._count)
 
     async def acquire(self) -> None:
         """Acquire a rate-limit slot, blocking until one is available.
 
         If all slots are in use, this coroutine sleeps until the oldest
-        timestamp expires and a new slot opens up.
+        timestamp expires and a new slot opens up. Concurrent callers wait
+        on the lock meanwhile and are served in arrival order.
 
         This method is safe to call from multiple concurrent coroutines.
         """
         async with self._lock:
             while True:
-                self._cleanup_expired()
+                now = time.monotonic()
+                self._cleanup_expired(now)
 
-                if len(self._timestamps) < self.max_calls:
+                if self._count < self.max_calls:
                     # Slot available — record this call
-                    self._timestamps.append(time.monotonic())
-                    logger.debug(
-                        "Rate limit slot acquired (%d/%d used)",
-                        len(self._timestamps),
-                        self.max_calls,
-                    )
+                    tail = (self._head + self._count) % self.max_calls
+                    self._ring[tail] = now
+                    self._count += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Rate limit slot acquired (%d/%d used)",
+                            self._count,
+                            self.max_calls,
+                        )
                     return
 
                 # No slots available — calculate wait time
-                oldest = self._timestamps[0]
-                wait_time = oldest + self.period - time.monotonic()
+                oldest = self._ring[self._head]
+                wait_time = oldest + self.period - now
 
                 if wait_time > 0:
-                    logger.debug(
-                        "Rate limit reached (%d/%d). Waiting %.2f seconds...",
-                        len(self._timestamps),
-                        self.max_calls,
-                        wait_time,
-                    )
-                    # Release lock while sleeping so other coroutines
-                    # don't deadlock
-                    self._lock.release()
-                    try:
-                        await asyncio.sleep(wait_time)
-                    finally:
-                        await self._lock.acquire()
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Rate limit reached (%d/%d). Waiting %.2f seconds...",
+                            self._count,
+                            self.max_calls,
+                            wait_time,
+                        )
+                    # Sleep holding the lock: no slot can open before the
+                    # oldest timestamp expires, and the lock queues the
+                    # other callers in FIFO order without waking them
+                    await asyncio.sleep(wait_time)
 
     async def __aenter__(self) -> "AsyncRateLimiter":
         """Support async context manager usage.
@@ -131,3 +147,85 @@ class AsyncRateLimiter:
             String showing max_calls and period configuration.
         """
         return f"AsyncRateLimiter(max_calls={self.max_calls}, period={self.period}s)"
+
+
+class AsyncTokenBucket:
+    """Async token-bucket limiter with continuous refill.
+
+    Tokens accrue at ``rate`` per second up to ``capacity``; every
+    acquire spends one token, sleeping just long enough for the next
+    token when the bucket is empty. Unlike the sliding window this
+    keeps no per-call history.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held (burst size).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second (sustained calls per second).
+            capacity: Burst size. Defaults to ``rate``.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Credit tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last) * self.rate,
+        )
+        self._last = now
+
+    @property
+    def available_tokens(self) -> float:
+        """Return the current token count without acquiring the lock.
+
+        Returns:
+            Tokens currently in the bucket (may be fractional).
+        """
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available.
+
+        The lock is held while waiting so callers are served in order.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        """Support async context manager usage.
+
+        Returns:
+            The bucket after taking a token.
+        """
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the async context manager (no-op).
+
+        Args:
+            *args: Exception info (unused).
+        """
+        pass
+
+    def __repr__(self) -> str:
+        """Return a developer-friendly string representation.
+
+        Returns:
+            String showing rate and capacity configuration.
+        """
+        return f"AsyncTokenBucket(rate={self.rate}/s, capacity={self.capacity})"
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import logging
 import time
 from typing import Any, Callable, Optional, Sequence, Type
 
@@ -55,12 +56,19 @@ class CircuitBreaker:
     OPEN = "OPEN"
     HALF_OPEN = "HALF_OPEN"
 
+    __slots__ = (
+        "name", "failure_threshold", "cooldown_seconds", "half_open_cooldown",
+        "excluded_exceptions", "_state", "_failure_count",
+        "_last_failure_time", "_opened_at", "_total_trips", "_alerted",
+    )
+
     def __init__(
         self,
         name: str,
         failure_threshold: int = 5,
         cooldown_seconds: float = 300.0,
         half_open_cooldown: float = 600.0,
+        excluded_exceptions: Sequence[Type[BaseException]] = (),
     ) -> None:
         """Initialize the circuit breaker.
 
@@ -69,11 +77,14 @@ class CircuitBreaker:
             failure_threshold: Consecutive failures before opening.
             cooldown_seconds: Seconds to stay open before half-open.
             half_open_cooldown: Seconds to stay open if half-open test fails.
+            excluded_exceptions: Exception types that are re-raised without
+                counting as failures (client errors, signaled throttling).
         """
         self.name = name
         self.failure_threshold = failure_threshold
         self.cooldown_seconds = cooldown_seconds
         self.half_open_cooldown = half_open_cooldown
+        self.excluded_exceptions = tuple(excluded_exceptions)
 
         self._state = self.CLOSED
         self._failure_count = 0
@@ -82,13 +93,32 @@ class CircuitBreaker:
         self._total_trips = 0
         self._alerted = False  # Track if we've sent an alert for current open state
 
+    def _maybe_advance(self, now: float) -> None:
+        """Move OPEN to HALF_OPEN once the cooldown has expired.
+
+        Args:
+            now: Current time.monotonic() reading.
+        """
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown_seconds:
+            self._state = self.HALF_OPEN
+
+    def _remaining(self, now: float) -> float:
+        """Seconds left in the open cooldown as of ``now``.
+
+        Args:
+            now: Current time.monotonic() reading.
+
+        Returns:
+            Remaining cooldown, or 0.0 if the circuit is not OPEN.
+        """
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown_seconds - (now - self._opened_at))
+
     @property
     def state(self) -> str:
         """Current circuit state, accounting for cooldown expiry."""
-        if self._state == self.OPEN:
-            elapsed = time.monotonic() - self._opened_at
-            if elapsed >= self.cooldown_seconds:
-                return self.HALF_OPEN
+        self._maybe_advance(time.monotonic())
         return self._state
 
     @property
@@ -99,10 +129,7 @@ class CircuitBreaker:
     @property
     def remaining_cooldown(self) -> float:
         """Seconds remaining in the open cooldown."""
-        if self._state != self.OPEN:
-            return 0.0
-        elapsed = time.monotonic() - self._opened_at
-        return max(0.0, self.cooldown_seconds - elapsed)
+        return self._remaining(time.monotonic())
 
     @property
     def total_trips(self) -> int:
@@ -136,18 +163,24 @@ class CircuitBreaker:
 
         Raises:
             CircuitOpenError: If the circuit is OPEN.
-            Exception: Any exception from func (after recording failure).
+            Exception: Any exception from func (after recording failure,
+                unless it is one of the excluded exception types).
         """
-        current_state = self.state
+        now = time.monotonic()
+        self._maybe_advance(now)
+        current_state = self._state
 
         if current_state == self.OPEN:
-            raise CircuitOpenError(self.name, self.remaining_cooldown)
+            raise CircuitOpenError(self.name, self._remaining(now))
 
         try:
             result = await func(*args, **kwargs)
             self._on_success(current_state)
             return result
 
+        except self.excluded_exceptions:
+            raise
+
         except Exception as e:
             self._on_failure(current_state, e)
             raise
@@ -159,7 +192,7 @@ class CircuitBreaker:
                 "Circuit '%s': HALF_OPEN → CLOSED (test succeeded)",
                 self.name,
             )
-        if self._failure_count > 0:
+        if self._failure_count > 0 and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Circuit '%s': failure count reset (was %d)",
                 self.name, self._failure_count,
@@ -197,7 +230,7 @@ class CircuitBreaker:
                 self.name, self._total_trips, self._failure_count,
                 self.cooldown_seconds, str(error)[:200],
             )
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Circuit '%s': failure %d/%d: %s",
                 self.name, self._failure_count, self.failure_threshold,
@@ -217,12 +250,14 @@ class CircuitBreaker:
         Returns:
             Dict with state, failure count, trips, cooldown remaining.
         """
+        now = time.monotonic()
+        self._maybe_advance(now)
         return {
             "name": self.name,
-            "state": self.state,
+            "state": self._state,
             "failure_count": self._failure_count,
             "total_trips": self._total_trips,
-            "remaining_cooldown": round(self.remaining_cooldown, 1),
+            "remaining_cooldown": round(self._remaining(now), 1),
         }
 
 
@@ -251,6 +286,8 @@ def retry_async(
         async def flaky_call():
             ...
     """
+    retry_on = tuple(exceptions)
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -258,7 +295,7 @@ def retry_async(
             for attempt in range(1, max_attempts + 1):
                 try:
                     return await func(*args, **kwargs)
-                except tuple(exceptions) as e:
+                except retry_on as e:
                     last_error = e
                     if attempt == max_attempts:
                         logger.warning(
@@ -266,7 +303,7 @@ def retry_async(
                             func.__name__, max_attempts, e,
                         )
                         raise
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                    delay = min(base_delay * (1 << (attempt - 1)), max_delay)
                     logger.debug(
                         "Retry %d/%d for %s in %.1fs: %s",
                         attempt, max_attempts, func.__name__, delay, e,
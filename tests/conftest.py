@@ -0,0 +1,19 @@
+"""Mostaql Notifier — pytest configuration.
+
+Puts the project root on sys.path so tests can import ``src`` the same
+way the scripts in scripts/ do.
+
+Run: python -m pytest tests
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("GROQ_API_KEY", "test")
@@ -0,0 +1,47 @@
+"""Mostaql Notifier — detail page skills parsing tests.
+
+Small HTML fixtures for the sidebar skills list, checked against the
+results of the original per-selector extraction.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.scraper.detail_scraper import DetailScraper
+
+
+def _page(sidebar: str) -> str:
+    return (
+        "<html><body>"
+        "<h1>مشروع تجريبي</h1>"
+        f'<div id="project-meta-panel">{sidebar}</div>'
+        '<div class="project-description">وصف</div>'
+        "</body></html>"
+    )
+
+
+def _skills_html(*items: str) -> str:
+    return "<ul>" + "".join(
+        f'<li class="skills__item">{item}</li>' for item in items
+    ) + "</ul>"
+
+
+@pytest.mark.parametrize(
+    ("items", "expected"),
+    [
+        (("<bdi>Python</bdi>", "<bdi>Django</bdi>"), ["Python", "Django"]),
+        # Several <bdi> in one item: each is its own skill
+        (("<bdi>Python</bdi><bdi>Flask</bdi>", "<bdi>SQL</bdi>"), ["Python", "Flask", "SQL"]),
+        # Items without <bdi> only count when no item has one
+        (("<bdi>Python</bdi>", "<a>ignored</a>"), ["Python"]),
+        (("<a>React</a>", "Vue"), ["React", "Vue"]),
+        (("<bdi> </bdi>", "<bdi>Go</bdi>"), ["Go"]),
+    ],
+)
+def test_skills_extraction(items: tuple[str, ...], expected: list[str]) -> None:
+    detail = DetailScraper().parse_detail_page(_page(_skills_html(*items)), "1")
+
+    assert detail is not None
+    assert detail.skills == expected
+
@@ -0,0 +1,112 @@
+"""Mostaql Notifier — message size budget tests.
+
+Checks that long alerts stay within Telegram's limit by shortening the
+summary and skipping optional blocks, never by cutting the message.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+import pytest
+
+from src.notifier.formatters import (
+    _MAX_MSG_UNITS,
+    _e,
+    _tg_len,
+    format_digest,
+    format_instant_alert,
+)
+
+_JOB = {
+    "title": "تطوير موقع إلكتروني",
+    "url": "https://mostaql.com/project/1",
+    "budget_min": 100,
+    "budget_max": 250,
+    "skills": ["Python", "Django"],
+    "proposals_count": 3,
+}
+_SCORING = {
+    "overall_score": 85,
+    "base_score": 70,
+    "bonuses_applied": [["skill", 10]],
+    "penalties_applied": [["competition", 5]],
+}
+
+
+def _analysis(summary: str, **extra) -> dict:
+    return {
+        "job_summary": summary,
+        "required_skills_analysis": "تحليل المهارات",
+        "recommended_proposal_angle": "ركز على الخبرة",
+        "green_flags": ["عميل موثق"],
+        "red_flags": ["ميزانية منخفضة"],
+        **extra,
+    }
+
+
+def _assert_well_formed(msg: str) -> None:
+    assert _tg_len(msg) <= _MAX_MSG_UNITS
+    assert msg.count("<b>") == msg.count("</b>")
+    assert msg.count("<a ") == msg.count("</a>")
+    # No dangling entity or tag at a cut point
+    assert not re.search(r"&[a-z]*$|<[^>]*$", msg)
+    assert not msg.endswith("\n...")
+
+
+@pytest.mark.parametrize("length", [3000, 6000, 20000])
+def test_long_summary_keeps_breakdown(length: int) -> None:
+    summary = ("وصف المشروع 😀 " * length)[:length]
+    msg = format_instant_alert(_JOB, _analysis(summary), _SCORING)
+
+    _assert_well_formed(msg)
+    assert msg.splitlines()[-1].startswith("📊 القاعدة: 70")
+    assert "…" in msg
+    assert "تحليل المهارات" in msg
+
+
+def test_summary_cut_never_splits_entities() -> None:
+    summary = "a & <b> " * 2000
+    msg = format_instant_alert(_JOB, _analysis(summary), _SCORING)
+
+    _assert_well_formed(msg)
+    lines = msg.splitlines()
+    summary_line = lines[lines.index("📝 <b>الملخص:</b>") + 1]
+    assert summary_line.endswith("…")
+    head = summary_line[:-1]
+    # Whole entities only: unescaping and escaping again round-trips
+    assert _e(html.unescape(head)) == head
+    assert summary.startswith(html.unescape(head))
+
+
+def test_optional_blocks_are_skipped_not_cut() -> None:
+    angle = "زاوية العرض " * 400
+    msg = format_instant_alert(
+        _JOB, _analysis("ملخص قصير", recommended_proposal_angle=angle), _SCORING,
+    )
+
+    _assert_well_formed(msg)
+    assert "ملخص قصير" in msg
+    assert "استراتيجية العرض" not in msg
+    assert msg.splitlines()[-1].startswith("📊 القاعدة")
+
+
+def test_short_alert_is_unchanged_by_budget() -> None:
+    msg = format_instant_alert(_JOB, _analysis("ملخص قصير"), _SCORING)
+
+    _assert_well_formed(msg)
+    for part in ("ملخص قصير", "تحليل المهارات", "عميل موثق", "ركز على الخبرة"):
+        assert part in msg
+    assert "…" not in msg
+
+
+def test_digest_measures_utf16_units() -> None:
+    jobs = [
+        dict(_JOB, title="😀" * 45, overall_score=80 - i) for i in range(15)
+    ]
+    msg = format_digest(jobs)
+
+    assert _tg_len(msg) <= _MAX_MSG_UNITS
+    assert msg.count("<a ") == msg.count("</a>")
+    assert msg.count("🎯 الدرجة") == 15 or msg.endswith("...")
@@ -0,0 +1,35 @@
+"""Mostaql Notifier — health monitor resource tests.
+
+Checks that close() releases the /proc/self/statm descriptor without
+relying on __del__, and that memory readings still work afterwards.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.utils.health import HealthMonitor
+
+
+def test_close_releases_statm_fd() -> None:
+    monitor = HealthMonitor()
+    fd = monitor._statm_fd
+    if fd is None:
+        pytest.skip("/proc/self/statm is not available")
+    os.fstat(fd)
+
+    monitor.close()
+    monitor.close()
+
+    assert monitor._statm_fd is None
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+def test_memory_reading_after_close() -> None:
+    monitor = HealthMonitor()
+    monitor.close()
+
+    assert monitor._read_memory_mb() >= 0.0
@@ -0,0 +1,81 @@
+"""Mostaql Notifier — listing page scheduling tests.
+
+Checks which listing pages scrape_listings requests, so an empty or
+failed page stops further requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Optional
+
+import pytest
+
+from src.config import ScraperConfig
+from src.scraper.list_scraper import ListScraper
+
+
+_CONFIG = ScraperConfig(
+    base_url="https://mostaql.com",
+    projects_url="https://mostaql.com/projects",
+    xhr_endpoint="https://mostaql.com/projects",
+    xhr_headers={"X-Requested-With": "XMLHttpRequest"},
+    scan_interval_seconds=180,
+    max_pages_per_scan=5,
+    request_delay_seconds=0,
+    detail_delay_seconds=0,
+    max_retries=1,
+    timeout_seconds=5,
+    user_agents=["test"],
+    categories=["development"],
+)
+
+
+def _page(page: int) -> dict[str, Any]:
+    return {"collection": [
+        {
+            "id": page * 100 + i,
+            "rendered": (
+                '<tr class="project-row"><td><h2>'
+                f'<a href="/projects/{page * 100 + i}-x">T{page}-{i}</a>'
+                "</h2></td></tr>"
+            ),
+        }
+        for i in range(3)
+    ]}
+
+
+class _FakeClient:
+    """Records requested pages and answers from a plan function."""
+
+    def __init__(self, plan: Callable[[int], Optional[dict[str, Any]]]) -> None:
+        self.plan = plan
+        self.calls: list[int] = []
+
+    async def get_listing_page(self, page: int = 1, **filters: Any):
+        self.calls.append(page)
+        await asyncio.sleep(0)
+        return self.plan(page)
+
+
+@pytest.mark.parametrize(
+    ("plan", "expected_calls", "expected_jobs"),
+    [
+        (_page, [1, 2, 3, 4, 5], 15),
+        (lambda p: {"collection": []}, [1], 0),
+        (lambda p: None, [1], 0),
+        (lambda p: None if p == 2 else _page(p), [1, 2, 3], 3),
+        (lambda p: {"collection": []} if p == 4 else _page(p), [1, 2, 3, 4, 5], 9),
+    ],
+    ids=["all-pages", "first-empty", "first-failed", "second-failed", "fourth-empty"],
+)
+def test_stops_scheduling_after_empty_or_failed_page(
+    plan, expected_calls: list[int], expected_jobs: int,
+) -> None:
+    scraper = ListScraper(_CONFIG)
+    client = _FakeClient(plan)
+
+    jobs = asyncio.run(scraper.scrape_listings(client, pages=5, concurrency=2))
+
+    assert client.calls == expected_calls
+    assert len(jobs) == expected_jobs
@@ -0,0 +1,125 @@
+"""Mostaql Notifier — BatchedFileHandler tests.
+
+Counts writes on the raw log file to check that records are batched,
+and that buffered records still reach the file during idle stretches.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+import pytest
+
+from src.utils.logger import BatchedFileHandler
+
+
+class _CountingFileIO(io.FileIO):
+    """FileIO that counts write() calls reaching the OS."""
+
+    writes = 0
+
+    def write(self, data):  # type: ignore[override]
+        _CountingFileIO.writes += 1
+        return super().write(data)
+
+
+class _CountingRotatingHandler(RotatingFileHandler):
+    """RotatingFileHandler whose stream counts its raw writes."""
+
+    def _open(self):  # type: ignore[override]
+        raw = _CountingFileIO(self.baseFilename, "a")
+        return io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+
+
+@pytest.fixture
+def make_logger(tmp_path: Path):
+    """Build an isolated logger writing through a BatchedFileHandler."""
+    handlers: list[tuple[BatchedFileHandler, RotatingFileHandler]] = []
+
+    def _make(max_bytes: int = 0, **kwargs) -> tuple[logging.Logger, BatchedFileHandler]:
+        target = _CountingRotatingHandler(
+            tmp_path / "test.log", maxBytes=max_bytes, backupCount=50,
+            encoding="utf-8",
+        )
+        target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        handler = BatchedFileHandler(target, **kwargs)
+        handlers.append((handler, target))
+        log = logging.getLogger(f"test_logger.{len(handlers)}.{tmp_path.name}")
+        log.propagate = False
+        log.setLevel(logging.DEBUG)
+        log.addHandler(handler)
+        _CountingFileIO.writes = 0
+        return log, handler
+
+    yield _make
+
+    for handler, target in handlers:
+        handler.close()
+        target.close()
+
+
+def _read_lines(tmp_path: Path) -> list[str]:
+    lines: list[str] = []
+    for path in sorted(tmp_path.glob("test.log*")):
+        lines.extend(path.read_text(encoding="utf-8").splitlines())
+    return lines
+
+
+def test_batches_writes(make_logger, tmp_path: Path) -> None:
+    log, handler = make_logger(capacity=256, flush_interval=60)
+    for i in range(1000):
+        log.debug("record %d", i)
+    handler.flush()
+
+    assert _CountingFileIO.writes <= 1000 // 256 + 1
+    assert _read_lines(tmp_path) == [f"DEBUG record {i}" for i in range(1000)]
+
+
+def test_warning_flushes_immediately(make_logger, tmp_path: Path) -> None:
+    log, handler = make_logger(capacity=256, flush_interval=60)
+    log.info("before")
+    assert _CountingFileIO.writes == 0
+
+    log.warning("boom")
+    assert _CountingFileIO.writes == 1
+    assert not handler.buffer
+    assert _read_lines(tmp_path) == ["INFO before", "WARNING boom"]
+
+
+def test_idle_buffer_is_flushed_by_timer(make_logger, tmp_path: Path) -> None:
+    log, handler = make_logger(capacity=256, flush_interval=0.05)
+    log.info("idle")
+
+    deadline = time.monotonic() + 2.0
+    while handler.buffer and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not handler.buffer
+    assert _CountingFileIO.writes == 1
+    assert _read_lines(tmp_path) == ["INFO idle"]
+
+
+def test_close_writes_tail_and_stops_timer(make_logger, tmp_path: Path) -> None:
+    log, handler = make_logger(capacity=256, flush_interval=60)
+    log.info("tail")
+    handler.close()
+
+    assert _read_lines(tmp_path) == ["INFO tail"]
+    handler._flusher.join(timeout=1.0)
+    assert not handler._flusher.is_alive()
+
+
+def test_rollover_keeps_every_record(make_logger, tmp_path: Path) -> None:
+    log, handler = make_logger(max_bytes=2000, capacity=16, flush_interval=60)
+    for i in range(500):
+        log.debug("record %d", i)
+    handler.flush()
+
+    assert len(list(tmp_path.glob("test.log.*"))) > 1
+    assert sorted(_read_lines(tmp_path)) == sorted(
+        f"DEBUG record {i}" for i in range(500)
+    )
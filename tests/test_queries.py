@@ -0,0 +1,53 @@
+"""Mostaql Notifier — batched job insert tests.
+
+Checks that a failed insert_jobs batch is rolled back, so no partial
+rows are left in the open transaction for the next commit to save.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.database import queries
+from src.database.db import Database
+from src.database.models import JobListing
+
+
+def _job(mostaql_id: str) -> JobListing:
+    return JobListing(
+        mostaql_id=mostaql_id, title=f"T{mostaql_id}", url="u", brief_description="",
+    )
+
+
+def test_insert_jobs_saves_batch(tmp_path: Path) -> None:
+    async def scenario() -> set[str]:
+        async with Database(str(tmp_path / "jobs.db")) as db:
+            await queries.insert_jobs(db, [_job("1"), _job("2")])
+            await queries.insert_jobs(db, [_job("2"), _job("3")])
+            return await queries.jobs_existing(db, ["1", "2", "3", "4"])
+
+    assert asyncio.run(scenario()) == {"1", "2", "3"}
+
+
+def test_failed_insert_jobs_leaves_nothing_behind(tmp_path: Path) -> None:
+    bad = _job("2")
+    bad.proposals_count = object()  # not bindable: fails after row 1
+
+    async def scenario() -> tuple[bool, set[str]]:
+        async with Database(str(tmp_path / "jobs.db")) as db:
+            with pytest.raises(sqlite3.ProgrammingError):
+                await queries.insert_jobs(db, [_job("1"), bad])
+            conn = await db.get_connection()
+            pending = conn.in_transaction
+            # A later unrelated commit must not save the first row
+            await queries.insert_job(db, _job("9"))
+            return pending, await queries.jobs_existing(db, ["1", "2", "9"])
+
+    pending, existing = asyncio.run(scenario())
+
+    assert not pending
+    assert existing == {"9"}
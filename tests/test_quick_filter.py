@@ -0,0 +1,197 @@
+"""Mostaql Notifier — QuickFilter tests.
+
+Checks the merged reject/accept patterns and the batch scan against a
+copy of the original per-term matcher: overlapping terms, hits at
+title/description and job boundaries, and exempted irrelevant signals.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.config import FreelancerProfile
+from src.database.models import JobListing
+from src.scraper.quick_filter import (
+    _IRRELEVANT_SIGNALS,
+    QuickFilter,
+    _normalize,
+    _strip_arabic_article,
+)
+
+
+def _profile(
+    skills: dict[str, list[str]],
+    negative: list[str],
+    positive: list[str],
+) -> FreelancerProfile:
+    return FreelancerProfile(
+        name="Test",
+        skills=skills,
+        experience_years=3,
+        preferences={"negative_keywords": negative, "positive_keywords": positive},
+        bio="",
+        proposal_style="",
+    )
+
+
+# Exempts the design, marketing and seo signals
+PROFILE = _profile(
+    skills={
+        "expert": ["Python", "design"],
+        "intermediate": ["React", "marketing"],
+        "beginner": ["seo"],
+    },
+    negative=["واجب", "الواجبات", "homework", "rest api design"],
+    positive=["بوت", "البرمجة", "scraper"],
+)
+BARE_PROFILE = _profile(skills={}, negative=[], positive=[])
+
+
+def _job(title: str, desc: str = "", job_id: str = "1") -> JobListing:
+    return JobListing(
+        mostaql_id=job_id, title=title, url="u", brief_description=desc,
+    )
+
+
+# ── Reference: the original per-term scan ───────────────
+
+
+def _text_contains(haystack: str, needle: str) -> bool:
+    if needle in haystack:
+        return True
+    stripped_needle = _strip_arabic_article(needle)
+    if stripped_needle != needle and stripped_needle in haystack:
+        return True
+    for word in haystack.split():
+        stripped_word = _strip_arabic_article(word)
+        if stripped_word == stripped_needle or stripped_word == needle:
+            return True
+    return False
+
+
+def _reference_is_relevant(profile: FreelancerProfile, job: JobListing) -> bool:
+    """Original decision; skill and keyword matches only change the reason."""
+    negative = [
+        _normalize(k) for k in profile.preferences.get("negative_keywords", [])
+    ]
+    user_skills = {
+        _normalize(skill)
+        for level in ("expert", "intermediate", "beginner")
+        for skill in profile.skills.get(level, [])
+    }
+    combined = f"{_normalize(job.title)} {_normalize(job.brief_description)}"
+
+    if any(_text_contains(combined, kw) for kw in negative):
+        return False
+    for signal, _, exception in _IRRELEVANT_SIGNALS:
+        if _text_contains(combined, _normalize(signal)):
+            if exception and _normalize(exception) in user_skills:
+                continue
+            return False
+    return True
+
+
+# ── Hand-picked cases ────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("profile", "title", "desc", "expected"),
+    [
+        # Overlapping terms
+        (PROFILE, "rest api design", "", (False, "Negative keyword: rest api design")),
+        (PROFILE, "مطور react.js", "", (True, "Skill match: react")),
+        (PROFILE, "حل الواجبات", "", (False, "Negative keyword: واجب")),
+        (BARE_PROFILE, "تسويق إلكتروني", "", (False, "Irrelevant category: marketing")),
+        (PROFILE, "تسويق إلكتروني", "", (True, "Passed filters")),
+        # Article stripping
+        (PROFILE, "تطوير البوت", "", (True, "Keyword match: بوت")),
+        (PROFILE, "دروس برمجة", "", (True, "Keyword match: البرمجة")),
+        # Term at the start, at the end, and across title/description
+        (BARE_PROFILE, "ترجمة", "", (False, "Irrelevant category: translation")),
+        (BARE_PROFILE, "", "مطلوب ترجمة", (False, "Irrelevant category: translation")),
+        (BARE_PROFILE, "كتابة", "مقالات", (False, "Irrelevant category: article writing")),
+        (BARE_PROFILE, "", "", (True, "Passed filters")),
+        # Exempted irrelevant signals
+        (PROFILE, "تحسين SEO", "", (True, "Passed filters")),
+        (BARE_PROFILE, "تحسين SEO", "", (False, "Irrelevant category: SEO")),
+        (PROFILE, "تصميم شعار", "بايثون", (True, "Skill match: بايثون")),
+        (BARE_PROFILE, "تصميم شعار", "بايثون", (False, "Irrelevant category: logo design")),
+        (PROFILE, "إدخال بيانات", "", (False, "Irrelevant category: data entry")),
+    ],
+)
+def test_is_relevant_cases(
+    profile: FreelancerProfile, title: str, desc: str, expected: tuple[bool, str],
+) -> None:
+    job = _job(title, desc)
+    qf = QuickFilter(profile)
+
+    assert qf.is_relevant(job) == expected
+    assert expected[0] == _reference_is_relevant(profile, job)
+
+
+def test_batch_hits_do_not_cross_job_boundaries() -> None:
+    qf = QuickFilter(BARE_PROFILE)
+    jobs = [
+        _job("ترجمة", "", "first"),
+        _job("مشروع", "نص ينتهي بكلمة كتابة", "split-1"),
+        _job("مقالات جديدة", "", "split-2"),
+        _job("موقع", "تصميم", "split-3"),
+        _job("شعار", "", "split-4"),
+        _job("تطبيق", "مطلوب مونتاج", "last"),
+    ]
+
+    relevant, filtered = qf.filter_batch(jobs)
+
+    assert [j.mostaql_id for j in filtered] == ["first", "last"]
+    assert [j.mostaql_id for j in relevant] == ["split-1", "split-2", "split-3", "split-4"]
+
+
+def test_batch_matches_single_job_results() -> None:
+    qf = QuickFilter(PROFILE)
+    jobs = [
+        _job("حل واجب", "بايثون", "a"),
+        _job("بايثون", "تسويق", "b"),
+        _job("ترجمة", "react", "c"),
+        _job("", "", "d"),
+    ]
+
+    relevant, filtered = qf.filter_batch(jobs)
+
+    expected = {j.mostaql_id: qf.is_relevant(j)[0] for j in jobs}
+    assert {j.mostaql_id for j in relevant} == {k for k, v in expected.items() if v}
+    assert {j.mostaql_id for j in filtered} == {k for k, v in expected.items() if not v}
+
+
+# ── Randomized comparison with the reference ─────────────
+
+_WORDS = [
+    word for signal, _, _ in _IRRELEVANT_SIGNALS for word in signal.split()
+] + [
+    "python", "بايثون", "الواجبات", "واجب", "rest", "api", "design", "بوت",
+    "البوت", "البرمجة", "برمجة", "react.js", "js", "تطوير", "موقع", "ال",
+    "SEO", "Scraper", "تسويق", "إلكتروني", "الترجمة", "ترجمة", "الرسم", "\n",
+]
+
+
+@pytest.mark.parametrize("profile", [PROFILE, BARE_PROFILE], ids=["profile", "bare"])
+def test_decisions_match_reference(profile: FreelancerProfile) -> None:
+    rng = random.Random(5)
+    jobs = [
+        _job(
+            " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 5))),
+            " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 12))),
+            str(i),
+        )
+        for i in range(3000)
+    ]
+    qf = QuickFilter(profile)
+
+    expected = [_reference_is_relevant(profile, job) for job in jobs]
+    assert [qf.is_relevant(job)[0] for job in jobs] == expected
+
+    relevant, _ = qf.filter_batch(jobs)
+    assert [j.mostaql_id for j in relevant] == [
+        job.mostaql_id for job, keep in zip(jobs, expected) if keep
+    ]
@@ -0,0 +1,239 @@
+"""Mostaql Notifier — rate limiter tests.
+
+Runs AsyncTokenBucket, AsyncRateLimiter and the Telegram per-chat
+throttle on an event loop with a fake clock: the loop's time and the
+modules' time.monotonic() read the same counter, and the selector
+advances it instead of blocking, so sleeps finish instantly but in
+the right order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import selectors
+import types
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+from src.config import TelegramConfig
+from src.notifier import telegram_bot
+from src.utils import rate_limiter
+from src.utils.rate_limiter import AsyncRateLimiter, AsyncTokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the loop has nothing to run.
+
+    Starts well past zero, like a real monotonic clock does.
+    """
+
+    START = 1000.0
+
+    def __init__(self) -> None:
+        self.now = self.START
+
+    def monotonic(self) -> float:
+        return self.now
+
+    @property
+    def elapsed(self) -> float:
+        return round(self.now - self.START, 6)
+
+
+class _FastForwardSelector(selectors.SelectSelector):
+    """Selector that advances the fake clock instead of waiting."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout: float | None = None):  # type: ignore[override]
+        if timeout is None:
+            raise RuntimeError("event loop would block forever")
+        if timeout > 0:
+            self._clock.now += timeout
+        return super().select(0)
+
+
+class _FakeTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop whose time() is the fake clock."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        super().__init__(_FastForwardSelector(clock))
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Fake clock patched into the modules under test."""
+    fake = FakeClock()
+    fake_time = types.SimpleNamespace(monotonic=fake.monotonic)
+    monkeypatch.setattr(rate_limiter, "time", fake_time)
+    monkeypatch.setattr(telegram_bot, "time", fake_time)
+    return fake
+
+
+@pytest.fixture
+def run(clock: FakeClock) -> Callable[[Callable[[], Awaitable[Any]]], Any]:
+    """Run a coroutine factory on a fake-time loop."""
+
+    def _run(factory: Callable[[], Awaitable[Any]]) -> Any:
+        loop = _FakeTimeLoop(clock)
+        try:
+            return loop.run_until_complete(factory())
+        finally:
+            loop.close()
+
+    return _run
+
+
+async def _acquire_all(acquire: Callable[[], Awaitable[None]], count: int,
+                       clock: FakeClock) -> list[tuple[int, float]]:
+    """Start count acquirers in order; return (index, time) as they finish."""
+    done: list[tuple[int, float]] = []
+
+    async def one(i: int) -> None:
+        await acquire()
+        done.append((i, clock.elapsed))
+
+    await asyncio.gather(*(one(i) for i in range(count)))
+    return done
+
+
+# ── AsyncTokenBucket ─────────────────────────────────────
+
+
+def test_bucket_burst_then_steady_rate(run, clock: FakeClock) -> None:
+    bucket = AsyncTokenBucket(rate=2.0, capacity=3)
+
+    done = run(lambda: _acquire_all(bucket.acquire, 7, clock))
+
+    assert [t for _, t in done] == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5, 2.0]
+
+
+def test_bucket_serves_waiters_in_fifo_order(run, clock: FakeClock) -> None:
+    bucket = AsyncTokenBucket(rate=1.0, capacity=1)
+
+    done = run(lambda: _acquire_all(bucket.acquire, 6, clock))
+
+    assert [i for i, _ in done] == list(range(6))
+    assert [t for _, t in done] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_bucket_refills_continuously_up_to_capacity(run, clock: FakeClock) -> None:
+    bucket = AsyncTokenBucket(rate=2.0, capacity=4)
+
+    async def scenario() -> tuple[float, float]:
+        for _ in range(4):
+            await bucket.acquire()
+        await asyncio.sleep(1.25)
+        partial = bucket.available_tokens
+        await asyncio.sleep(60)
+        return partial, bucket.available_tokens
+
+    partial, full = run(scenario)
+
+    assert partial == pytest.approx(2.5)
+    assert full == 4
+
+
+def test_bucket_cancelled_waiter_keeps_no_token(run, clock: FakeClock) -> None:
+    bucket = AsyncTokenBucket(rate=1.0, capacity=1)
+
+    async def scenario() -> float:
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.5)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert waiter.cancelled()
+        assert not bucket._lock.locked()
+
+        await bucket.acquire()
+        return clock.elapsed
+
+    # The cancelled waiter took nothing: the next caller gets the token
+    # due at t=1.0
+    assert run(scenario) == pytest.approx(1.0)
+
+
+# ── AsyncRateLimiter ─────────────────────────────────────
+
+
+def test_limiter_window_and_fifo_order(run, clock: FakeClock) -> None:
+    limiter = AsyncRateLimiter(max_calls=3, period_seconds=1.0)
+
+    done = run(lambda: _acquire_all(limiter.acquire, 8, clock))
+
+    assert [i for i, _ in done] == list(range(8))
+    assert [t for _, t in done] == [0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 2.0, 2.0]
+
+
+def test_limiter_cancelled_sleeper_releases_lock(run, clock: FakeClock) -> None:
+    limiter = AsyncRateLimiter(max_calls=1, period_seconds=1.0)
+
+    async def scenario() -> float:
+        await limiter.acquire()
+        sleeper = asyncio.create_task(limiter.acquire())
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.25)
+        sleeper.cancel()
+        await asyncio.gather(sleeper, return_exceptions=True)
+
+        await queued
+        return clock.elapsed
+
+    # The queued caller takes over the lock and the slot due at t=1.0
+    assert run(scenario) == pytest.approx(1.0)
+
+
+def test_limiter_available_slots(run, clock: FakeClock) -> None:
+    limiter = AsyncRateLimiter(max_calls=2, period_seconds=1.0)
+
+    async def scenario() -> list[int]:
+        seen = [limiter.available_slots]
+        await limiter.acquire()
+        seen.append(limiter.available_slots)
+        await asyncio.sleep(1.0)
+        seen.append(limiter.available_slots)
+        return seen
+
+    assert run(scenario) == [2, 1, 2]
+
+
+# ── Telegram per-chat spacing ────────────────────────────
+
+
+def test_telegram_throttle_spaces_each_chat(run, clock: FakeClock) -> None:
+    notifier = telegram_bot.TelegramNotifier(TelegramConfig(
+        bot_token="123:TEST",
+        chat_id="1",
+        instant_alert_threshold=70,
+        digest_threshold=50,
+        digest_interval_minutes=60,
+        daily_report_hour=21,
+        daily_report_minute=0,
+    ))
+    sends: list[tuple[str, float]] = []
+
+    async def send(chat: str) -> None:
+        await notifier._throttle(chat)
+        sends.append((chat, clock.elapsed))
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            *(send("a") for _ in range(3)),
+            *(send("b") for _ in range(2)),
+        )
+
+    run(scenario)
+
+    times = {chat: [t for c, t in sends if c == chat] for chat in ("a", "b")}
+    interval = telegram_bot._CHAT_MIN_INTERVAL
+    # One chat is spaced out; different chats don't wait on each other
+    assert times["a"] == pytest.approx([0.0, interval, 2 * interval])
+    assert times["b"] == pytest.approx([0.0, interval])
@@ -0,0 +1,145 @@
+"""Mostaql Notifier — Telegram client tests.
+
+Checks that aclose() really closes the pooled HTTP client, whether or
+not initialize() reached Telegram, and that a failed send is logged
+with the path that failed. Bot API calls are answered locally, so
+nothing goes over the network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import pytest
+from telegram import Bot
+from telegram.error import BadRequest, NetworkError, TimedOut
+from telegram.request import HTTPXRequest
+
+from src.config import TelegramConfig
+from src.notifier import telegram_bot
+from src.notifier.telegram_bot import TelegramNotifier
+
+_CONFIG = TelegramConfig(
+    bot_token="123:TEST",
+    chat_id="1",
+    instant_alert_threshold=70,
+    digest_threshold=50,
+    digest_interval_minutes=60,
+    daily_report_hour=21,
+    daily_report_minute=0,
+)
+
+
+@pytest.fixture
+def get_me_ok(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Answer every Bot API call with a getMe result."""
+    body = json.dumps({"ok": True, "result": {
+        "id": 123, "is_bot": True, "first_name": "Test", "username": "test_bot",
+    }}).encode()
+
+    async def do_request(self, *args, **kwargs) -> tuple[int, bytes]:
+        return 200, body
+
+    monkeypatch.setattr(HTTPXRequest, "do_request", do_request)
+
+
+def _pool_closed(notifier: TelegramNotifier) -> bool:
+    return notifier._bot.request._client.is_closed
+
+
+def test_aclose_after_initialize_closes_pool(get_me_ok) -> None:
+    notifier = TelegramNotifier(_CONFIG)
+
+    async def scenario() -> bool:
+        connected = await notifier.initialize()
+        await notifier.aclose()
+        return connected
+
+    assert asyncio.run(scenario()) is True
+    assert _pool_closed(notifier)
+
+
+def test_aclose_without_initialize_closes_pool() -> None:
+    notifier = TelegramNotifier(_CONFIG)
+
+    asyncio.run(notifier.aclose())
+
+    assert _pool_closed(notifier)
+
+
+def test_aclose_is_idempotent(get_me_ok) -> None:
+    notifier = TelegramNotifier(_CONFIG)
+
+    async def scenario() -> None:
+        await notifier.initialize()
+        await notifier.aclose()
+        await notifier.aclose()
+
+    asyncio.run(scenario())
+
+    assert _pool_closed(notifier)
+
+
+# ── Send failure logging ─────────────────────────────────
+
+
+@pytest.fixture
+def notifier(monkeypatch: pytest.MonkeyPatch) -> TelegramNotifier:
+    """Notifier with no throttling and no retry backoff."""
+    notifier = TelegramNotifier(_CONFIG)
+
+    async def no_throttle(chat_id: str) -> None:
+        return None
+
+    monkeypatch.setattr(notifier, "_throttle", no_throttle)
+    monkeypatch.setattr(telegram_bot.random, "uniform", lambda a, b: 0)
+    return notifier
+
+
+def _fake_send(monkeypatch: pytest.MonkeyPatch, *errors: Exception) -> list[str]:
+    """Make Bot.send_message raise errors in turn; return the texts sent."""
+    sent: list[str] = []
+    queue = list(errors)
+
+    async def send_message(self, chat_id, text, **kwargs):
+        sent.append(text)
+        raise queue.pop(0) if len(queue) > 1 else queue[0]
+
+    monkeypatch.setattr(Bot, "send_message", send_message)
+    return sent
+
+
+def test_retry_loop_failure_is_logged_with_attempts(
+    notifier: TelegramNotifier, monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sent = _fake_send(monkeypatch, TimedOut("slow"))
+
+    with caplog.at_level(logging.WARNING):
+        assert asyncio.run(notifier.send_message("<b>hi</b>")) is None
+
+    assert len(sent) == telegram_bot._SEND_ATTEMPTS
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert errors == [
+        f"Failed to send message after {telegram_bot._SEND_ATTEMPTS} attempts: slow",
+    ]
+
+
+def test_plain_fallback_failure_is_logged_as_fallback(
+    notifier: TelegramNotifier, monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sent = _fake_send(
+        monkeypatch,
+        BadRequest("Can't parse entities: unclosed tag"),
+        NetworkError("connection reset"),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        assert asyncio.run(notifier.send_message("<b>hi")) is None
+
+    assert sent == ["<b>hi", "hi"]
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert errors == ["Plain text fallback also failed: connection reset"]